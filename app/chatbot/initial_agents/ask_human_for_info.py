@@ -2,7 +2,7 @@ import os
 import json
 import asyncio
 from typing import Optional, Dict, Any
-from langchain_openai import ChatOpenAI
+from app.core.llm import ainvoke_with_timeout, get_chat_model
 from dotenv import load_dotenv
 from app.chatbot.tool_agents.tools import LawGoKRTavilySearch, async_ES_search_one
 from app.chatbot.tool_agents.utils.utils import (
@@ -12,6 +12,7 @@ from app.chatbot.tool_agents.utils.utils import (
 )
 # 글로벌 캐시 기능: 템플릿을 시스템 메시지로 저장하고 조회하는 함수들
 from app.chatbot.memory.global_cache import (
+    DEFAULT_SESSION_ID,
     store_template_in_memory,
     retrieve_template_from_memory,
 )
@@ -20,11 +21,13 @@ from app.chatbot.initial_agents.prompt_tone_selector import get_prompt_by_score
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# YES 2회 이상일 때 후속 질문 끝에 붙는 표시
+TEMPLATE_USED_NOTE = "[저장된 템플릿 사용됨]"
+
 
 def load_llm():
-    return ChatOpenAI(
-        model="gpt-3.5-turbo",
-        api_key=OPENAI_API_KEY,
+    return get_chat_model(
+        "gpt-3.5-turbo",
         temperature=0.3,
         max_tokens=1024,
         request_timeout=15,
@@ -102,7 +105,7 @@ class AskHumanAgent:
             max_score,
             report,
         )
-        response = await self.llm.ainvoke(prompt)
+        response = await ainvoke_with_timeout(self.llm, prompt)
         return response.content.strip()
 
     async def ask_human(
@@ -112,12 +115,13 @@ class AskHumanAgent:
         current_yes_count=0,
         template_data=None,
         initial_response: Optional[str] = None,
+        session_id: str = DEFAULT_SESSION_ID,
     ):
         # print("🔍 [ask_human] ES prefetch 시작")
         es_task = asyncio.create_task(async_ES_search_one([user_query]))
 
         # print("📦 [ask_human] 템플릿 로딩 중...")
-        cached_data = retrieve_template_from_memory()
+        cached_data = await retrieve_template_from_memory(session_id)
         accuracy = 0
         evaluating_now = False
 
@@ -125,7 +129,7 @@ class AskHumanAgent:
             if not cached_data.get("updated_by_es"):
                 # print("🧠 [ask_human] ES 기반 평가 수행 중...")
                 evaluating_now = True
-                await evalandsave_llm2_template_with_es(cached_data, user_query)
+                await evalandsave_llm2_template_with_es(cached_data, user_query, session_id)
                 cached_data["updated_by_es"] = True
 
             template_score = max(
@@ -135,7 +139,7 @@ class AskHumanAgent:
             )
             accuracy = calculate_llm2_accuracy_score(template_score, 0)
             cached_data["llm2_accuracy_score"] = accuracy
-            store_template_in_memory(cached_data)
+            await store_template_in_memory(cached_data, session_id)
         elif cached_data:
             accuracy = cached_data.get("llm2_accuracy_score", 0)
         else:
@@ -149,7 +153,7 @@ class AskHumanAgent:
         hits = es_result.get("hits", [])
 
         # ✅ 2. 템플릿 불러오기
-        cached_data = retrieve_template_from_memory()
+        cached_data = await retrieve_template_from_memory(session_id)
         accuracy = 0
         evaluating_now = False
 
@@ -157,7 +161,7 @@ class AskHumanAgent:
         if cached_data and cached_data.get("built_by_llm2"):
             if not cached_data.get("updated_by_es"):
                 evaluating_now = True
-                await evalandsave_llm2_template_with_es(cached_data, user_query)
+                await evalandsave_llm2_template_with_es(cached_data, user_query, session_id)
                 cached_data["updated_by_es"] = True
 
             # ✅ 평가 점수는 항상 다시 계산
@@ -168,7 +172,7 @@ class AskHumanAgent:
             )
             accuracy = calculate_llm2_accuracy_score(template_score, max_score)
             cached_data["llm2_accuracy_score"] = accuracy
-            store_template_in_memory(cached_data)
+            await store_template_in_memory(cached_data, session_id)
 
         # ✅ 템플릿이 없거나 아직 LLM2가 빌드되지 않은 경우
         elif cached_data:
@@ -231,7 +235,7 @@ class AskHumanAgent:
             user_query, llm1_answer or "", total_yes_count, template_data
         )
         if total_yes_count >= 2:
-            mcq_q = f"{mcq_q}\n\n[저장된 템플릿 사용됨]"
+            mcq_q = f"{mcq_q}\n\n{TEMPLATE_USED_NOTE}"
 
         # ✅ 8. 병합 응답
         combined = (
@@ -2,70 +2,154 @@
 import asyncio
 from typing import Dict, Optional
 from langchain_community.vectorstores import FAISS
-from app.chatbot.initial_agents.initial_chatbot import LegalChatbot
-from app.chatbot.initial_agents.ask_human_for_info import AskHumanAgent
+from app.chatbot.initial_agents.initial_chatbot import LegalChatbot, strip_decision_marker
+from app.chatbot.initial_agents.ask_human_for_info import AskHumanAgent, TEMPLATE_USED_NOTE
+from app.chatbot.tool_agents.utils.query_analysis import QueryAnalysis
+from app.chatbot.memory.global_cache import (
+    DEFAULT_SESSION_ID,
+    load_chat_history,
+    retrieve_template_from_memory,
+    save_chat_turn,
+)
+from app.chatbot.memory.semantic_cache import initial_answer_cache
+
+
+def _cached_ask_result(cached: Dict, current_yes_count: int) -> Dict:
+    """의미 캐시에 저장된 후속 질문 + 현재 세션 YES 카운트로 ask_human 결과 재구성"""
+    answer = cached.get("initial_response", "").lower()
+    if "###no" in answer:
+        return {
+            "yes_count": 0,
+            "mcq_question": cached.get("mcq_question"),
+            "is_mcq": False,
+            "load_template_signal": False,
+            "template": {},
+        }
+
+    yes_count = current_yes_count + (1 if "###yes" in answer else 0)
+    mcq_question = cached.get("mcq_question") or ""
+    if yes_count >= 2:
+        mcq_question = f"{mcq_question}\n\n{TEMPLATE_USED_NOTE}"
+    return {
+        "yes_count": yes_count,
+        "mcq_question": mcq_question,
+        "is_mcq": cached.get("is_mcq", True),
+        "load_template_signal": yes_count >= 2,
+        "template": cached.get("template", {}),
+    }
+
+
 async def run_initial_controller(
     user_query: str,
     faiss_db: FAISS,
     current_yes_count: int = 0,
     template_data: Optional[Dict[str, any]] = None,
     stop_event: Optional[asyncio.Event] = None,
+    analysis: Optional[QueryAnalysis] = None,
+    session_id: str = DEFAULT_SESSION_ID,
 ) -> Dict:
-    chatbot = LegalChatbot(faiss_db=faiss_db)
-    ask_human_agent = AskHumanAgent()
-
-    # ✅ 병렬 실행: LLM1 + 템플릿 선 생성
-    chatbot_task = asyncio.create_task(
-        chatbot.generate(
-            user_query=user_query,
-            current_yes_count=current_yes_count,
-            stop_event=stop_event,
-        )
+    # ✅ 의미 캐시: 응답이 세션의 LLM2 템플릿 / 대화 히스토리에 따라 달라지므로 둘 다 없을 때만 사용
+    #    (히스토리가 반영된 응답을 저장하면 다른 세션에 이전 대화 내용이 노출될 수 있음)
+    session_template = await retrieve_template_from_memory(session_id)
+    use_semantic_cache = not session_template.get("built_by_llm2") and not (
+        await load_chat_history(session_id)
     )
-    # ask_human_task = asyncio.create_task(
-    #     ask_human_agent.ask_human(
-    #         user_query=user_query,
-    #         llm1_answer=None,
-    #         current_yes_count=current_yes_count,
-    #         template_data=None,
-    #         initial_response=None,
-    #     )
-    # )
-
-    # ✅ LLM1 먼저 기다림
-    initial_result = await chatbot_task
-    initial_response = initial_result.get("initial_response", "")
-    is_no = initial_result.get("is_no", False)
-    query_type = initial_result.get("query_type", "legal")
-    updated_yes_count = initial_result.get("yes_count", current_yes_count)
-    escalate_directly = initial_result.get("escalate_to_advanced", False)
+    cached = None
+    if use_semantic_cache:
+        semantic_hit = await initial_answer_cache.lookup(user_query)
+        if semantic_hit:
+            cached, similarity = semantic_hit
+            print(f"♻️ LLM1 의미 캐시 적중 (similarity={similarity:.3f})")
 
-    if is_no and stop_event:
-        # print("🛑 [controller] is_no=True → stop_event.set() 실행됨")
-        stop_event.set()
+    if cached:
+        initial_response = cached.get("initial_response", "")
+        is_no = cached.get("is_no", False)
+        query_type = cached.get("query_type", "legal")
+        escalate_directly = False
+        await save_chat_turn(user_query, strip_decision_marker(initial_response), session_id)
+        if is_no and stop_event:
+            stop_event.set()
+        ask_result = _cached_ask_result(cached, current_yes_count)
+        updated_yes_count = ask_result["yes_count"]
+    else:
+        chatbot = LegalChatbot(faiss_db=faiss_db)
+        ask_human_agent = AskHumanAgent()
 
-    # ✅ ask_human 재호출 (LLM1 응답 기반 판단)
-    try:
-        ask_result = await asyncio.wait_for(
-            ask_human_agent.ask_human(
+        # ✅ 병렬 실행: LLM1 + 템플릿 선 생성
+        chatbot_task = asyncio.create_task(
+            chatbot.generate(
                 user_query=user_query,
-                llm1_answer=initial_response,
-                current_yes_count=updated_yes_count,
-                template_data=None,
-                initial_response=None,
-            ),
-            timeout=12.0,  # 혹시 오래 걸릴 경우 방지
+                current_yes_count=current_yes_count,
+                stop_event=stop_event,
+                analysis=analysis,
+                session_id=session_id,
+            )
         )
-        # print("✅ [controller] ask_human 반환 성공:", ask_result)
-    except asyncio.TimeoutError:
-        # print("⏱️ [controller] ask_human 타임아웃 발생")
-        ask_result = {
-            "yes_count": updated_yes_count,
-            "mcq_question": "⏳ 템플릿 응답이 지연되고 있습니다.",
-            "is_mcq": False,
-            "load_template_signal": False,
-            "template": {},
-        }
+        # ask_human_task = asyncio.create_task(
+        #     ask_human_agent.ask_human(
+        #         user_query=user_query,
+        #         llm1_answer=None,
+        #         current_yes_count=current_yes_count,
+        #         template_data=None,
+        #         initial_response=None,
+        #     )
+        # )
+
+        # ✅ LLM1 먼저 기다림
+        initial_result = await chatbot_task
+        initial_response = initial_result.get("initial_response", "")
+        is_no = initial_result.get("is_no", False)
+        query_type = initial_result.get("query_type", "legal")
+        updated_yes_count = initial_result.get("yes_count", current_yes_count)
+        escalate_directly = initial_result.get("escalate_to_advanced", False)
+
+        if is_no and stop_event:
+            # print("🛑 [controller] is_no=True → stop_event.set() 실행됨")
+            stop_event.set()
+
+        # ✅ ask_human 재호출 (LLM1 응답 기반 판단)
+        timed_out = False
+        try:
+            ask_result = await asyncio.wait_for(
+                ask_human_agent.ask_human(
+                    user_query=user_query,
+                    llm1_answer=initial_response,
+                    current_yes_count=updated_yes_count,
+                    template_data=None,
+                    initial_response=None,
+                    session_id=session_id,
+                ),
+                timeout=12.0,  # 혹시 오래 걸릴 경우 방지
+            )
+            # print("✅ [controller] ask_human 반환 성공:", ask_result)
+        except asyncio.TimeoutError:
+            # print("⏱️ [controller] ask_human 타임아웃 발생")
+            timed_out = True
+            ask_result = {
+                "yes_count": updated_yes_count,
+                "mcq_question": "⏳ 템플릿 응답이 지연되고 있습니다.",
+                "is_mcq": False,
+                "load_template_signal": False,
+                "template": {},
+            }
+
+        # ✅ 다음 유사 질문을 위해 저장 (YES 카운트에 따라 붙는 표시는 제외)
+        if use_semantic_cache and not timed_out:
+            mcq_question = ask_result.get("mcq_question") or ""
+            note = f"\n\n{TEMPLATE_USED_NOTE}"
+            if mcq_question.endswith(note):
+                mcq_question = mcq_question[: -len(note)]
+            await initial_answer_cache.store(
+                user_query,
+                {
+                    "initial_response": initial_response,
+                    "is_no": is_no,
+                    "query_type": query_type,
+                    "mcq_question": mcq_question,
+                    "is_mcq": ask_result.get("is_mcq"),
+                    "template": ask_result.get("template"),
+                },
+            )
 
     final_yes_count = ask_result.get("yes_count", updated_yes_count)
     escalate_to_advanced = escalate_directly or final_yes_count >= 3
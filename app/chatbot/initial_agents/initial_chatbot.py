@@ -2,37 +2,38 @@ import os
 import asyncio
 import sys
 from dotenv import load_dotenv
-from langchain.memory import ConversationBufferMemory
 from langchain_core.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
+from app.core.llm import ainvoke_with_timeout, get_chat_model
 from asyncio import Event
+from typing import Optional
 
-from app.chatbot.tool_agents.utils.utils import (
-    faiss_kiwi,
-    classify_legal_query,
+from app.chatbot.tool_agents.utils.query_analysis import (
+    QueryAnalysis,
+    get_query_analysis,
 )
 from app.chatbot.tool_agents.tools import async_ES_search_one
+from app.chatbot.memory.global_cache import (
+    DEFAULT_SESSION_ID,
+    load_chat_history,
+    save_chat_turn,
+)
 
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 
+def strip_decision_marker(text: str) -> str:
+    """LLM1 보고서에서 ###yes / ###no 판단 표시 제거 (히스토리 저장용)"""
+    return text.replace("###yes", "").replace("###no", "").strip()
+
+
 def load_llm():
-    return ChatOpenAI(
-        model="gpt-3.5-turbo",
-        api_key=OPENAI_API_KEY,
-        temperature=0.1,
-        max_tokens=1024,
-        streaming=False,
-    )
+    return get_chat_model("gpt-3.5-turbo", temperature=0.1, max_tokens=1024)
 
 
 class LegalChatbot:
     def __init__(self, faiss_db):
         self.llm = load_llm()
-        self.memory = ConversationBufferMemory(
-            memory_key="chat_history", return_messages=True
-        )
         self.faiss_db = faiss_db
         self.prompt_template = PromptTemplate(
             template="""
@@ -43,6 +44,9 @@ class LegalChatbot:
             📄 유사 상담 검색 결과 (Elasticsearch 기반/ ):
         {es_context}
 
+            📜 이전 대화 (참고용, 현재 질문과 무관하면 무시):
+        {chat_history}
+
         다음 정보를 바탕으로 판단하세요:
 
         ❓ 사용자 질문:
@@ -108,6 +112,7 @@ class LegalChatbot:
             input_variables=[
                 "user_query",
                 "es_context",
+                "chat_history",
             ],
         )
 
@@ -134,20 +139,22 @@ class LegalChatbot:
         user_query: str,
         current_yes_count: int = 0,
         stop_event: Event = None,
+        analysis: Optional[QueryAnalysis] = None,
+        session_id: str = DEFAULT_SESSION_ID,
     ):
         # print("🔍 [1] ES 사전 검색(prefetch) 시작")
         es_task = asyncio.create_task(self.build_es_context(user_query))
 
         # print("🧠 [2] 키워드 추출 및 쿼리 분석")
-        query_keywords = faiss_kiwi.extract_keywords(user_query, top_k=5)
-        faiss_keywords = faiss_kiwi.extract_top_keywords_faiss(
-            user_query, self.faiss_db, top_k=5
-        )
-        legal_score = sum(1 for kw in query_keywords if kw in faiss_keywords) / max(
-            len(query_keywords), 1
-        )
-        query_type = classify_legal_query(user_query, set(faiss_keywords))
-        chat_history = self.memory.load_memory_variables({}).get("chat_history", "")
+        # ✅ 턴 단위 분석 결과가 전달되면 재사용 (토큰화 / FAISS 검색 중복 제거)
+        if analysis is None:
+            analysis = get_query_analysis(user_query, self.faiss_db)
+        query_keywords = analysis.query_keywords
+        faiss_keywords = analysis.adjusted_keywords
+        legal_score = analysis.legal_score
+        query_type = analysis.query_type
+        # ✅ 세션 히스토리 (HISTORY_TOKEN_BUDGET 토큰 이내)
+        chat_history = await load_chat_history(session_id) or "없음"
 
         # print("⏳ [3] ES 검색 결과 대기")
         es_context = await es_task
@@ -165,18 +172,15 @@ class LegalChatbot:
         )
 
         # print("💬 [5] LLM 응답 생성 시작")
-        response = await self.llm.ainvoke(prompt)
+        response = await ainvoke_with_timeout(self.llm, prompt)
         full_response = response.content.strip()
 
         is_no_detected = "###no" in full_response.lower()
         if is_no_detected and stop_event:
             stop_event.set()
 
-        # print("💾 [6] 메모리 저장 및 결과 반환")
-        self.memory.save_context(
-            {"user_query": user_query}, {"response": full_response}
-        )
-
+        # print("💾 [6] 히스토리 저장 및 결과 반환")
+        await save_chat_turn(user_query, strip_decision_marker(full_response), session_id)
         return {
             "initial_response": full_response,
             "escalate_to_advanced": False,
@@ -3,43 +3,29 @@ import sys
 import asyncio
 from asyncio import Lock, Event, create_task
 from dotenv import load_dotenv
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import FAISS
 from app.chatbot.tool_agents.executor.normalanswer import run_final_answer_generation
 from app.chatbot.initial_agents.controller import run_initial_controller
 from app.chatbot.tool_agents.controller import run_full_consultation
-from app.chatbot.tool_agents.utils.utils import faiss_kiwi
+from app.chatbot.tool_agents.utils.query_analysis import get_query_analysis
+from app.chatbot.memory.global_cache import (
+    DEFAULT_SESSION_ID,
+    get_yes_count,
+    set_yes_count,
+)
 from fastapi import FastAPI
 from app.chatbot.routes import router as chatbot_router
+from app.core.vectorstore import load_faiss
 
 
 # ✅ 락: 중복 실행 방지 (LLM2 관련)
 llm2_lock = Lock()
-yes_count = 0
 sys.path.append(os.path.abspath("."))
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-DB_FAISS_PATH = "./app/chatbot_term/vectorstore"
 app = FastAPI()
 
-def load_faiss():
-    try:
-        embedding_model = OpenAIEmbeddings(
-            model="text-embedding-ada-002",
-            openai_api_key=OPENAI_API_KEY,
-        )
-        return FAISS.load_local(
-            DB_FAISS_PATH,
-            embedding_model,
-            allow_dangerous_deserialization=True,
-        )
-    except Exception as e:
-        # print(f"❌ FAISS 로드 실패: {e}")
-        return None
-
-
-async def run_dual_pipeline(user_query: str):
-    global yes_count
+async def run_dual_pipeline(user_query: str, session_id: str = DEFAULT_SESSION_ID):
+    yes_count = await get_yes_count(session_id)
     # print(f"\n🔍 사용자 질문 수신: {user_query}")
 
     faiss_db = load_faiss()
@@ -47,6 +33,8 @@ async def run_dual_pipeline(user_query: str):
     if not faiss_db:
         return {"error": "FAISS 로드 실패"}
     stop_event = Event()
+    # ✅ 키워드 분석은 턴 당 한 번만 수행하여 LLM1 / LLM2 가 공유
+    analysis = get_query_analysis(user_query, faiss_db)
 
     # 1. 초기 응답(LLM1)와 LLM2 빌드 동시 시작
     initial_task = create_task(
@@ -56,6 +44,8 @@ async def run_dual_pipeline(user_query: str):
             current_yes_count=yes_count,
             template_data=template_data,
             stop_event=stop_event,
+            analysis=analysis,
+            session_id=session_id,
         )
     )
     # LLM2 빌드는 LLM1의 스타트와 동시에 실행 (build_only=True)
@@ -64,10 +54,12 @@ async def run_dual_pipeline(user_query: str):
         build_task = create_task(
             run_full_consultation(
                 user_query,
-                faiss_kiwi.extract_top_keywords_faiss(user_query, faiss_db),
+                analysis.adjusted_keywords,
                 model="gpt-4",
                 build_only=True,  # 초기 빌드는 build_only 모드로 시작
                 stop_event=stop_event,
+                analysis=analysis,
+                session_id=session_id,
             )
         )
     else:
@@ -88,6 +80,7 @@ async def run_dual_pipeline(user_query: str):
 
     # 업데이트된 YES 카운트
     yes_count = initial_result.get("yes_count", yes_count)
+    await set_yes_count(yes_count, session_id)
 
     # 3. 초기 응답에 "###yes" 신호가 있으면(LLM1 신호) 이미 시작된 LLM2 빌드 결과를 기다림
     if "###yes" in initial_result.get("initial_response", "").lower():
@@ -97,10 +90,12 @@ async def run_dual_pipeline(user_query: str):
             build_task = create_task(
                 run_full_consultation(
                     user_query,
-                    faiss_kiwi.extract_top_keywords_faiss(user_query, faiss_db),
+                    analysis.adjusted_keywords,
                     model="gpt-4",
                     build_only=False,  # full build 모드
                     stop_event=stop_event,
+                    analysis=analysis,
+                    session_id=session_id,
                 )
             )
         # 그렇지 않으면 이미 진행 중인 build_task의 결과를 그대로 기다립니다.
@@ -123,10 +118,10 @@ async def run_dual_pipeline(user_query: str):
     advanced_result = None
     if yes_count >= 3:
         async with llm2_lock:
-            final_answer = run_final_answer_generation(
-                template, strategy, precedent, user_query, "gpt-4"
+            final_answer = await run_final_answer_generation(
+                template, strategy, precedent, user_query, "gpt-4", session_id
             )
-            yes_count = 1  # YES 카운트 초기화
+            await set_yes_count(1, session_id)  # YES 카운트 초기화
             advanced_result = {
                 "template": template,
                 "strategy": strategy,
@@ -1,62 +1,44 @@
 # ✅ app/chatbot/memory/global_cache.py
 
-from typing import Dict
-from langchain.memory import ConversationBufferMemory
-from langchain.schema import SystemMessage
-import json
-import datetime
+from app.chatbot.memory.session_store import (
+    DEFAULT_SESSION_ID,
+    get_session_store,
+)
+from app.chatbot.memory.history import build_history_context, record_turn
 
-# ✅ 싱글톤 메모리 인스턴스
-_memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True)
 
+# ✅ 템플릿 저장
+async def store_template_in_memory(template: dict, session_id: str = DEFAULT_SESSION_ID) -> None:
+    if not isinstance(template, dict) or "template" not in template:
+        raise ValueError("❌ 유효하지 않은 템플릿 구조입니다.")
 
-def get_memory():
-    return _memory
+    await get_session_store().set_template(session_id, template)
 
 
-# ✅ 날짜 처리 가능한 JSON 인코더
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, (datetime.date, datetime.datetime)):
-            return obj.isoformat()
-        return super().default(obj)
+# ✅ 템플릿 조회
+async def retrieve_template_from_memory(session_id: str = DEFAULT_SESSION_ID) -> dict:
+    return await get_session_store().get_template(session_id) or {}
 
 
-# ✅ 템플릿 저장
-def store_template_in_memory(template: dict) -> None:
-    memory = get_memory()
-    if not isinstance(template, dict) or "template" not in template:
-        raise ValueError("❌ 유효하지 않은 템플릿 구조입니다.")
+# ✅ 템플릿 초기화
+async def clear_template_from_memory(session_id: str = DEFAULT_SESSION_ID) -> None:
+    await get_session_store().clear_template(session_id)
 
-    memory.chat_memory.messages = [
-        m
-        for m in memory.chat_memory.messages
-        if not m.content.startswith("TEMPLATE_DATA:")
-    ]
 
-    template_json = json.dumps(template, cls=CustomJSONEncoder, ensure_ascii=False)
-    message_content = f"TEMPLATE_DATA:{template_json}"
-    memory.chat_memory.add_message(SystemMessage(content=message_content))
+# ✅ 대화 히스토리 저장 (토큰 예산 초과분은 설정 시 rolling summary 로 압축)
+async def save_chat_turn(user_query: str, response: str, session_id: str = DEFAULT_SESSION_ID) -> None:
+    await record_turn(user_query, response, session_id)
 
 
-# ✅ 템플릿 조회
-def retrieve_template_from_memory() -> dict:
-    memory = get_memory()
-    for message in memory.chat_memory.messages:
-        if message.content.startswith("TEMPLATE_DATA:"):
-            template_json = message.content[len("TEMPLATE_DATA:") :]
-            try:
-                return json.loads(template_json)
-            except json.JSONDecodeError:
-                return {}
-    return {}
+# ✅ 프롬프트용 대화 히스토리 (HISTORY_TOKEN_BUDGET 토큰 이내)
+async def load_chat_history(session_id: str = DEFAULT_SESSION_ID) -> str:
+    return await build_history_context(session_id)
 
 
-# ✅ 템플릿 초기화
-def clear_template_from_memory() -> None:
-    memory = get_memory()
-    memory.chat_memory.messages = [
-        m
-        for m in memory.chat_memory.messages
-        if not m.content.startswith("TEMPLATE_DATA:")
-    ]
+# ✅ YES 카운트 (세션별)
+async def get_yes_count(session_id: str = DEFAULT_SESSION_ID) -> int:
+    return await get_session_store().get_yes_count(session_id)
+
+
+async def set_yes_count(count: int, session_id: str = DEFAULT_SESSION_ID) -> None:
+    await get_session_store().set_yes_count(session_id, count)
@@ -0,0 +1,178 @@
+# ✅ app/chatbot/memory/history.py
+
+import os
+import asyncio
+from functools import lru_cache
+from typing import List, Optional, Set
+from app.core.llm import ainvoke_with_timeout, get_chat_model
+from app.chatbot.memory.session_store import DEFAULT_SESSION_ID, get_session_store
+
+# ✅ 프롬프트에 넣는 대화 히스토리 토큰 예산
+HISTORY_TOKEN_BUDGET = int(os.getenv("HISTORY_TOKEN_BUDGET", "1000"))
+HISTORY_TURN_MAX_TOKENS = int(os.getenv("HISTORY_TURN_MAX_TOKENS", "300"))  # 한 턴의 최대 토큰
+HISTORY_TOKENIZER_MODEL = os.getenv("HISTORY_TOKENIZER_MODEL", "gpt-4")
+# 예산을 벗어난 오래된 턴을 요약으로 누적할지 여부 (요약 1회 = GPT 호출 1회)
+HISTORY_SUMMARY_ENABLED = os.getenv("HISTORY_SUMMARY_ENABLED", "false").lower() == "true"
+HISTORY_SUMMARY_MODEL = os.getenv("HISTORY_SUMMARY_MODEL", "gpt-3.5-turbo")
+HISTORY_SUMMARY_MAX_TOKENS = int(os.getenv("HISTORY_SUMMARY_MAX_TOKENS", "300"))
+
+# 요약 중인 세션 (같은 세션의 요약이 겹치지 않도록) / 백그라운드 요약 태스크 참조
+_summarizing: Set[str] = set()
+_summary_tasks: Set[asyncio.Task] = set()
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """로컬 tiktoken 인코딩 (로드 실패 시 None → 글자 수 기반 추정)"""
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(HISTORY_TOKENIZER_MODEL)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"⚠️ tiktoken 로드 실패, 글자 수 기반으로 토큰 추정: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is None:
+        # 한국어는 대략 1~2글자당 1토큰
+        return len(text) // 2 + 1
+    return len(encoding.encode(text))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    if count_tokens(text) <= max_tokens:
+        return text
+    encoding = _encoding()
+    if encoding is None:
+        return text[: max_tokens * 2] + "…"
+    return encoding.decode(encoding.encode(text)[:max_tokens]) + "…"
+
+
+def _format_turn(turn: dict) -> str:
+    return truncate_tokens(
+        f"사용자: {turn['user']}\nAI: {turn['assistant']}", HISTORY_TURN_MAX_TOKENS
+    )
+
+
+def _fit_window(turns: List[dict], budget: int) -> List[str]:
+    """최신 턴부터 예산 안에 들어가는 만큼만 선택 (시간순으로 반환)"""
+    window: List[str] = []
+    used = 0
+    for turn in reversed(turns):
+        text = _format_turn(turn)
+        tokens = count_tokens(text)
+        if used + tokens > budget:
+            break
+        window.append(text)
+        used += tokens
+    window.reverse()
+    return window
+
+
+async def build_history_context(
+    session_id: str = DEFAULT_SESSION_ID, budget: int = HISTORY_TOKEN_BUDGET
+) -> str:
+    """
+    프롬프트용 대화 히스토리: [이전 대화 요약] + 최근 턴 (sliding window).
+    전체가 budget 토큰을 넘지 않으므로 대화가 길어져도 프롬프트 크기가 일정하다.
+    """
+    store = get_session_store()
+    summary = await store.get_summary(session_id)
+    if summary:
+        summary = truncate_tokens(summary, HISTORY_SUMMARY_MAX_TOKENS)
+        budget -= count_tokens(summary)
+
+    turns = await store.get_history(session_id)
+    window = _fit_window(turns, max(budget, 0))
+    parts = [f"[이전 대화 요약]\n{summary}"] if summary else []
+    parts.extend(window)
+    return "\n".join(parts)
+
+
+async def record_turn(
+    user_query: str, response: str, session_id: str = DEFAULT_SESSION_ID
+) -> None:
+    """대화 턴 저장 + (설정 시) 예산을 벗어난 오래된 턴을 백그라운드에서 요약"""
+    await get_session_store().append_history(session_id, user_query, response)
+
+    if not HISTORY_SUMMARY_ENABLED or session_id in _summarizing:
+        return
+    task = asyncio.create_task(summarize_overflow(session_id))
+    _summary_tasks.add(task)
+    task.add_done_callback(_summary_tasks.discard)
+
+
+def _remaining_summarized(snapshot: List[dict], current: List[dict], overflow: int) -> int:
+    """
+    snapshot[:overflow] 를 요약한 뒤, current 앞쪽에 아직 남아 있는 요약 대상 턴 수.
+    히스토리는 뒤에만 추가되고 앞에서만 밀려나므로 current 는 snapshot[evicted:] + 새 턴.
+    """
+    for evicted in range(len(snapshot) + 1):
+        kept = snapshot[evicted:]
+        if current[: len(kept)] == kept:
+            return max(overflow - evicted, 0)
+    return 0
+
+
+async def summarize_overflow(
+    session_id: str = DEFAULT_SESSION_ID, budget: int = HISTORY_TOKEN_BUDGET
+) -> Optional[str]:
+    """
+    sliding window 밖으로 밀려난 턴을 기존 요약과 합쳐 rolling summary 로 갱신하고
+    히스토리에서 제거한다. 요약할 턴이 없으면 None.
+    """
+    if session_id in _summarizing:
+        return None
+
+    _summarizing.add(session_id)
+    try:
+        store = get_session_store()
+        turns = await store.get_history(session_id)
+        # 요약이 들어갈 자리를 남겨 두고 window 에 남을 턴 수 계산
+        window_budget = max(budget - HISTORY_SUMMARY_MAX_TOKENS, 0)
+        overflow = len(turns) - len(_fit_window(turns, window_budget))
+        if overflow <= 0:
+            return None
+
+        previous = await store.get_summary(session_id)
+        old_turns = "\n".join(_format_turn(turn) for turn in turns[:overflow])
+        prompt = f"""
+다음은 법률 상담 대화의 이전 요약과 그 이후 대화입니다.
+사용자의 상황, 핵심 쟁점, 이미 안내한 내용을 중심으로 {HISTORY_SUMMARY_MAX_TOKENS}토큰 이내로 요약하세요.
+
+[이전 요약]
+{previous or "없음"}
+
+[추가 대화]
+{old_turns}
+"""
+        llm = get_chat_model(
+            HISTORY_SUMMARY_MODEL,
+            temperature=0,
+            max_tokens=HISTORY_SUMMARY_MAX_TOKENS,
+        )
+        try:
+            response = await ainvoke_with_timeout(llm, prompt.strip())
+        except Exception as e:
+            # ✅ 요약 실패 시 히스토리는 그대로 두고 sliding window 로만 제한
+            print(f"⚠️ 대화 요약 실패: {e}")
+            return None
+
+        summary = response.content.strip()
+        await store.set_summary(session_id, summary)
+        # 요약하는 동안 히스토리 상한으로 앞쪽 턴이 밀려났을 수 있으므로
+        # 현재 히스토리에 아직 남아 있는 요약 대상 턴만 제거
+        current = await store.get_history(session_id)
+        await store.drop_oldest_history(
+            session_id, _remaining_summarized(turns, current, overflow)
+        )
+        return summary
+    finally:
+        _summarizing.discard(session_id)
@@ -0,0 +1,203 @@
+# ✅ app/chatbot/memory/semantic_cache.py
+
+import os
+import copy
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+import numpy as np
+from app.core.vectorstore import get_embedding_model, get_vectorstore_registry
+
+# ✅ 의미 기반 응답 캐시 설정
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+# 코사인 유사도 기준 (ada-002 는 무관한 문장도 0.8 안팎이므로 높게 설정)
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.97"))
+SEMANTIC_CACHE_TTL = float(os.getenv("SEMANTIC_CACHE_TTL", "86400"))
+SEMANTIC_CACHE_MAX_SIZE = int(os.getenv("SEMANTIC_CACHE_MAX_SIZE", "2000"))
+SEMANTIC_CACHE_SEARCH_K = 4  # 만료된 항목을 건너뛸 수 있도록 여러 개 조회
+
+
+class SemanticCache:
+    """
+    질문 임베딩의 코사인 유사도로 이전 결과를 재사용하는 캐시.
+    - faiss IndexIDMap2(IndexFlatIP) + 정규화 벡터 (내적 = 코사인 유사도)
+    - 임베딩은 공용 CachedEmbeddings 를 사용하므로 FAISS 키워드 분석에서 이미 임베딩한
+      질문이면 추가 API 호출이 없다
+    - ttl 이 지난 항목은 조회 시 제거, max_size 를 넘으면 가장 오래 저장된 항목부터 제거
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl: float = SEMANTIC_CACHE_TTL,
+        max_size: int = SEMANTIC_CACHE_MAX_SIZE,
+        enabled: bool = SEMANTIC_CACHE_ENABLED,
+    ):
+        self.name = name
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_size = max_size
+        self.enabled = enabled
+        self._index = None
+        self._entries: "OrderedDict[int, Tuple[float, str, Any]]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def _embed(self, text: str) -> np.ndarray:
+        vector = np.asarray([await get_embedding_model().aembed_query(text)], dtype="float32")
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _remove(self, ids) -> None:
+        """호출하는 쪽에서 self._lock 을 잡은 상태여야 함"""
+        for entry_id in ids:
+            self._entries.pop(entry_id, None)
+        self._index.remove_ids(np.asarray(ids, dtype="int64"))
+
+    async def lookup(self, query: str) -> Optional[Tuple[Any, float]]:
+        """유사한 이전 질문의 (결과 사본, 유사도). 없으면 None"""
+        if not self.enabled or not query:
+            return None
+        if self._index is None or not self._entries:
+            self.misses += 1
+            return None
+
+        try:
+            vector = await self._embed(query)
+        except Exception as e:
+            print(f"⚠️ [{self.name}] 의미 캐시 임베딩 실패: {e}")
+            self.misses += 1
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            if self._index is None or self._index.d != vector.shape[1]:
+                self.misses += 1
+                return None
+            k = min(SEMANTIC_CACHE_SEARCH_K, self._index.ntotal)
+            scores, ids = self._index.search(vector, k)
+
+            expired = []
+            found = None
+            for score, entry_id in zip(scores[0], ids[0]):
+                entry = self._entries.get(int(entry_id))
+                if entry is None:
+                    continue
+                expires_at, _, value = entry
+                if expires_at < now:
+                    expired.append(int(entry_id))
+                    continue
+                if score >= self.threshold:
+                    found = (copy.deepcopy(value), float(score))
+                break  # 유사도 내림차순이므로 첫 유효 항목만 확인
+            if expired:
+                self._remove(expired)
+
+        if found is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return found
+
+    async def store(self, query: str, value: Any) -> None:
+        if not self.enabled or not query:
+            return
+        try:
+            vector = await self._embed(query)
+        except Exception as e:
+            print(f"⚠️ [{self.name}] 의미 캐시 임베딩 실패: {e}")
+            return
+
+        import faiss
+
+        with self._lock:
+            if self._index is None or self._index.d != vector.shape[1]:
+                self._index = faiss.IndexIDMap2(faiss.IndexFlatIP(vector.shape[1]))
+                self._entries.clear()
+
+            entry_id = self._next_id
+            self._next_id += 1
+            self._index.add_with_ids(vector, np.asarray([entry_id], dtype="int64"))
+            self._entries[entry_id] = (
+                time.monotonic() + self.ttl,
+                query,
+                copy.deepcopy(value),
+            )
+            self.stores += 1
+
+            overflow = len(self._entries) - self.max_size
+            if overflow > 0:
+                self._remove(list(self._entries.keys())[:overflow])
+                self.evictions += overflow
+
+    def invalidate(self, predicate: Optional[Callable[[str, Any], bool]] = None) -> int:
+        """predicate(query, value) 가 참인 항목 제거 (없으면 전체). 제거한 개수 반환"""
+        with self._lock:
+            if self._index is None:
+                return 0
+            if predicate is None:
+                removed = len(self._entries)
+                self._index.reset()
+                self._entries.clear()
+            else:
+                ids = [
+                    entry_id
+                    for entry_id, (_, query, value) in self._entries.items()
+                    if predicate(query, value)
+                ]
+                if ids:
+                    self._remove(ids)
+                removed = len(ids)
+        self.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "threshold": self.threshold,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# ✅ LLM1 (초기 보고서 + 후속 질문) / LLM2 (템플릿 + 전략 + 판례) 결과 캐시
+initial_answer_cache = SemanticCache("initial")
+consultation_cache = SemanticCache("consultation")
+
+
+def invalidate_semantic_caches() -> None:
+    """저장된 응답이 더 이상 유효하지 않을 때 (인덱스 / 데이터 갱신 등) 호출"""
+    initial_answer_cache.clear()
+    consultation_cache.clear()
+    print("🧹 의미 기반 응답 캐시 초기화")
+
+
+def semantic_cache_stats() -> dict:
+    return {
+        "initial": initial_answer_cache.stats(),
+        "consultation": consultation_cache.stats(),
+    }
+
+
+# ✅ FAISS 인덱스가 재로딩되면 키워드 분석 결과가 달라지므로 캐시 무효화
+get_vectorstore_registry().add_reload_listener(invalidate_semantic_caches)
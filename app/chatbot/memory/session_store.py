@@ -0,0 +1,328 @@
+# ✅ app/chatbot/memory/session_store.py
+
+import os
+import json
+import time
+import datetime
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Deque, List, Optional
+
+# ✅ 세션 저장소 설정
+SESSION_STORE_BACKEND = os.getenv("SESSION_STORE_BACKEND", "memory")  # memory | redis
+# redis 프로토콜 호환 서버면 모두 사용 가능 (로컬 redis / valkey / keydb 등)
+SESSION_REDIS_URL = os.getenv("SESSION_REDIS_URL", "redis://localhost:6379/0")
+SESSION_KEY_PREFIX = os.getenv("SESSION_KEY_PREFIX", "lawmang:session")
+SESSION_TTL = int(os.getenv("SESSION_TTL", "3600"))  # 마지막 사용 후 유지 시간(초)
+SESSION_HISTORY_LIMIT = int(os.getenv("SESSION_HISTORY_LIMIT", "20"))  # 세션당 대화 턴 수
+SESSION_MAX_SESSIONS = int(os.getenv("SESSION_MAX_SESSIONS", "10000"))  # memory 백엔드 상한
+
+# 세션 ID 를 보내지 않는 클라이언트 / CLI 용
+DEFAULT_SESSION_ID = "default"
+
+
+# ✅ 날짜 처리 가능한 JSON 인코더
+class CustomJSONEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, (datetime.date, datetime.datetime)):
+            return obj.isoformat()
+        return super().default(obj)
+
+
+class SessionStore(ABC):
+    """
+    세션별 LLM2 템플릿 / 대화 히스토리 / YES 카운트 저장소.
+    - 템플릿 조회/저장은 세션 ID 키로 O(1)
+    - 히스토리는 세션당 최근 SESSION_HISTORY_LIMIT 턴만 보관
+    - 마지막 사용 후 SESSION_TTL 초가 지나면 세션 전체가 만료
+    - 모든 접근은 코루틴 (네트워크 백엔드도 이벤트 루프를 막지 않도록)
+    """
+
+    @abstractmethod
+    async def get_template(self, session_id: str) -> Optional[dict]: ...
+
+    @abstractmethod
+    async def set_template(self, session_id: str, template: dict) -> None: ...
+
+    @abstractmethod
+    async def clear_template(self, session_id: str) -> None: ...
+
+    @abstractmethod
+    async def get_history(self, session_id: str) -> List[dict]: ...
+
+    @abstractmethod
+    async def append_history(self, session_id: str, user: str, assistant: str) -> None: ...
+
+    @abstractmethod
+    async def drop_oldest_history(self, session_id: str, count: int) -> None: ...
+
+    @abstractmethod
+    async def get_summary(self, session_id: str) -> str: ...
+
+    @abstractmethod
+    async def set_summary(self, session_id: str, summary: str) -> None: ...
+
+    @abstractmethod
+    async def get_yes_count(self, session_id: str) -> int: ...
+
+    @abstractmethod
+    async def set_yes_count(self, session_id: str, count: int) -> None: ...
+
+    @abstractmethod
+    async def clear(self, session_id: str) -> None: ...
+
+    async def close(self) -> None:
+        """FastAPI lifespan 종료 시 호출 (연결을 가진 백엔드만 구현)"""
+
+    def stats(self) -> dict:
+        return {"backend": type(self).__name__}
+
+
+class _Session:
+    __slots__ = ("template", "history", "summary", "yes_count", "expires_at")
+
+    def __init__(self, history_limit: int):
+        self.template: Optional[dict] = None
+        self.history: Deque[dict] = deque(maxlen=history_limit)
+        self.summary = ""
+        self.yes_count = 0
+        self.expires_at = 0.0
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    프로세스 내 dict 백엔드 (워커 1개 / 개발용).
+    세션은 사용할 때마다 TTL 이 연장되고 LRU 순서 맨 뒤로 이동하므로,
+    앞쪽부터 만료된 세션을 정리하면 된다.
+    """
+
+    def __init__(
+        self,
+        ttl: float = SESSION_TTL,
+        history_limit: int = SESSION_HISTORY_LIMIT,
+        max_sessions: int = SESSION_MAX_SESSIONS,
+    ):
+        self.ttl = ttl
+        self.history_limit = history_limit
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float) -> None:
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.expires_at >= now and len(self._sessions) <= self.max_sessions:
+                break
+            self._sessions.popitem(last=False)
+
+    def _session(self, session_id: str, create: bool) -> Optional[_Session]:
+        """호출하는 쪽에서 self._lock 을 잡은 상태여야 함"""
+        now = time.monotonic()
+        session = self._sessions.get(session_id)
+        if session is not None and session.expires_at < now:
+            del self._sessions[session_id]
+            session = None
+
+        if session is None:
+            if not create:
+                return None
+            session = _Session(self.history_limit)
+            self._sessions[session_id] = session
+
+        session.expires_at = now + self.ttl
+        self._sessions.move_to_end(session_id)
+        self._evict(now)
+        return session
+
+    async def get_template(self, session_id: str) -> Optional[dict]:
+        with self._lock:
+            session = self._session(session_id, create=False)
+            return session.template if session else None
+
+    async def set_template(self, session_id: str, template: dict) -> None:
+        with self._lock:
+            self._session(session_id, create=True).template = template
+
+    async def clear_template(self, session_id: str) -> None:
+        with self._lock:
+            session = self._session(session_id, create=False)
+            if session:
+                session.template = None
+
+    async def get_history(self, session_id: str) -> List[dict]:
+        with self._lock:
+            session = self._session(session_id, create=False)
+            return list(session.history) if session else []
+
+    async def append_history(self, session_id: str, user: str, assistant: str) -> None:
+        with self._lock:
+            self._session(session_id, create=True).history.append(
+                {"user": user, "assistant": assistant}
+            )
+
+    async def drop_oldest_history(self, session_id: str, count: int) -> None:
+        with self._lock:
+            session = self._session(session_id, create=False)
+            if session:
+                for _ in range(min(count, len(session.history))):
+                    session.history.popleft()
+
+    async def get_summary(self, session_id: str) -> str:
+        with self._lock:
+            session = self._session(session_id, create=False)
+            return session.summary if session else ""
+
+    async def set_summary(self, session_id: str, summary: str) -> None:
+        with self._lock:
+            self._session(session_id, create=True).summary = summary
+
+    async def get_yes_count(self, session_id: str) -> int:
+        with self._lock:
+            session = self._session(session_id, create=False)
+            return session.yes_count if session else 0
+
+    async def set_yes_count(self, session_id: str, count: int) -> None:
+        with self._lock:
+            self._session(session_id, create=True).yes_count = count
+
+    async def clear(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "ttl": self.ttl,
+                "history_limit": self.history_limit,
+            }
+
+
+class RedisSessionStore(SessionStore):
+    """
+    redis 백엔드 (여러 uvicorn 워커가 같은 세션 상태를 공유, redis.asyncio 로 비동기 접근).
+    키: {prefix}:{session_id}:template / :history / :summary / :yes, 쓰기마다 TTL 연장.
+    """
+
+    def __init__(
+        self,
+        url: str = SESSION_REDIS_URL,
+        ttl: int = SESSION_TTL,
+        history_limit: int = SESSION_HISTORY_LIMIT,
+        prefix: str = SESSION_KEY_PREFIX,
+    ):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "❌ SESSION_STORE_BACKEND=redis 는 redis 패키지가 필요합니다."
+            ) from e
+
+        self._redis = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.history_limit = history_limit
+        self.prefix = prefix
+
+    def _key(self, session_id: str, field: str) -> str:
+        return f"{self.prefix}:{session_id}:{field}"
+
+    async def get_template(self, session_id: str) -> Optional[dict]:
+        raw = await self._redis.get(self._key(session_id, "template"))
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+
+    async def set_template(self, session_id: str, template: dict) -> None:
+        template_json = json.dumps(template, cls=CustomJSONEncoder, ensure_ascii=False)
+        await self._redis.set(self._key(session_id, "template"), template_json, ex=self.ttl)
+
+    async def clear_template(self, session_id: str) -> None:
+        await self._redis.delete(self._key(session_id, "template"))
+
+    async def get_history(self, session_id: str) -> List[dict]:
+        items = await self._redis.lrange(self._key(session_id, "history"), 0, -1)
+        return [json.loads(item) for item in items]
+
+    async def append_history(self, session_id: str, user: str, assistant: str) -> None:
+        key = self._key(session_id, "history")
+        turn = json.dumps({"user": user, "assistant": assistant}, ensure_ascii=False)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, turn)
+            pipe.ltrim(key, -self.history_limit, -1)
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def drop_oldest_history(self, session_id: str, count: int) -> None:
+        if count > 0:
+            await self._redis.ltrim(self._key(session_id, "history"), count, -1)
+
+    async def get_summary(self, session_id: str) -> str:
+        raw = await self._redis.get(self._key(session_id, "summary"))
+        return raw.decode("utf-8") if raw is not None else ""
+
+    async def set_summary(self, session_id: str, summary: str) -> None:
+        await self._redis.set(self._key(session_id, "summary"), summary, ex=self.ttl)
+
+    async def get_yes_count(self, session_id: str) -> int:
+        raw = await self._redis.get(self._key(session_id, "yes"))
+        return int(raw) if raw is not None else 0
+
+    async def set_yes_count(self, session_id: str, count: int) -> None:
+        await self._redis.set(self._key(session_id, "yes"), int(count), ex=self.ttl)
+
+    async def clear(self, session_id: str) -> None:
+        await self._redis.delete(
+            *(self._key(session_id, field) for field in ("template", "history", "summary", "yes"))
+        )
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "redis",
+            "ttl": self.ttl,
+            "history_limit": self.history_limit,
+        }
+
+
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def create_session_store(backend: str = SESSION_STORE_BACKEND) -> SessionStore:
+    if backend == "memory":
+        return InMemorySessionStore()
+    if backend == "redis":
+        return RedisSessionStore()
+    raise ValueError(f"❌ 지원하지 않는 SESSION_STORE_BACKEND: {backend}")
+
+
+def get_session_store() -> SessionStore:
+    """공용 세션 저장소 (SESSION_STORE_BACKEND 에 따라 처음 호출 시 생성)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = create_session_store()
+    return _store
+
+
+def set_session_store(store: Optional[SessionStore]) -> None:
+    """외부에서 만든 저장소 주입 (테스트 / 스크립트용)"""
+    global _store
+    _store = store
+
+
+async def close_session_store() -> None:
+    """FastAPI lifespan 종료 시 호출"""
+    global _store
+    store, _store = _store, None
+    if store is not None:
+        await store.close()
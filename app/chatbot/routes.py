@@ -1,51 +1,59 @@
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from typing import Optional
 import os
 import sys
 import asyncio
+import weakref
 from asyncio import Lock
 from dotenv import load_dotenv
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import FAISS
-from app.chatbot.tool_agents.executor.normalanswer import run_final_answer_generation
+from app.chatbot.tool_agents.executor.normalanswer import (
+    arun_final_answer_generation,
+    astream_final_answer,
+)
 from app.chatbot.initial_agents.controller import run_initial_controller
 from app.chatbot.tool_agents.controller import run_full_consultation
-from app.chatbot.tool_agents.utils.utils import faiss_kiwi, update_llm2_template_with_es
-from app.chatbot.memory.global_cache import retrieve_template_from_memory
+from app.chatbot.tool_agents.utils.utils import update_llm2_template_with_es
+from app.chatbot.tool_agents.utils.query_analysis import get_query_analysis
+from app.chatbot.memory.global_cache import (
+    DEFAULT_SESSION_ID,
+    get_yes_count,
+    retrieve_template_from_memory,
+    set_yes_count,
+)
+from app.core.vectorstore import load_faiss
 from fastapi import FastAPI
 
-# ✅ 락: 중복 실행 방지 (LLM2 관련)
-llm2_lock = Lock()
-yes_count = 0
 sys.path.append(os.path.abspath("."))
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-DB_FAISS_PATH = "./app/chatbot_term/vectorstore"
 
 app = FastAPI()
 
 router = APIRouter()
-yes_count_memory = {}  # 간단한 글로벌 YES 메모리 (세션/유저 구분 가능시 확장)
 
 
-def load_faiss():
-    try:
-        embedding_model = OpenAIEmbeddings(
-            model="text-embedding-ada-002",
-            openai_api_key=OPENAI_API_KEY,
-        )
-        return FAISS.load_local(
-            DB_FAISS_PATH,
-            embedding_model,
-            allow_dangerous_deserialization=True,
-        )
-    except Exception as e:
-        # print(f"❌ FAISS 로드 실패: {e}")
-        return None
+# ✅ 락: 같은 세션의 LLM2 최종 응답 중복 실행 방지 (세션별 → 다른 사용자의 스트림은 기다리지 않음)
+_llm2_locks: "weakref.WeakValueDictionary[str, Lock]" = weakref.WeakValueDictionary()
+
+
+def llm2_lock(session_id: str) -> Lock:
+    lock = _llm2_locks.get(session_id)
+    if lock is None:
+        lock = Lock()
+        _llm2_locks[session_id] = lock
+    return lock
 
 
 class QueryRequest(BaseModel):
     query: str
+    session_id: Optional[str] = None  # 없으면 기본 세션 사용
+
+
+def _session_id(body: QueryRequest) -> str:
+    return (body.session_id or "").strip() or DEFAULT_SESSION_ID
 
 
 # ✅ 1. LLM1: 초기 응답만
@@ -59,24 +67,35 @@ async def chatbot_initial(request: QueryRequest):
     if not faiss_db:
         raise HTTPException(status_code=500, detail="FAISS 로드 실패")
 
+    analysis = get_query_analysis(user_query, faiss_db)
     stop_event = asyncio.Event()
     template_data = {}
+    session_id = _session_id(request)
+    current_yes_count = await get_yes_count(session_id)
 
     result = await run_initial_controller(
         user_query=user_query,
         faiss_db=faiss_db,
-        current_yes_count=0,
+        current_yes_count=current_yes_count,
         template_data=template_data,
         stop_event=stop_event,
+        analysis=analysis,
+        session_id=session_id,
     )
+    yes_count = result.get("yes_count", current_yes_count)
+    await set_yes_count(yes_count, session_id)
+
     # ✅ 비동기 후처리: 템플릿 증강 (LLM2 템플릿이 있는 경우에만)
-    cached_template = retrieve_template_from_memory()
+    cached_template = await retrieve_template_from_memory(session_id)
     if cached_template and cached_template.get("built_by_llm2"):
-        asyncio.create_task(update_llm2_template_with_es(cached_template, user_query))
+        asyncio.create_task(
+            update_llm2_template_with_es(cached_template, user_query, session_id)
+        )
 
     return {
         "mcq_question": result.get("mcq_question") or "⚠️ fallback 응답이 없습니다.",
-        "yes_count": result.get("yes_count", 0),
+        "yes_count": yes_count,
+        "session_id": session_id,
         "is_mcq": result.get(
             "is_mcq", True
         ),  # ✅ fallback 메시지도 프론트에서 렌더링되도록
@@ -91,52 +110,70 @@ async def chatbot_prepare(request: QueryRequest):
     if not faiss_db:
         raise HTTPException(status_code=500, detail="FAISS 로드 실패")
 
-    keywords = faiss_kiwi.extract_top_keywords_faiss(user_query, faiss_db)
+    # ✅ /initial 에서 계산한 분석 결과 재사용 (같은 질문이면 메모이즈됨)
+    analysis = get_query_analysis(user_query, faiss_db)
     stop_event = asyncio.Event()
 
     # 전략 + 판례만 생성 (GPT 호출 없이)
     await run_full_consultation(
         user_query=user_query,
-        search_keywords=keywords,
+        search_keywords=analysis.adjusted_keywords,
         model="gpt-4",
         build_only=True,
         stop_event=stop_event,
+        analysis=analysis,
+        session_id=_session_id(request),
     )
 
     return {"status": "ok", "message": "백그라운드 빌드 완료"}
 
 
 # ✅ 3. LLM2 최종 응답: 고급 GPT 실행
+#    ?stream=true 이면 text/event-stream(SSE)으로 중간 이벤트와 토큰을 바로 전달
 @router.post("/advanced")
-async def chatbot_advanced(request: QueryRequest):
-    user_query = request.query.strip()
+async def chatbot_advanced(body: QueryRequest, request: Request, stream: bool = False):
+    user_query = body.query.strip()
     faiss_db = load_faiss()
     if not faiss_db:
         raise HTTPException(status_code=500, detail="FAISS 로드 실패")
 
-    keywords = faiss_kiwi.extract_top_keywords_faiss(user_query, faiss_db)
+    # ✅ /initial 에서 계산한 분석 결과 재사용 (같은 질문이면 메모이즈됨)
+    analysis = get_query_analysis(user_query, faiss_db)
+    session_id = _session_id(body)
+
+    if stream:
+        return StreamingResponse(
+            _advanced_event_stream(request, user_query, analysis, session_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     stop_event = asyncio.Event()
 
-    # 전략/판례 + GPT 최종 응답까지 생성
+    # 전략/판례 생성 (최종 GPT 응답은 아래에서 한 번만 생성)
     prepared_data = await run_full_consultation(
         user_query=user_query,
-        search_keywords=keywords,
+        search_keywords=analysis.adjusted_keywords,
         model="gpt-4",
-        build_only=False,
+        build_only=True,
         stop_event=stop_event,
+        analysis=analysis,
+        session_id=session_id,
     )
 
     if not all(prepared_data.get(k) for k in ["template", "strategy", "precedent"]):
         raise HTTPException(status_code=500, detail="전략 또는 판례 생성 실패")
 
-    async with llm2_lock:
-        final_answer = run_final_answer_generation(
+    async with llm2_lock(session_id):
+        final_answer = await arun_final_answer_generation(
             template=prepared_data["template"],
             strategy=prepared_data["strategy"],
             precedent=prepared_data["precedent"],
             user_query=user_query,
             model="gpt-4",
+            session_id=session_id,
         )
+    await set_yes_count(0, session_id)  # ✅ 고급 응답 후 YES 카운트 초기화
 
     return {
         "template": prepared_data["template"],
@@ -145,3 +182,89 @@ async def chatbot_advanced(request: QueryRequest):
         "final_answer": final_answer,
         "status": "ok",
     }
+
+
+def _sse(event: str, data: dict) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _advanced_event_stream(
+    request: Request, user_query: str, analysis, session_id: str
+):
+    """
+    /advanced SSE 스트림
+    - 파이프라인 이벤트: consultation_searched / qualifier_done / template_done /
+      strategy_done / precedent_found / cached
+    - prepared: 전략/템플릿/판례, token: 최종 응답 토큰, done / error
+    클라이언트 연결이 끊기면 stop_event 를 설정하고 진행 중인 빌드와 GPT 스트림을 중단한다.
+    """
+    stop_event = asyncio.Event()
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def on_event(event: str, data: dict):
+        await events.put((event, data))
+
+    build_task = asyncio.create_task(
+        run_full_consultation(
+            user_query=user_query,
+            search_keywords=analysis.adjusted_keywords,
+            model="gpt-4",
+            build_only=True,
+            stop_event=stop_event,
+            analysis=analysis,
+            on_event=on_event,
+            session_id=session_id,
+        )
+    )
+
+    try:
+        # 1️⃣ 빌드가 끝날 때까지 중간 이벤트 전달
+        while not build_task.done() or not events.empty():
+            if await request.is_disconnected():
+                return
+            try:
+                event, data = await asyncio.wait_for(events.get(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+            yield _sse(event, data)
+
+        prepared_data = build_task.result()
+        if not all(prepared_data.get(k) for k in ["template", "strategy", "precedent"]):
+            yield _sse("error", {"detail": "전략 또는 판례 생성 실패"})
+            return
+
+        yield _sse(
+            "prepared",
+            {
+                "template": prepared_data["template"],
+                "strategy": prepared_data["strategy"],
+                "precedent": prepared_data["precedent"],
+            },
+        )
+
+        # 2️⃣ 최종 응답 토큰 스트리밍
+        async with llm2_lock(session_id):
+            async for token in astream_final_answer(
+                template=prepared_data["template"],
+                strategy=prepared_data["strategy"],
+                precedent=prepared_data["precedent"],
+                user_query=user_query,
+                model="gpt-4",
+                stop_event=stop_event,
+                session_id=session_id,
+            ):
+                if await request.is_disconnected():
+                    return
+                yield _sse("token", {"content": token})
+
+        await set_yes_count(0, session_id)
+        yield _sse("done", {"status": "ok"})
+
+    except Exception as e:
+        yield _sse("error", {"detail": str(e)})
+
+    finally:
+        # ✅ 연결 종료 / 취소 시 진행 중인 작업 정리
+        stop_event.set()
+        if not build_task.done():
+            build_task.cancel()
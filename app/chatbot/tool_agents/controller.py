@@ -1,37 +1,119 @@
+import time
 import asyncio
-from typing import List, Optional
+import inspect
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 from app.chatbot.tool_agents.qualifier import run_consultation_qualifier
 from app.chatbot.tool_agents.planner import (
+    fetch_tavily_results,
     generate_response_template,
     run_response_strategy_with_limit,
 )
 from app.chatbot.tool_agents.precedent import LegalPrecedentRetrievalAgent
-from app.chatbot.tool_agents.executor.normalanswer import run_final_answer_generation
+from app.chatbot.tool_agents.executor.normalanswer import arun_final_answer_generation
 from app.chatbot.tool_agents.tools import async_search_consultation
+from app.chatbot.tool_agents.utils.query_analysis import QueryAnalysis
 
-# ConversationBufferMemory를 활용한 캐시 함수들 import
+# 세션별 템플릿 캐시 함수들 import
 from app.chatbot.memory.global_cache import (
+    DEFAULT_SESSION_ID,
     retrieve_template_from_memory,
     store_template_in_memory,
 )
+from app.chatbot.memory.semantic_cache import consultation_cache
+from app.core.llm import warm_chat_models
+
+# ✅ LLM2 빌드 / 최종 응답이 쓰는 모델 (lifespan 에서 미리 생성)
+LLM2_CHAT_MODELS = [
+    {"model": "gpt-3.5-turbo", "temperature": 0.0},  # qualifier: 관련성 판단
+    {"model": "gpt-3.5-turbo", "temperature": 0.1},  # qualifier: 대표 상담 선택
+    {"model": "gpt-3.5-turbo", "temperature": 0.3},  # planner: 템플릿
+    {"model": "gpt-3.5-turbo", "temperature": 0.2},  # planner: 전략
+    {"model": "gpt-4", "temperature": 0.4, "streaming": True},  # 최종 응답
+]
+
+# ✅ 파이프라인 중간 이벤트 콜백: on_event(event_name, data)
+EventCallback = Callable[[str, dict], Union[Awaitable[Any], Any]]
+
+
+def warm_llm2_models() -> None:
+    warm_chat_models(LLM2_CHAT_MODELS)
+
+
+async def _emit(on_event: Optional[EventCallback], event: str, data: dict) -> None:
+    if on_event is None:
+        return
+    result = on_event(event, data)
+    if inspect.isawaitable(result):
+        await result
+
+
+async def _timed(timings: Dict[str, float], stage: str, awaitable: Awaitable):
+    """단계 실행 시간(초) 기록"""
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = round(time.perf_counter() - started, 3)
+
+
+async def _wait_stages(stop_event: Optional[asyncio.Event], *tasks: asyncio.Task):
+    """
+    태스크들이 모두 끝날 때까지 기다린 뒤 결과를 순서대로 반환.
+    도중에 stop_event 가 설정되거나 한 단계가 실패하면 진행 중인 태스크를 모두 취소한다.
+    stop_event 로 중단되면 None 을 반환.
+    """
+    pending = set(tasks)
+    stop_waiter = asyncio.ensure_future(stop_event.wait()) if stop_event else None
+    try:
+        while pending:
+            waiting = pending | {stop_waiter} if stop_waiter else pending
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if stop_waiter in done:
+                return None
+            for task in done:
+                pending.discard(task)
+                if task.exception() is not None:
+                    raise task.exception()
+        return [task.result() for task in tasks]
+    finally:
+        for task in pending:
+            task.cancel()
+        if stop_waiter:
+            stop_waiter.cancel()
 
 
 async def run_full_consultation(
     user_query: str,
-    search_keywords: List[str],
+    search_keywords: Optional[List[str]] = None,
     model: str = "gpt-4",
     build_only: bool = False,
     stop_event: Optional[asyncio.Event] = None,  # ✅ 추가
+    analysis: Optional[QueryAnalysis] = None,
+    on_event: Optional[EventCallback] = None,
+    session_id: str = DEFAULT_SESSION_ID,
 ) -> dict:
+    # ✅ 턴 단위 분석 결과가 있으면 검색 키워드를 그대로 사용
+    if search_keywords is None:
+        search_keywords = analysis.adjusted_keywords if analysis else [user_query]
 
+    # 캐시 조회: 세션 저장소에 저장된 LLM2 템플릿 사용
+    cached_data = await retrieve_template_from_memory(session_id)
+    cache_status = "cached"
+    if not cached_data:
+        # ✅ 다른 사용자의 거의 같은 질문으로 만든 템플릿/전략/판례 재사용 (GPT-4 빌드 생략)
+        semantic_hit = await consultation_cache.lookup(user_query)
+        if semantic_hit:
+            cached_data, similarity = semantic_hit
+            cache_status = "semantic_cache"
+            print(f"♻️ 의미 캐시 적중 (similarity={similarity:.3f})")
+            await store_template_in_memory(cached_data, session_id)
 
-    # 캐시 조회: ConversationBufferMemory에서 저장된 TEMPLATE_DATA 메시지 사용
-    cached_data = retrieve_template_from_memory()
     if cached_data:
 
         template = cached_data.get("template")
         strategy = cached_data.get("strategy")
         precedent = cached_data.get("precedent")
+        await _emit(on_event, "cached", {"status": cache_status})
         # 빌드 전용 모드면 캐시된 데이터 그대로 반환
         if build_only:
             return {
@@ -42,12 +124,14 @@ async def run_full_consultation(
                 "status": "build_only (cached)",
             }
         # 최종 응답 생성 (캐시된 템플릿 활용)
-        final_answer = run_final_answer_generation(
+        final_answer = await arun_final_answer_generation(
             template=template,
             strategy=strategy,
             precedent=precedent,
             user_query=user_query,
             model=model,
+            stop_event=stop_event,
+            session_id=session_id,
         )
 
         return {
@@ -60,53 +144,125 @@ async def run_full_consultation(
         }
 
     # 캐시된 데이터가 없으면 새로 생성
-    # 1️⃣ Qualifier 실행
-    consultation_results, _, _ = await async_search_consultation(search_keywords)
-    if stop_event and stop_event.is_set():
+    # ✅ 단계 그래프: 입력이 준비된 단계부터 바로 시작
+    #   상담 검색 ─▶ Qualifier ─┬─▶ 템플릿 ─▶ 전략(Tavily 결과 대기)
+    #   Tavily 검색(질문만 필요) ┘  └─▶ 판례 검색(키워드 + 대표 상담 제목)
+    empty_result = {"template": None, "strategy": None, "precedent": None}
+    timings: Dict[str, float] = {}
+    build_started = time.perf_counter()
 
-        return {"template": None, "strategy": None, "precedent": None}
-
-    best_case = await run_consultation_qualifier(user_query, consultation_results)
-    if not consultation_results:
-
-        return {"template": None, "strategy": None, "precedent": None}
-    if not all(k in best_case for k in ["title", "question", "answer"]):
+    tavily_task = asyncio.create_task(
+        _timed(timings, "tavily", fetch_tavily_results(user_query))
+    )
+    try:
+        # 1️⃣ 상담 검색 + Qualifier 실행
+        stage = await _wait_stages(
+            stop_event,
+            asyncio.create_task(
+                _timed(timings, "consultation", async_search_consultation(search_keywords))
+            ),
+        )
+        if stage is None:
+            return empty_result
+        consultation_results, _, _ = stage[0]
+        await _emit(
+            on_event, "consultation_searched", {"count": len(consultation_results)}
+        )
 
-        title = best_case.get("title", "법률상담")
-        question = best_case.get("question", user_query)
-        answer = best_case.get(
-            "answer", "일반적인 법률 정보에 기반하여 응답을 생성합니다."
+        stage = await _wait_stages(
+            stop_event,
+            asyncio.create_task(
+                _timed(
+                    timings,
+                    "qualifier",
+                    run_consultation_qualifier(user_query, consultation_results),
+                )
+            ),
         )
-    else:
-        title = best_case["title"]
-        question = best_case["question"]
-        answer = best_case["answer"]
+        if stage is None:
+            return empty_result
+        best_case = stage[0]
+        await _emit(
+            on_event,
+            "qualifier_done",
+            {"title": best_case.get("title"), "status": best_case.get("status", "ok")},
+        )
+        if not consultation_results:
 
-    if stop_event and stop_event.is_set():
+            return empty_result
+        if not all(k in best_case for k in ["title", "question", "answer"]):
 
-        return {"template": None, "strategy": None, "precedent": None}
+            title = best_case.get("title", "법률상담")
+            question = best_case.get("question", user_query)
+            answer = best_case.get(
+                "answer", "일반적인 법률 정보에 기반하여 응답을 생성합니다."
+            )
+        else:
+            title = best_case["title"]
+            question = best_case["question"]
+            answer = best_case["answer"]
 
-    # 2️⃣ Planner - 템플릿 생성
-    template = await generate_response_template(title, question, answer, user_query)
+        # 2️⃣ Planner - 템플릿 생성 → 전략 생성 (Tavily 는 이미 진행 중)
+        async def plan():
+            template = await _timed(
+                timings,
+                "template",
+                generate_response_template(title, question, answer, user_query),
+            )
+            await _emit(on_event, "template_done", {"summary": template.get("summary", "")})
 
-    # 3️⃣ 전략 생성
-    strategy = await run_response_strategy_with_limit(
-        template.get("explanation", ""),  # 🔐 explanation 없을 경우 빈 문자열로 처리
-        user_query,
-        template.get("hyperlinks", []),
-    )
+            strategy = await _timed(
+                timings,
+                "strategy",
+                run_response_strategy_with_limit(
+                    template.get("explanation", ""),  # 🔐 explanation 없을 경우 빈 문자열로 처리
+                    user_query,
+                    template.get("hyperlinks", []),
+                    tavily_results=tavily_task,
+                ),
+            )
+            await _emit(
+                on_event,
+                "strategy_done",
+                {"final_strategy_summary": strategy.get("final_strategy_summary", "")},
+            )
+            return template, strategy
 
-    if stop_event and stop_event.is_set():
+        # 3️⃣ 판례 검색 (템플릿/전략과 동시에 실행)
+        async def find_precedent():
+            precedent_agent = LegalPrecedentRetrievalAgent()
+            precedent = await _timed(
+                timings,
+                "precedent",
+                precedent_agent.run(
+                    categories=[title],
+                    titles=[title],
+                    user_input_keywords=search_keywords,
+                ),
+            )
+            await _emit(
+                on_event,
+                "precedent_found",
+                {
+                    "status": precedent.get("status", "ok"),
+                    "casenote_url": precedent.get("casenote_url", ""),
+                    "case": precedent.get("precedent", {}).get("c_name", ""),
+                },
+            )
+            return precedent
 
-        return {"template": None, "strategy": None, "precedent": None}
+        stage = await _wait_stages(
+            stop_event, asyncio.create_task(plan()), asyncio.create_task(find_precedent())
+        )
+        if stage is None:
+            return empty_result
+        (template, strategy), precedent = stage
+    finally:
+        if not tavily_task.done():
+            tavily_task.cancel()
 
-    # 4️⃣ 판례 검색 등 빌드 완료 후
-    precedent_agent = LegalPrecedentRetrievalAgent()
-    precedent = await precedent_agent.run(
-        categories=[title],
-        titles=[title],
-        user_input_keywords=search_keywords,
-    )
+    timings["build_total"] = round(time.perf_counter() - build_started, 3)
+    print(f"⏱️ LLM2 빌드 단계별 시간(초): {timings}")
 
     # 중간 빌드 데이터 구성 (여기에 built 플래그 추가)
     intermediate_data = {
@@ -116,7 +272,9 @@ async def run_full_consultation(
         "built": True,  # 기존
         "built_by_llm2": True,  # ✅ 필수: LLM2 생성 템플릿임을 명시
     }
-    store_template_in_memory(intermediate_data)
+    await store_template_in_memory(intermediate_data, session_id)
+    if template and strategy and precedent:
+        await consultation_cache.store(user_query, intermediate_data)
 
 
     # 빌드 전용 모드 (GPT 미호출)
@@ -127,15 +285,18 @@ async def run_full_consultation(
             "strategy": strategy,
             "precedent": precedent,
             "status": "build_only",
+            "timings": timings,
         }
 
     # 5️⃣ 고급 GPT 응답 생성
-    final_answer = run_final_answer_generation(
+    final_answer = await arun_final_answer_generation(
         template=template,
         strategy=strategy,
         precedent=precedent,
         user_query=user_query,
         model=model,
+        stop_event=stop_event,
+        session_id=session_id,
     )
 
     return {
@@ -145,4 +306,5 @@ async def run_full_consultation(
         "precedent": precedent,
         "final_answer": final_answer,
         "status": "ok",
+        "timings": timings,
     }
@@ -1,13 +1,19 @@
 import os
 import json
 import sys
-from langchain_openai import ChatOpenAI
+import asyncio
+from typing import AsyncIterator, Optional
+from app.core.llm import get_chat_model
 from langchain.schema import HumanMessage, SystemMessage
 from app.chatbot.tool_agents.tools import LawGoKRTavilySearch
 from app.chatbot.tool_agents.utils.utils import (
     insert_hyperlinks_into_text,
 )
-from langchain.memory import ConversationBufferMemory
+from app.chatbot.memory.global_cache import (
+    DEFAULT_SESSION_ID,
+    load_chat_history,
+    save_chat_turn,
+)
 from langchain_teddynote import logging
 
 logging.langsmith("llamaproject")
@@ -15,13 +21,13 @@ logging.langsmith("llamaproject")
 # ✅ LangChain ChatOpenAI
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 
-memory = ConversationBufferMemory(
-    memory_key="chat_history", max_token_limit=1000, return_messages=True
-)
-
 
-def build_final_answer_prompt(
-    template: dict, strategy: dict, precedent: dict, user_query: str
+async def build_final_answer_prompt(
+    template: dict,
+    strategy: dict,
+    precedent: dict,
+    user_query: str,
+    session_id: str = DEFAULT_SESSION_ID,
 ) -> str:
     precedent_summary = precedent.get("summary", "")
     precedent_link = precedent.get("casenote_url", "")
@@ -38,7 +44,7 @@ def build_final_answer_prompt(
     )
     strategy_decision_tree = "\n".join(strategy.get("decision_tree", []))
 
-    chat_history = memory.load_memory_variables({}).get("chat_history", "")
+    chat_history = await load_chat_history(session_id)
 
     prompt = f"""
 당신은 법률 상담을 생성하는 고급 AI입니다.
@@ -83,42 +89,100 @@ def build_final_answer_prompt(
     return prompt.strip()
 
 
-def run_final_answer_generation(
+async def _final_answer_messages(
     template: dict,
     strategy: dict,
     precedent: dict,
     user_query: str,
-    model: str = "gpt-4",
-) -> str:
-    final_prompt = build_final_answer_prompt(template, strategy, precedent, user_query)
-    print("\n🤖 AI 답변:")
-    final_answer = ""
-
-    # ✅ LangChain ChatOpenAI (Streaming)
-    llm = ChatOpenAI(
-        model=model,
-        api_key=OPENAI_API_KEY,
-        temperature=0.4,
-        streaming=True
+    session_id: str = DEFAULT_SESSION_ID,
+) -> list:
+    final_prompt = await build_final_answer_prompt(
+        template, strategy, precedent, user_query, session_id
     )
-
-    messages = [
+    return [
         SystemMessage(
             content="당신은 고급 법률 응답을 생성하는 AI입니다. 사용자의 신뢰를 얻을 수 있는 정확하고 자연스러운 상담을 생성하세요."
         ),
         HumanMessage(content=final_prompt),
     ]
 
-    # ✅ 스트리밍 응답 처리
-    for chunk in llm.stream(messages):
-        if hasattr(chunk, "content") and chunk.content:
-            sys.stdout.write(chunk.content)
-            sys.stdout.flush()
-            final_answer += chunk.content
 
-    # ✅ 메모리에 저장
-    memory.save_context(
-        {"user_query": user_query}, {"response": precedent.get("summary", "")}
+async def astream_final_answer(
+    template: dict,
+    strategy: dict,
+    precedent: dict,
+    user_query: str,
+    model: str = "gpt-4",
+    stop_event: Optional[asyncio.Event] = None,
+    session_id: str = DEFAULT_SESSION_ID,
+) -> AsyncIterator[str]:
+    """
+    run_final_answer_generation 의 비동기 스트리밍 버전 (토큰이 도착하는 대로 yield).
+    stop_event 가 설정되거나 소비하는 쪽이 중단하면 GPT 스트림도 함께 닫힌다.
+    """
+    llm = get_chat_model(model, temperature=0.4, streaming=True)
+    messages = await _final_answer_messages(
+        template, strategy, precedent, user_query, session_id
     )
 
+    completed = False
+    stream = llm.astream(messages)
+    try:
+        async for chunk in stream:
+            if stop_event and stop_event.is_set():
+                return
+            if hasattr(chunk, "content") and chunk.content:
+                yield chunk.content
+        completed = True
+    finally:
+        await stream.aclose()
+        # ✅ 끝까지 생성된 경우에만 메모리에 저장
+        if completed:
+            await save_chat_turn(user_query, precedent.get("summary", ""), session_id)
+
+
+async def arun_final_answer_generation(
+    template: dict,
+    strategy: dict,
+    precedent: dict,
+    user_query: str,
+    model: str = "gpt-4",
+    stop_event: Optional[asyncio.Event] = None,
+    session_id: str = DEFAULT_SESSION_ID,
+) -> str:
+    """이벤트 루프를 막지 않는 최종 응답 생성 (전체 응답을 모아서 반환)"""
+    final_answer = ""
+    async for token in astream_final_answer(
+        template,
+        strategy,
+        precedent,
+        user_query,
+        model=model,
+        stop_event=stop_event,
+        session_id=session_id,
+    ):
+        final_answer += token
+    return final_answer
+
+
+async def run_final_answer_generation(
+    template: dict,
+    strategy: dict,
+    precedent: dict,
+    user_query: str,
+    model: str = "gpt-4",
+    session_id: str = DEFAULT_SESSION_ID,
+) -> str:
+    """CLI 용: 생성되는 토큰을 바로 stdout 에 출력하고 전체 응답을 반환"""
+    print("\n🤖 AI 답변:")
+    final_answer = ""
+
+    # ✅ 스트리밍 응답 처리 (메모리 저장은 astream_final_answer 에서)
+    async for token in astream_final_answer(
+        template, strategy, precedent, user_query, model=model, session_id=session_id
+    ):
+        sys.stdout.write(token)
+        sys.stdout.flush()
+        final_answer += token
+
     return final_answer
@@ -1,9 +1,11 @@
 import os
 import json
+import inspect
 import difflib
 from app.chatbot.tool_agents.tools import async_ES_search
 from langchain_openai import ChatOpenAI
-from typing import List, Dict
+from app.core.llm import ainvoke_with_timeout, get_chat_model
+from typing import Awaitable, List, Dict, Optional, Union
 from app.chatbot.tool_agents.tools import LawGoKRTavilySearch
 from app.chatbot.memory.templates import get_default_strategy_template
 from app.chatbot.tool_agents.utils.utils import validate_model_type
@@ -16,14 +18,8 @@ def get_llm(
 ) -> ChatOpenAI:
     validate_model_type(model)
 
-    api_key = OPENAI_API_KEY if use_primary_key else OPENAI_API_KEY
-
-    return ChatOpenAI(
-        model=model,
-        api_key=api_key,
-        temperature=temperature,
-        streaming=False,
-    )
+    # ✅ 공용 팩토리에서 재사용 (커넥션 풀 공유)
+    return get_chat_model(model, temperature=temperature, streaming=False)
 
 
 # ✅ 응답 템플릿 생성
@@ -134,12 +130,18 @@ Let's think step by step and explain why each part is valid.
     ]
 
     try:
-        response = llm.invoke(messages)
+        response = await ainvoke_with_timeout(llm, messages)
         return json.loads(response.content)
     except Exception:
         return {"error": "GPT 응답 파싱 실패"}
 
 
+# ✅ Tavily 검색 (사용자 질문만 필요하므로 전략 생성과 별도로 미리 시작할 수 있음)
+async def fetch_tavily_results(user_query: str, max_results: int = 3):
+    # 공용 httpx 커넥션 풀로 비동기 호출 (같은 질문은 캐시에서 반환)
+    return await LawGoKRTavilySearch(max_results=max_results).arun(user_query)
+
+
 # ✅ 전략 생성
 async def generate_response_strategy(
     explanation: str,
@@ -147,6 +149,7 @@ async def generate_response_strategy(
     hyperlinks: list = None,
     previous_strategy: dict = None,
     model: str = "gpt-3.5-turbo",
+    tavily_results: Optional[Union[list, Awaitable]] = None,  # ✅ 미리 시작한 검색 결과/태스크
 ) -> dict:
     hyperlinks = hyperlinks or []
 
@@ -247,7 +250,7 @@ decision_tree: [
     ]
 
     try:
-        response = llm.invoke(messages)
+        response = await ainvoke_with_timeout(llm, messages)
         strategy_raw = response.content
         strategy = json.loads(strategy_raw)
     except Exception as e:
@@ -255,8 +258,11 @@ decision_tree: [
         default_strategy["error"] = "GPT 전략 파싱 실패"
         return default_strategy
 
-    search_tool = LawGoKRTavilySearch(max_results=3)
-    tavily_results = search_tool.run(user_query)
+    # ✅ 미리 시작한 Tavily 검색이 있으면 그 결과를 기다리고, 없으면 지금 검색
+    if tavily_results is None:
+        tavily_results = await fetch_tavily_results(user_query)
+    elif inspect.isawaitable(tavily_results):
+        tavily_results = await tavily_results
 
     evaluation = await evaluate_strategy_with_tavily(strategy, tavily_results)
     strategy["evaluation"] = evaluation
@@ -333,7 +339,7 @@ async def evaluate_strategy_with_tavily(
     ]
 
     try:
-        response = llm.invoke(messages)
+        response = await ainvoke_with_timeout(llm, messages)
         return json.loads(response.content)
     except Exception as e:
         return {
@@ -413,7 +419,7 @@ decision_tree: [
     ]
 
     try:
-        response = llm.invoke(messages)
+        response = await ainvoke_with_timeout(llm, messages)
         return json.loads(response.content)
     except Exception as e:
         return get_default_strategy_template()
@@ -426,6 +432,7 @@ async def run_response_strategy_with_limit(
     hyperlinks,
     model="gpt-3.5-turbo",
     previous_strategy: dict = None,  # ✅ 추가
+    tavily_results=None,
 ):
     strategy = await generate_response_strategy(
         explanation=explanation,
@@ -433,6 +440,7 @@ async def run_response_strategy_with_limit(
         hyperlinks=hyperlinks,
         previous_strategy=previous_strategy,  # ✅ 전달
         model=model,
+        tavily_results=tavily_results,
     )
 
     if strategy.get("evaluation", {}).get("needs_revision") is True:
@@ -1,10 +1,40 @@
 # precedent.py
 
 import asyncio
+from typing import Set
 from app.chatbot.tool_agents.tools import (
     async_search_precedent,
     search_tavily_for_precedents,
 )
+from app.services.precedent_summary_service import (
+    get_precedent_summary,
+    populate_precedent_summary,
+)
+
+# 백그라운드 요약 적재 태스크 참조 (GC 방지) / 적재 중인 precSeq
+_populate_tasks: Set[asyncio.Task] = set()
+_populating: Set[str] = set()
+
+
+def _schedule_populate(prec_seq: str, fallback_summary: str, fallback_url: str) -> None:
+    """저장소 미스 → 응답은 Tavily 요약으로 먼저 내보내고 상세 API 결과를 뒤에서 적재"""
+    if prec_seq in _populating:
+        return
+
+    async def populate():
+        try:
+            source = await populate_precedent_summary(prec_seq, fallback_summary, fallback_url)
+            if source:
+                print(f"💾 판례 요약 저장 (precSeq={prec_seq}, source={source})")
+        except Exception as e:
+            print(f"⚠️ 판례 요약 저장 실패 (precSeq={prec_seq}): {e}")
+        finally:
+            _populating.discard(prec_seq)
+
+    _populating.add(prec_seq)
+    task = asyncio.create_task(populate())
+    _populate_tasks.add(task)
+    task.add_done_callback(_populate_tasks.discard)
 
 
 class LegalPrecedentRetrievalAgent:
@@ -47,10 +77,17 @@ class LegalPrecedentRetrievalAgent:
                 "status": "precseq_missing",
             }
 
-        # 3️⃣ 요약 검색
-        tavily_summary, casenote_url = await search_tavily_for_precedents(best_precedent)
-
-        cleaned_summary = self._postprocess_summary(tavily_summary)
+        # 3️⃣ 요약 검색: 로컬 저장소 → (미스) Tavily
+        stored = await get_precedent_summary(prec_seq)
+        if stored:
+            summary, casenote_url = stored["summary"], stored["casenote_url"]
+            best_precedent["summary_source"] = stored["source"]
+        else:
+            summary, casenote_url = await search_tavily_for_precedents(best_precedent)
+            best_precedent["summary_source"] = "tavily"
+            _schedule_populate(prec_seq, summary, casenote_url)
+
+        cleaned_summary = self._postprocess_summary(summary)
 
         hyperlink = {"label": "관련 판례 보기", "url": casenote_url} if casenote_url else {}
 
@@ -1,7 +1,7 @@
 import os
 import json
 from typing import List, Dict
-from langchain_openai import ChatOpenAI
+from app.core.llm import ainvoke_with_timeout, get_chat_model
 from app.chatbot.tool_agents.tools import async_search_consultation
 from app.chatbot.tool_agents.utils.utils import validate_model_type
 
@@ -43,12 +43,7 @@ async def check_relevance_to_consultations(
 
     prompt = build_relevance_prompt(user_query, consultation_results)
 
-    llm = ChatOpenAI(
-        model=model,
-        api_key=OPENAI_API_KEY,
-        temperature=0.0,
-        streaming=False,
-    )
+    llm = get_chat_model(model, temperature=0.0)
 
     messages = [
         {
@@ -58,7 +53,7 @@ async def check_relevance_to_consultations(
         {"role": "user", "content": prompt},
     ]
 
-    response = await llm.ainvoke(messages)
+    response = await ainvoke_with_timeout(llm, messages)
     result_text = response.content.strip().lower()
     return result_text == "relevant"
 
@@ -137,12 +132,7 @@ async def choose_best_consultation(
 
     prompt = build_choose_one_prompt(user_query, consultation_results)
 
-    llm = ChatOpenAI(
-        model=model,
-        api_key=OPENAI_API_KEY,
-        temperature=0.1,
-        streaming=False,
-    )
+    llm = get_chat_model(model, temperature=0.1)
 
     messages = [
         {
@@ -152,7 +142,7 @@ async def choose_best_consultation(
         {"role": "user", "content": prompt},
     ]
 
-    response = await llm.ainvoke(messages)
+    response = await ainvoke_with_timeout(llm, messages)
     result_text = response.content
 
     if result_text.strip() in ["[]", "[0]"]:
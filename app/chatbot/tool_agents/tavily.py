@@ -0,0 +1,168 @@
+import os
+import copy
+import json
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, List, Optional
+from app.core.cache import AsyncTTLCache
+from app.core.disk_cache import SQLiteKVStore
+from app.core.http import get_async_http_client, get_sync_http_client
+
+# ✅ Tavily REST API (langchain TavilySearchResults 대신 공용 httpx 커넥션 풀로 직접 호출)
+TAVILY_API_URL = os.getenv("TAVILY_API_URL", "https://api.tavily.com/search")
+TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+TAVILY_SEARCH_DEPTH = os.getenv("TAVILY_SEARCH_DEPTH", "advanced")
+TAVILY_TIMEOUT = float(os.getenv("TAVILY_TIMEOUT", "15"))
+TAVILY_MAX_CONCURRENCY = int(os.getenv("TAVILY_MAX_CONCURRENCY", "4"))  # 워커 당 동시 호출 수
+
+# ✅ 결과 캐시: 프로세스 내 LRU(동시 동일 요청 병합) + sqlite 디스크 캐시(워커 간 / 재시작 후 공유)
+TAVILY_CACHE_TTL = float(os.getenv("TAVILY_CACHE_TTL", str(7 * 24 * 3600)))
+TAVILY_MEMORY_CACHE_SIZE = int(os.getenv("TAVILY_MEMORY_CACHE_SIZE", "256"))
+# 비어 있으면 디스크 캐시 비활성화
+TAVILY_CACHE_PATH = os.getenv("TAVILY_CACHE_PATH", "./cache/tavily.sqlite3")
+
+_HTTP_CLIENT = "tavily"
+
+tavily_memory_cache = AsyncTTLCache(
+    "tavily", ttl=TAVILY_CACHE_TTL, maxsize=TAVILY_MEMORY_CACHE_SIZE
+)
+_async_semaphore = asyncio.Semaphore(TAVILY_MAX_CONCURRENCY)
+_sync_semaphore = threading.BoundedSemaphore(TAVILY_MAX_CONCURRENCY)
+
+_disk: Optional[SQLiteKVStore] = None
+_disk_lock = threading.Lock()
+
+
+def _get_disk() -> Optional[SQLiteKVStore]:
+    global _disk
+    if not TAVILY_CACHE_PATH:
+        return None
+    if _disk is None:
+        with _disk_lock:
+            if _disk is None:
+                _disk = SQLiteKVStore(TAVILY_CACHE_PATH, table="tavily")
+    return _disk
+
+
+def _disk_get(key: str) -> Optional[Any]:
+    disk = _get_disk()
+    if disk is None:
+        return None
+    raw = disk.get(key)
+    return json.loads(raw) if raw is not None else None
+
+
+def _disk_set(key: str, value: Any) -> None:
+    disk = _get_disk()
+    if disk is not None:
+        disk.set(key, json.dumps(value, ensure_ascii=False).encode("utf-8"), ttl=TAVILY_CACHE_TTL)
+
+
+def search_cache_key(query: str, max_results: int) -> str:
+    return f"search:{max_results}:{' '.join(query.split())}"
+
+
+def precedent_cache_key(prec_seq: str) -> str:
+    return f"precseq:{prec_seq}"
+
+
+async def cached_tavily_call(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    메모리 → 디스크 → fetch 순서로 조회 (동시 동일 요청은 한 번만 실행).
+    fetch 가 예외를 던지면 어느 캐시에도 저장하지 않는다. 호출자별 사본을 반환.
+    """
+
+    async def load():
+        cached = _disk_get(key)
+        if cached is not None:
+            return cached
+        value = await fetch()
+        _disk_set(key, value)
+        return value
+
+    return copy.deepcopy(await tavily_memory_cache.get_or_set(key, load))
+
+
+def _payload(query: str, max_results: int, include_domains: Optional[List[str]]) -> dict:
+    payload = {
+        "api_key": TAVILY_API_KEY,
+        "query": query,
+        "max_results": max_results,
+        "search_depth": TAVILY_SEARCH_DEPTH,
+        "include_answer": False,
+        "include_raw_content": False,
+        "include_images": False,
+    }
+    if include_domains:
+        payload["include_domains"] = include_domains
+    return payload
+
+
+def _parse_results(data: dict) -> List[dict]:
+    """TavilySearchResults 와 같은 형태 ({url, content, title})"""
+    return [
+        {
+            "url": item.get("url", ""),
+            "content": item.get("content", ""),
+            "title": item.get("title", ""),
+        }
+        for item in data.get("results", [])
+    ]
+
+
+async def tavily_search(
+    query: str, max_results: int = 5, include_domains: Optional[List[str]] = None
+) -> List[dict]:
+    """비동기 Tavily 검색 (캐시 + 동시 호출 제한). HTTP 오류는 예외로 전달"""
+    if not TAVILY_API_KEY:
+        raise ValueError("❌ TAVILY_API_KEY 환경변수 누락")
+
+    async def fetch():
+        client = get_async_http_client(_HTTP_CLIENT, timeout=TAVILY_TIMEOUT)
+        async with _async_semaphore:
+            response = await client.post(
+                TAVILY_API_URL, json=_payload(query, max_results, include_domains)
+            )
+        response.raise_for_status()
+        return _parse_results(response.json())
+
+    key = search_cache_key(query, max_results)
+    if include_domains:
+        key = f"{key}:{','.join(sorted(include_domains))}"
+    return await cached_tavily_call(key, fetch)
+
+
+def tavily_search_sync(
+    query: str, max_results: int = 5, include_domains: Optional[List[str]] = None
+) -> List[dict]:
+    """동기 경로(CLI / 스레드)용 Tavily 검색. 메모리 / 디스크 캐시를 비동기 경로와 공유"""
+    if not TAVILY_API_KEY:
+        raise ValueError("❌ TAVILY_API_KEY 환경변수 누락")
+
+    key = search_cache_key(query, max_results)
+    if include_domains:
+        key = f"{key}:{','.join(sorted(include_domains))}"
+
+    cached = tavily_memory_cache.lookup(key)
+    if cached is None:
+        cached = _disk_get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    client = get_sync_http_client(_HTTP_CLIENT, timeout=TAVILY_TIMEOUT)
+    with _sync_semaphore:
+        response = client.post(
+            TAVILY_API_URL, json=_payload(query, max_results, include_domains)
+        )
+    response.raise_for_status()
+    results = _parse_results(response.json())
+    tavily_memory_cache.set(key, results)
+    _disk_set(key, results)
+    return copy.deepcopy(results)
+
+
+def tavily_cache_stats() -> dict:
+    stats = tavily_memory_cache.stats()
+    stats["disk_path"] = TAVILY_CACHE_PATH or None
+    stats["max_concurrency"] = TAVILY_MAX_CONCURRENCY
+    return stats
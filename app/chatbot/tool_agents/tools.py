@@ -1,15 +1,19 @@
 import os
 import sys
-import re
 import requests
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import copy
+from typing import Optional
 from langchain.tools import Tool
 from app.services.consultation import (
     search_consultations,
     search_consultations_by_category,
 )
 from app.services.consultation_detail_service import get_consultation_detail_by_id
+from app.services.consultation_search import search_consultation_candidates_async
+from app.services.precedent_search import (
+    PRECEDENT_SEARCH_RECENT_YEARS,
+    search_precedent_candidates_async,
+)
 from app.services.precedent_service import (
     search_precedents,
     search_precedents_by_category,
@@ -17,21 +21,20 @@ from app.services.precedent_service import (
 # from app.services.mylog_service import get_user_logs, get_user_logs_old
 #------------------------------------------------------------API calls
 from app.services.precedent_detail_service import fetch_external_precedent_detail
-from app.core.database import execute_sql
-from langchain_community.tools import TavilySearchResults
 from elasticsearch import AsyncElasticsearch
+from app.core.es import get_es_client, set_es_client
+from app.core.cache import AsyncTTLCache
+from app.chatbot.tool_agents.tavily import (
+    cached_tavily_call,
+    precedent_cache_key,
+    tavily_search,
+    tavily_search_sync,
+)
 from dotenv import load_dotenv
 
 load_dotenv()
 
-ES_HOST = os.getenv("ES_HOST")
-ES_USER = os.getenv("ES_USER")
-ES_PASSWORD = os.getenv("ES_PASSWORD")
-
-if not ES_HOST:
-    raise ValueError("❌ ES_HOST 환경변수 누락")
 # ---------------------------------------------------------------
-executor = ThreadPoolExecutor(max_workers=10)
 # ✅ 현재 파일의 상위 경로를 Python 경로에 추가
 
 # ✅ 1. 검색 도구 정의
@@ -95,59 +98,9 @@ class llmCOD_tool_sets:
 
 # ------------------ 정밀 서치 상담 쿼리---------------------------------------------
 async def async_search_consultation(keywords):
-    """비동기 SQL 상담 검색 (카테고리 기반 필터 추가)"""
-    loop = asyncio.get_running_loop()
-
-    formatted_keywords = ", ".join(f"'{kw}'" for kw in keywords)
-
-    query = f"""
-    SET pg_trgm.similarity_threshold = 0.1;
-
-    SELECT 
-        id,
-        category,
-        sub_category,
-        title,
-        question,
-        answer,
-        (
-            -- title 가중치 (0.45)
-            (
-                {" + ".join([f"COALESCE(similarity(title, '{kw}'), 0)" for kw in keywords])}
-            ) / {len(keywords)} * 0.45
-            +
-            -- question 가중치 (0.35)
-            (
-                {" + ".join([f"COALESCE(similarity(question, '{kw}'), 0)" for kw in keywords])}
-            ) / {len(keywords)} * 0.35
-            +
-            -- answer 가중치 (0.15)
-            (
-                {" + ".join([f"COALESCE(similarity(answer, '{kw}'), 0)" for kw in keywords])}
-            ) / {len(keywords)} * 0.15
-            +
-            -- sub_category 가중치 (0.05)
-            (
-                {" + ".join([f"COALESCE(similarity(sub_category, '{kw}'), 0)" for kw in keywords])}
-            ) / {len(keywords)} * 0.05
-            -- category는 가중치 0으로 제외됨
-        ) AS precise_similarity_score
-    FROM legal_consultation
-    WHERE 
-        title % ANY(ARRAY[{formatted_keywords}])
-        OR question % ANY(ARRAY[{formatted_keywords}])
-        OR answer % ANY(ARRAY[{formatted_keywords}])
-        OR sub_category % ANY(ARRAY[{formatted_keywords}])
-    ORDER BY precise_similarity_score DESC
-    LIMIT 5;
-    """
-
-    # print(f"✅ [async_search_consultation] 실행된 쿼리: \n{query}")  # 🔥 쿼리 로그 추가
-
-    # ✅ 상담 데이터 검색 실행
-    consultation_results = await loop.run_in_executor(
-        executor, execute_sql, query, None, False
-    )
+    """비동기 SQL 상담 검색 (trigram 인덱스 후보 선별 + 가중 word_similarity 순위)"""
+    # ✅ 키워드는 문자열 삽입 없이 바인드 파라미터로 전달 (비동기 엔진에서 바로 실행)
+    consultation_results = await search_consultation_candidates_async(keywords, limit=5)
 
     if not consultation_results:
         # print("❌ [SQL 검색 실패] 상담 데이터를 찾을 수 없습니다.")
@@ -170,80 +123,15 @@ async def async_search_consultation(keywords):
 
 
 # ------------------ 정밀 서치 판례 쿼리---------------------------------------------
-async def async_search_precedent(categories, titles, user_input_keywords):
-    """비동기 SQL 판례 검색 (카테고리 + 제목 + 사용자 입력 키워드 기반, 최신 10%만 필터링)"""
-    loop = asyncio.get_running_loop()
-
-    def extract_words(text):
-        return re.findall(r"\b\w+\b", text)
-
-    title_words = set()
-    category_words = set()
-
-    for title in titles:
-        title_words.update(extract_words(title))
-    for category in categories:
-        category_words.update(extract_words(category))
-
-    formatted_categories = ", ".join(f"'{c}'" for c in category_words)
-    formatted_titles = ", ".join(f"'{t}'" for t in title_words)
-    formatted_user_keywords = ", ".join(f"'{kw}'" for kw in user_input_keywords)
-
-    query = f"""
-    SET pg_trgm.similarity_threshold = 0.3;
-
-    WITH top_10_percent AS (
-        SELECT *
-        FROM precedent
-        ORDER BY j_date DESC
-    ),
-
-    filtered_precedents AS (
-        SELECT id, c_number, c_type, j_date, court, c_name, d_link,
-            (
-                -- c_name 가중치 (0.7)
-                ({" + ".join([f"COALESCE(similarity(c_name, '{kw}'), 0)" for kw in user_input_keywords])}) / {len(user_input_keywords)} * 0.7
-                +
-                -- c_number 가중치 (0.15)
-                ({" + ".join([f"COALESCE(similarity(c_number, '{kw}'), 0)" for kw in user_input_keywords])}) / {len(user_input_keywords)} * 0.15
-                +
-                -- court 가중치 (0.05)
-                ({" + ".join([f"COALESCE(similarity(court, '{kw}'), 0)" for kw in user_input_keywords])}) / {len(user_input_keywords)} * 0.05
-                +
-                -- c_type 가중치 (0.05)
-                ({" + ".join([f"COALESCE(similarity(c_type, '{kw}'), 0)" for kw in user_input_keywords])}) / {len(user_input_keywords)} * 0.05
-            ) AS weighted_score
-        FROM top_10_percent
-        WHERE (
-            c_name % ANY(ARRAY[{formatted_user_keywords}])
-            OR c_name % ANY(ARRAY[{formatted_titles}])
-            OR c_name % ANY(ARRAY[{formatted_categories}])
-        )
-        ORDER BY weighted_score DESC
-        LIMIT 10
-    )
-
-    SELECT fp.id, fp.c_number, fp.c_type, fp.j_date, fp.court, fp.c_name, fp.d_link,
-        (
-            -- c_name 가중치 (0.7)
-            ({" + ".join([f"COALESCE(similarity(fp.c_name, '{kw}'), 0)" for kw in user_input_keywords])}) / {len(user_input_keywords)} * 0.7
-            +
-            -- c_number 가중치 (0.15)
-            ({" + ".join([f"COALESCE(similarity(fp.c_number, '{kw}'), 0)" for kw in user_input_keywords])}) / {len(user_input_keywords)} * 0.15
-            +
-            -- court 가중치 (0.05)
-            ({" + ".join([f"COALESCE(similarity(fp.court, '{kw}'), 0)" for kw in user_input_keywords])}) / {len(user_input_keywords)} * 0.05
-            +
-            -- c_type 가중치 (0.05)
-            ({" + ".join([f"COALESCE(similarity(fp.c_type, '{kw}'), 0)" for kw in user_input_keywords])}) / {len(user_input_keywords)} * 0.05
-        ) AS final_weighted_score
-    FROM filtered_precedents fp
-    ORDER BY final_weighted_score DESC
-    LIMIT 5;
-    """
-
-    precedent_results = await loop.run_in_executor(
-        executor, execute_sql, query, None, False
+async def async_search_precedent(
+    categories,
+    titles,
+    user_input_keywords,
+    recent_years: Optional[int] = PRECEDENT_SEARCH_RECENT_YEARS,
+):
+    """비동기 SQL 판례 검색 (카테고리 + 제목 + 사용자 입력 키워드 기반, 최근 recent_years 년만 필터링)"""
+    precedent_results = await search_precedent_candidates_async(
+        categories, titles, user_input_keywords, recent_years
     )
 
     return precedent_results
@@ -281,77 +169,90 @@ async def search_tavily_for_precedents(precedent: dict):
 
     casenote_url = f"https://law.go.kr/LSW/precInfoP.do?precSeq={prec_seq}"
 
-    # 🔍 Tavily 호출
-    search_tool = LawGoKRTavilySearch(max_results=5)
+    # 🔍 Tavily 호출 (precSeq 기준으로 캐시 → 같은 판례는 다시 검색하지 않음)
     query_path = f"/LSW/precInfoP.do?precSeq={prec_seq}"
 
-    try:
-        results = search_tool.run(query_path)
-
-        if isinstance(results, list):
-            for result in results:
-                url = result.get("url", "")
-                content = (
-                    result.get("content") or result.get("snippet") or result.get("text")
-                )
+    async def fetch():
+        results = await tavily_search(
+            f"{LAW_GO_KR_SITE_FILTER} {query_path}", max_results=5
+        )
+        for result in _filter_law_go_kr(results):
+            url = result.get("url", "")
+            content = (
+                result.get("content") or result.get("snippet") or result.get("text")
+            )
 
-                if url and f"precSeq={prec_seq}" in url and content:
-                    tavily_result = content
-                    casenote_url = url
-                    break
-        elif isinstance(results, str):
-            pass  # Tavily 오류 메시지 무시
+            if url and f"precSeq={prec_seq}" in url and content:
+                return {"summary": content, "url": url}
+        # 못 찾은 결과는 캐시하지 않음 (일시적으로 빈 결과가 TTL 동안 고정되지 않도록)
+        raise LookupError(f"precSeq={prec_seq} 요약 없음")
 
+    try:
+        found = await cached_tavily_call(precedent_cache_key(prec_seq), fetch)
+        if found.get("summary"):  # 이전 버전이 디스크에 남긴 빈 결과 대비
+            tavily_result = found["summary"]
+            casenote_url = found["url"]
     except Exception:
-        pass  # Tavily 요청 실패 무시
+        pass  # Tavily 요청 실패 / 결과 없음 무시 (둘 다 캐시하지 않음)
 
     return tavily_result, casenote_url
 
 
-
 # ---------------------------------------------------------------------------------
+LAW_GO_KR_SITE_FILTER = "site:law.go.kr"
+
+
+def _filter_law_go_kr(results):
+    """`law.go.kr`이 포함된 결과만 필터링"""
+    return [
+        result
+        for result in results
+        if isinstance(result, dict)
+        and "url" in result
+        and "law.go.kr" in result["url"]
+    ]
+
+
 class LawGoKRTavilySearch:
     """
     Tavily를 사용하여 law.go.kr에서만 검색하도록 제한하는 클래스
+    (공용 httpx 커넥션 풀 + 결과 캐시를 사용하므로 호출마다 만들어도 비용이 없음)
     """
 
     def __init__(self, max_results=1):  # ✅ 검색 결과 개수 조정 가능
-        self.search_tool = TavilySearchResults(max_results=max_results)
+        self.max_results = max_results
+
+    def _handle(self, results):
+        # ✅ 응답이 리스트인지 확인
+        if not isinstance(results, list):
+            return f"❌ Tavily 검색 오류: 결과가 리스트가 아닙니다. ({type(results)})"
+
+        filtered_results = _filter_law_go_kr(results)
+
+        # ✅ 검색 결과가 없을 경우 처리
+        if not filtered_results:
+            return "❌ 관련 법률 정보를 찾을 수 없습니다."
+
+        return filtered_results
 
     def run(self, query):
         """
-        Tavily를 사용하여 특정 URL(law.go.kr)에서만 검색 실행
+        Tavily를 사용하여 특정 URL(law.go.kr)에서만 검색 실행 (동기)
         """
         # ✅ 특정 사이트(law.go.kr)에서만 검색하도록 site 필터 적용
-        site_restrict_query = f"site:law.go.kr {query}"
+        site_restrict_query = f"{LAW_GO_KR_SITE_FILTER} {query}"
 
         try:
-            # ✅ Tavily 검색 실행
-            results = self.search_tool.run(site_restrict_query)
-
-            # ✅ 결과 출력 (디버깅용)
-            # print("🔍 Tavily 응답:", results)
-
-            # ✅ 응답이 리스트인지 확인
-            if not isinstance(results, list):
-                return (
-                    f"❌ Tavily 검색 오류: 결과가 리스트가 아닙니다. ({type(results)})"
-                )
-
-            # ✅ `law.go.kr`이 포함된 결과만 필터링
-            filtered_results = [
-                result
-                for result in results
-                if isinstance(result, dict)
-                and "url" in result
-                and "law.go.kr" in result["url"]
-            ]
+            return self._handle(tavily_search_sync(site_restrict_query, self.max_results))
+        except Exception as e:
+            return f"❌ Tavily 검색 오류: {str(e)}"
 
-            # ✅ 검색 결과가 없을 경우 처리
-            if not filtered_results:
-                return "❌ 관련 법률 정보를 찾을 수 없습니다."
+    async def arun(self, query):
+        """run 의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        site_restrict_query = f"{LAW_GO_KR_SITE_FILTER} {query}"
 
-            return filtered_results
+        try:
+            return self._handle(await tavily_search(site_restrict_query, self.max_results))
         except Exception as e:
             return f"❌ Tavily 검색 오류: {str(e)}"
 
@@ -360,31 +261,26 @@ search_tool = LawGoKRTavilySearch(max_results=1)
 #---------------------------------------------------------------
 
 # ----------------------------------------------------------------
-es: AsyncElasticsearch = None
+ES_CONSULTATION_INDEX = "es_legal_consultation"
 def inject_es_client(client: AsyncElasticsearch):
-    global es
-    es = client
-# ----------------------------------------------------------------
-def init_es_client():
-    """ES 클라이언트를 내부에서 초기화하고 전역에 주입"""
-    global es
-    es = AsyncElasticsearch(
-        hosts=[ES_HOST],
-        basic_auth=(ES_USER, ES_PASSWORD),
-        verify_certs=False,
-    )
-    # print("✅ ES 클라이언트 초기화 완료")
-
-init_es_client()
+    """ES 클라이언트 주입 (클라이언트 생성 / 종료는 app.core.es + FastAPI lifespan 에서 관리)"""
+    set_es_client(client)
 #----------------------------------------------------------------
-async def async_ES_search(keywords):
-    """Elasticsearch 기반 상담 검색 (LLM 입력 최적화)"""
-    index_name = "es_legal_consultation"
+# ✅ ES 응답 크기 제한: 본문(question / answer)은 _source 로 받지 않고
+#    하이라이트 조각(필드별 글자 수 예산)만 받는다. (no_match_size → 매칭이 없으면 앞부분)
+ES_SEARCH_QUESTION_CHARS = int(os.getenv("ES_SEARCH_QUESTION_CHARS", "300"))
+ES_SEARCH_ANSWER_CHARS = int(os.getenv("ES_SEARCH_ANSWER_CHARS", "800"))
+ES_SEARCH_ONE_CHARS = int(os.getenv("ES_SEARCH_ONE_CHARS", "50"))
 
-    # print(f"✅ [search_keywords 확인]: {keywords}")
-    # print(f"🔍 [ES 검색 시작] 키워드: {keywords}")
+# ✅ 같은 턴에서 여러 에이전트가 같은 키워드로 검색하므로 결과를 짧게 캐시
+ES_CACHE_TTL = float(os.getenv("ES_CACHE_TTL", "300"))
+ES_CACHE_SIZE = int(os.getenv("ES_CACHE_SIZE", "512"))
+es_result_cache = AsyncTTLCache("es_legal_consultation", ttl=ES_CACHE_TTL, maxsize=ES_CACHE_SIZE)
 
-    must_clauses = [
+
+def _consultation_must_clauses(keywords):
+    """키워드별 multi_match (title / sub_category 가중)"""
+    return [
         {
             "multi_match": {
                 "query": kw,
@@ -401,13 +297,65 @@ async def async_ES_search(keywords):
         for kw in keywords
     ]
 
-    query_body = {
-        "size": 3,  # 🔒 고정된 갯수로 제한
-        "query": {"bool": {"must": must_clauses}},
+
+def _budget_highlight(budgets: dict, plain: bool = True):
+    """
+    필드별 글자 수 예산(budgets)에 맞춘 하이라이트 설정.
+    plain=True 면 <em> 태그 없이 원문 조각만 반환 (프롬프트에 그대로 넣는 용도)
+    """
+    highlight = {
+        "fields": {
+            field: {
+                "fragment_size": budget,
+                "number_of_fragments": 1,
+                "no_match_size": budget,
+            }
+            for field, budget in budgets.items()
+        }
+    }
+    if plain:
+        highlight["pre_tags"] = [""]
+        highlight["post_tags"] = [""]
+    return highlight
+
+
+def _consultation_query_body(keywords, size, budgets: dict, plain: bool = True):
+    """title 만 _source 로, 나머지 필드는 예산 크기의 하이라이트로 요청"""
+    return {
+        "size": size,
+        "query": {"bool": {"must": _consultation_must_clauses(keywords)}},
+        "_source": {"includes": ["title"]},
+        "highlight": _budget_highlight(budgets, plain=plain),
     }
 
-    try:
-        response = await es.search(index=index_name, body=query_body)
+
+def _hit_fragment(hit, field, budget):
+    fragments = hit.get("highlight", {}).get(field) or [""]
+    return fragments[0][:budget]
+
+
+def _es_cache_key(shape, keywords):
+    """정규화된 키워드(공백 정리 + 정렬, must 절 순서와 무관) + 쿼리 형태"""
+    normalized = tuple(sorted(" ".join(str(kw).split()) for kw in keywords))
+    return (shape, normalized)
+
+
+async def _cached_es_call(shape, keywords, fetch):
+    """캐시 조회 → 없으면 fetch (동시 동일 요청은 한 번만 실행). 호출자별 사본을 반환"""
+    result = await es_result_cache.get_or_set(_es_cache_key(shape, keywords), fetch)
+    return copy.deepcopy(result)
+
+
+async def async_ES_search(keywords):
+    """Elasticsearch 기반 상담 검색 (LLM 입력 최적화: 필드별 글자 수 예산)"""
+    budgets = {"question": ES_SEARCH_QUESTION_CHARS, "answer": ES_SEARCH_ANSWER_CHARS}
+    query_body = _consultation_query_body(keywords, 3, budgets)  # 🔒 고정된 갯수로 제한
+
+    # print(f"✅ [search_keywords 확인]: {keywords}")
+    # print(f"🔍 [ES 검색 시작] 키워드: {keywords}")
+
+    async def fetch():
+        response = await get_es_client().search(index=ES_CONSULTATION_INDEX, body=query_body)
         hits = response["hits"]["hits"]
 
         if not hits:
@@ -415,21 +363,20 @@ async def async_ES_search(keywords):
             return []
 
         # ✅ LLM 입력용 간결한 구조
-        results = [
-            {
-                "title": hit["_source"].get("title", ""),
-                "question": hit["_source"].get("question", ""),
-                "answer": hit["_source"].get("answer", ""),
-            }
-            for hit in hits
-            if hit["_source"].get("title")
-            and hit["_source"].get("question")
-            and hit["_source"].get("answer")
-        ]
+        results = []
+        for hit in hits:
+            title = hit["_source"].get("title", "")
+            question = _hit_fragment(hit, "question", ES_SEARCH_QUESTION_CHARS)
+            answer = _hit_fragment(hit, "answer", ES_SEARCH_ANSWER_CHARS)
+
+            if title and question and answer:
+                results.append({"title": title, "question": question, "answer": answer})
 
         # print(f"✅ [ES 결과 {len(results)}건 확보 완료]")
         return results
 
+    try:
+        return await _cached_es_call("search", keywords, fetch)
     except Exception as e:
         # print(f"❌ [ES 검색 오류]: {e}")
         return []
@@ -437,35 +384,14 @@ async def async_ES_search(keywords):
 
 async def async_ES_search_one(keywords):
     """Elasticsearch 기반 상담 검색 (LLM 입력 최적화: 50글자 제한)"""
-    index_name = "es_legal_consultation"
+    budgets = {"question": ES_SEARCH_ONE_CHARS, "answer": ES_SEARCH_ONE_CHARS}
+    query_body = _consultation_query_body(keywords, 1, budgets)  # 🔒 고정된 결과 수
 
     # print(f"✅ [search_keywords 확인]: {keywords}")
     # print(f"🔍 [ES 검색 시작] 키워드: {keywords}")
 
-    must_clauses = [
-        {
-            "multi_match": {
-                "query": kw,
-                "fields": [
-                    "title^2",
-                    "sub_category^1.5",
-                    "question",
-                    "answer",
-                ],
-                "type": "most_fields",
-                "operator": "or",
-            }
-        }
-        for kw in keywords
-    ]
-
-    query_body = {
-        "size": 1,  # 🔒 고정된 결과 수
-        "query": {"bool": {"must": must_clauses}},
-    }
-
-    try:
-        response = await es.search(index=index_name, body=query_body)
+    async def fetch():
+        response = await get_es_client().search(index=ES_CONSULTATION_INDEX, body=query_body)
         hits = response["hits"]["hits"]
         max_score = response["hits"].get("max_score", 0.0)
 
@@ -478,10 +404,9 @@ async def async_ES_search_one(keywords):
 
         results = []
         for hit in hits:
-            src = hit["_source"]
-            title = src.get("title", "")
-            question = src.get("question", "")[:50]
-            answer = src.get("answer", "")[:50]
+            title = hit["_source"].get("title", "")
+            question = _hit_fragment(hit, "question", ES_SEARCH_ONE_CHARS)
+            answer = _hit_fragment(hit, "answer", ES_SEARCH_ONE_CHARS)
 
             if title and question and answer:
                 results.append(
@@ -495,75 +420,110 @@ async def async_ES_search_one(keywords):
         # print(f"✅ [ES 결과 {len(results)}건 확보 완료] (max_score={max_score})")
         return {"max_score": max_score, "hits": results}
 
+    try:
+        return await _cached_es_call("search_one", keywords, fetch)
     except Exception as e:
         # print(f"❌ [ES 검색 오류]: {e}")
         return {"max_score": 0.0, "hits": []}
 
 # ------------------------------------------------------------------------------
 
+def _updater_query_body(keywords, fragment_size=100):
+    # 하이라이트 태그(<em>)는 유지 (호출하는 쪽에서 제거)
+    budgets = {"question": fragment_size, "answer": fragment_size}
+    return _consultation_query_body(keywords, 1, budgets, plain=False)
+
+
+def _parse_updater_response(response):
+    """search / msearch 개별 응답 → {"max_score", "hits"}"""
+    hits = response["hits"]["hits"]
+    max_score = response["hits"].get("max_score", 0.0)
+
+    if not hits:
+        return {"max_score": 0.0, "hits": []}
+
+    results = []
+    for hit in hits:
+        title = hit["_source"].get("title", "")
+        highlight = hit.get("highlight", {})
+
+        # no_match_size 로 매칭이 없어도 앞부분 조각이 내려옴
+        question_highlight = (highlight.get("question") or [""])[0]
+        answer_highlight = (highlight.get("answer") or [""])[0]
+
+        if title:
+            results.append(
+                {
+                    "title": title,
+                    "question_snippet": question_highlight,
+                    "answer_snippet": answer_highlight,
+                }
+            )
+
+    return {"max_score": max_score, "hits": results}
+
+
 async def async_ES_search_updater(keywords, fragment_size=100):
     """Elasticsearch 기반 상담 검색 (LLM 입력 최적화: 최대 100글자 하이라이트)"""
-    index_name = "es_legal_consultation"
 
-    must_clauses = [
-        {
-            "multi_match": {
-                "query": kw,
-                "fields": [
-                    "title^2",
-                    "sub_category^1.5",
-                    "question",
-                    "answer",
-                ],
-                "type": "most_fields",
-                "operator": "or",
-            }
-        }
-        for kw in keywords
-    ]
-
-    query_body = {
-        "size": 1,
-        "query": {"bool": {"must": must_clauses}},
-        "highlight": {
-            "fields": {
-                "question": {"fragment_size": fragment_size, "number_of_fragments": 1},
-                "answer": {"fragment_size": fragment_size, "number_of_fragments": 1},
-            }
-        },
-    }
+    async def fetch():
+        response = await get_es_client().search(
+            index=ES_CONSULTATION_INDEX,
+            body=_updater_query_body(keywords, fragment_size),
+        )
+        return _parse_updater_response(response)
 
     try:
-        response = await es.search(index=index_name, body=query_body)
-        hits = response["hits"]["hits"]
-        max_score = response["hits"].get("max_score", 0.0)
+        return await _cached_es_call(("updater", fragment_size), keywords, fetch)
+    except Exception as e:
+        return {"max_score": 0.0, "hits": []}
 
-        if not hits:
-            return {"max_score": 0.0, "hits": []}
+# ------------------------------------------------------------------------------
 
-        results = []
-        for hit in hits:
-            src = hit["_source"]
-            title = src.get("title", "")
-            highlight = hit.get("highlight", {})
-
-            question_highlight = highlight.get(
-                "question", [src.get("question", "")[:fragment_size]]
-            )[0]
-            answer_highlight = highlight.get(
-                "answer", [src.get("answer", "")[:fragment_size]]
-            )[0]
-
-            if title:
-                results.append(
-                    {
-                        "title": title,
-                        "question_snippet": question_highlight,
-                        "answer_snippet": answer_highlight,
-                    }
-                )
+async def async_ES_msearch_updater(keyword_groups, fragment_size=100):
+    """
+    async_ES_search_updater 의 배치 버전 (_msearch 1회 왕복).
+    keyword_groups 의 각 키워드 리스트마다 {"max_score", "hits"} 를 같은 순서로 반환.
+    캐시에 있는 그룹은 제외하고 나머지만 한 번에 요청한다.
+    """
+    empty = {"max_score": 0.0, "hits": []}
+    if not keyword_groups:
+        return []
 
-        return {"max_score": max_score, "hits": results}
+    shape = ("updater", fragment_size)
+    results = [None] * len(keyword_groups)
+    missing = []
+    for i, keywords in enumerate(keyword_groups):
+        cached = es_result_cache.lookup(_es_cache_key(shape, keywords))
+        if cached is None:
+            missing.append(i)
+        else:
+            results[i] = copy.deepcopy(cached)
+
+    if not missing:
+        return results
+
+    searches = []
+    for i in missing:
+        searches.append({"index": ES_CONSULTATION_INDEX})
+        searches.append(_updater_query_body(keyword_groups[i], fragment_size))
 
+    try:
+        response = await get_es_client().msearch(body=searches)
+        responses = response["responses"]
     except Exception as e:
-        return {"max_score": 0.0, "hits": []}
+        responses = [{"error": str(e)}] * len(missing)
+
+    for i, item in zip(missing, responses):
+        # ✅ 그룹별 오류는 해당 그룹만 빈 결과로 처리 (캐시에는 저장하지 않음)
+        if "error" in item:
+            results[i] = dict(empty)
+            continue
+        try:
+            parsed = _parse_updater_response(item)
+        except (KeyError, IndexError, TypeError):
+            results[i] = dict(empty)
+            continue
+        es_result_cache.set(_es_cache_key(shape, keyword_groups[i]), parsed)
+        results[i] = copy.deepcopy(parsed)
+    return results
@@ -0,0 +1,93 @@
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Tuple
+from langchain_core.documents import Document
+from app.chatbot.tool_agents.utils.utils import kiwi, faiss_kiwi
+
+# ✅ 같은 질문이 /initial, /prepare, /advanced 로 연달아 들어오므로 짧게 메모이즈
+QUERY_ANALYSIS_TTL = 300
+QUERY_ANALYSIS_MAX_SIZE = 256
+LEGAL_RATIO_THRESHOLD = 0.3
+
+
+@dataclass
+class QueryAnalysis:
+    """
+    한 턴(사용자 질문)에 대한 키워드 분석 결과.
+    LLM1(run_initial_controller) / LLM2(run_full_consultation) 가 같은 결과를 공유한다.
+    """
+
+    user_query: str
+    tokens: List[Tuple[str, str]] = field(default_factory=list)  # (form, tag)
+    nouns: List[str] = field(default_factory=list)  # NNG / NNP 전체
+    query_keywords: List[str] = field(default_factory=list)  # 질문 명사 상위 5개
+    neighbours: List[Document] = field(default_factory=list)  # FAISS 유사 문서 (k=15)
+    faiss_keywords: List[str] = field(default_factory=list)  # 유사 문서 명사 상위 5개
+    adjusted_keywords: List[str] = field(default_factory=list)  # 최종 검색 키워드
+    legal_score: float = 0.0
+    query_type: str = "nonlegal"  # legal / nonlegal
+
+
+def analyze_query(user_query: str, faiss_db, top_k: int = 5) -> QueryAnalysis:
+    """
+    faiss_kiwi.extract_top_keywords_faiss + classify_legal_query 를 한 번에 수행.
+    (질문 토큰화 1회, FAISS 검색 1회, 유사 문서 토큰화 1회)
+    """
+    tokens = [(token.form, token.tag) for token in kiwi.tokenize(user_query)]
+    nouns = [form for form, tag in tokens if tag in ("NNG", "NNP")]
+    query_keywords = nouns[:top_k]
+
+    neighbours = faiss_db.similarity_search(user_query, k=15)
+    all_text = " ".join(doc.page_content for doc in neighbours)
+    faiss_keywords = faiss_kiwi.extract_keywords(all_text, top_k)
+    adjusted_keywords = list(set(query_keywords + faiss_keywords))
+
+    legal_terms = set(adjusted_keywords)
+    legal_score = sum(1 for kw in query_keywords if kw in legal_terms) / max(
+        len(query_keywords), 1
+    )
+    # ✅ classify_legal_query 와 동일 기준 (질문 명사 중 법률 키워드 비율)
+    if nouns:
+        ratio = sum(1 for word in nouns if word in legal_terms) / len(nouns)
+        query_type = "legal" if ratio >= LEGAL_RATIO_THRESHOLD else "nonlegal"
+    else:
+        query_type = "nonlegal"
+
+    return QueryAnalysis(
+        user_query=user_query,
+        tokens=tokens,
+        nouns=nouns,
+        query_keywords=query_keywords,
+        neighbours=neighbours,
+        faiss_keywords=faiss_keywords,
+        adjusted_keywords=adjusted_keywords,
+        legal_score=legal_score,
+        query_type=query_type,
+    )
+
+
+_cache: "OrderedDict[tuple, Tuple[float, QueryAnalysis]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_query_analysis(user_query: str, faiss_db) -> QueryAnalysis:
+    """analyze_query 결과를 (질문, 인덱스) 기준으로 재사용"""
+    key = (user_query.strip(), id(faiss_db))
+    now = time.monotonic()
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and now - cached[0] < QUERY_ANALYSIS_TTL:
+            _cache.move_to_end(key)
+            return cached[1]
+
+    analysis = analyze_query(user_query, faiss_db)
+
+    with _cache_lock:
+        _cache[key] = (now, analysis)
+        _cache.move_to_end(key)
+        while len(_cache) > QUERY_ANALYSIS_MAX_SIZE:
+            _cache.popitem(last=False)
+    return analysis
@@ -2,9 +2,8 @@ import re
 from kiwipiepy import Kiwi
 from typing import List, Set, Dict
 from collections import Counter
-import asyncio
-from app.chatbot.memory.global_cache import store_template_in_memory
-from app.chatbot.tool_agents.tools import async_ES_search_updater
+from app.chatbot.memory.global_cache import DEFAULT_SESSION_ID, store_template_in_memory
+from app.chatbot.tool_agents.tools import async_ES_msearch_updater
 
 kiwi = Kiwi()
 
@@ -221,13 +220,14 @@ def extract_top_keywords(text_blocks: list[dict], top_k=5) -> list[str]:
 #         }
 #     )
 
-async def update_llm2_template_with_es(template_data: Dict, user_query: str) -> None:
+async def update_llm2_template_with_es(
+    template_data: Dict, user_query: str, session_id: str = DEFAULT_SESSION_ID
+) -> None:
     template = template_data.get("template", {}) or {}
     strategy = template_data.get("strategy", {}) or {}
     precedent = template_data.get("precedent", {}) or {}
 
-    async def get_snippet(texts, fragment_size=20):
-        es_result = await async_ES_search_updater(texts, fragment_size=fragment_size)
+    def get_snippet(es_result):
         hits = es_result.get("hits", [])
         if hits:
             snippet = hits[0].get("answer_snippet", "") or hits[0].get(
@@ -236,30 +236,41 @@ async def update_llm2_template_with_es(template_data: Dict, user_query: str) ->
             return re.sub(r"</?em>", "", snippet)
         return "기본"
 
+    # ✅ 5개 필드 검색을 _msearch 한 번으로 처리 (순서 = 아래 할당 순서)
+    es_results = await async_ES_msearch_updater(
+        [
+            [user_query, template.get("summary", "")],  # summary
+            [
+                template.get("explanation", ""),
+                strategy.get("final_strategy_summary", ""),
+            ],  # explanation
+            [template.get("ref_question", "")],  # ref_question
+            [
+                strategy.get("final_strategy_summary", ""),
+                " ".join(strategy.get("decision_tree", [])),
+            ],  # final_strategy_summary
+            [precedent.get("summary", ""), precedent.get("title", "")],  # precedent
+        ],
+        fragment_size=20,
+    )
+    (
+        summary_snippet,
+        explanation_snippet,
+        ref_snippet,
+        strategy_snippet,
+        precedent_snippet,
+    ) = [get_snippet(es_result) for es_result in es_results]
+
     # ✅ Summary
-    summary_snippet = await get_snippet([user_query, template.get("summary", "")])
     template["summary"] = f"updated.summary.from.es: {summary_snippet[:50]}"
 
     # ✅ Explanation
-    explanation_snippet = await get_snippet(
-        [
-            template.get("explanation", ""),
-            strategy.get("final_strategy_summary", ""),
-        ]
-    )
     template["explanation"] = f"updated.explanation.from.es: {explanation_snippet[:50]}"
 
     # ✅ Ref question
-    ref_snippet = await get_snippet([template.get("ref_question", "")])
     template["ref_question"] = f"updated.ref_question.from.es: {ref_snippet[:50]}"
 
     # ✅ Strategy summary
-    strategy_snippet = await get_snippet(
-        [
-            strategy.get("final_strategy_summary", ""),
-            " ".join(strategy.get("decision_tree", [])),
-        ]
-    )
     strategy["final_strategy_summary"] = (
         f"updated.strategy.from.es: {strategy_snippet[:50]}"
     )
@@ -269,14 +280,11 @@ async def update_llm2_template_with_es(template_data: Dict, user_query: str) ->
     # ]
 
     # ✅ Precedent
-    precedent_snippet = await get_snippet(
-        [precedent.get("summary", ""), precedent.get("title", "")]
-    )
     precedent["summary"] = f"updated.precedent.from.es: {precedent_snippet[:50]}"
     prec_keywords = faiss_kiwi.extract_keywords(precedent_snippet, top_k=3)
     precedent["title"] = f"{prec_keywords[0]} 관련 증강 판례"
 
-    store_template_in_memory(
+    await store_template_in_memory(
         {
             "built": True,
             "built_by_llm2": True,
@@ -284,7 +292,8 @@ async def update_llm2_template_with_es(template_data: Dict, user_query: str) ->
             "template": template,
             "strategy": strategy,
             "precedent": precedent,
-        }
+        },
+        session_id,
     )
 
 
@@ -459,16 +468,13 @@ async def update_llm2_template_with_es(template_data: Dict, user_query: str) ->
 #     )
 
 async def evalandsave_llm2_template_with_es(
-    template_data: Dict, user_query: str
+    template_data: Dict, user_query: str, session_id: str = DEFAULT_SESSION_ID
 ) -> None:
     template = template_data.get("template", {}) or {}
     strategy = template_data.get("strategy", {}) or {}
     precedent = template_data.get("precedent", {}) or {}
 
-    async def get_field_snippet(query_texts, target_field, fragment_size=50):
-        es_result = await async_ES_search_updater(
-            query_texts, fragment_size=fragment_size
-        )
+    def get_field_snippet(es_result, target_field):
         hits = es_result.get("hits", [])
         max_score = es_result.get("max_score", 0)
 
@@ -481,33 +487,37 @@ async def evalandsave_llm2_template_with_es(
 
         return clean_snippet[:50], max_score
 
-    tasks = await asyncio.gather(
-        # 필드와 ES 필드를 명확히 매핑
-        get_field_snippet(
-            [user_query, template.get("summary", "")], "answer"
-        ),  # summary
-        get_field_snippet(
+    # 필드와 ES 필드를 명확히 매핑 (6개 검색을 _msearch 한 번으로 처리)
+    field_queries = [
+        ([user_query, template.get("summary", "")], "answer"),  # summary
+        (
             [
                 template.get("explanation", ""),
                 strategy.get("final_strategy_summary", ""),
             ],
             "answer",
         ),  # explanation
-        get_field_snippet(
-            [template.get("ref_question", "")], "question"
-        ),  # ref_question
-        get_field_snippet(
+        ([template.get("ref_question", "")], "question"),  # ref_question
+        (
             [
                 strategy.get("final_strategy_summary", ""),
                 " ".join(strategy.get("decision_tree", [])),
             ],
             "answer",
         ),  # final_strategy_summary
-        get_field_snippet(
-            [precedent.get("summary", ""), precedent.get("title", "")], "answer"
+        (
+            [precedent.get("summary", ""), precedent.get("title", "")],
+            "answer",
         ),  # precedent.summary
-        get_field_snippet([precedent.get("title", "")], "title"),  # precedent.title
+        ([precedent.get("title", "")], "title"),  # precedent.title
+    ]
+    es_results = await async_ES_msearch_updater(
+        [query_texts for query_texts, _ in field_queries], fragment_size=50
     )
+    tasks = [
+        get_field_snippet(es_result, target_field)
+        for es_result, (_, target_field) in zip(es_results, field_queries)
+    ]
 
     # 결과 필드 할당 (명확한 대응 관계 유지)
     (summary_snippet, summary_score) = tasks[0]
@@ -537,7 +547,7 @@ async def evalandsave_llm2_template_with_es(
     precedent["title"] = f"{precedent_title_snippet[:50]}"
 
     # 메모리에 저장
-    store_template_in_memory(
+    await store_template_in_memory(
         {
             "built": True,
             "built_by_llm2": True,
@@ -545,7 +555,8 @@ async def evalandsave_llm2_template_with_es(
             "template": template,
             "strategy": strategy,
             "precedent": precedent,
-        }
+        },
+        session_id,
     )
 
 
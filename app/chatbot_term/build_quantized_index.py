@@ -0,0 +1,99 @@
+"""
+기존 flat FAISS 벡터스토어를 IVF 양자화 인덱스로 변환하는 오프라인 스크립트.
+
+    python -m app.chatbot_term.build_quantized_index --type sq8
+    python -m app.chatbot_term.build_quantized_index --type pq --pq-m 96
+
+생성된 디렉토리는 FAISS_INDEX_FORMAT=ivf 로 서버에서 mmap 로딩된다.
+(app/core/vectorstore.load_quantized_faiss 참고)
+"""
+import os
+import math
+import shutil
+import argparse
+import faiss
+from app.core.vectorstore import DB_FAISS_PATH, DB_FAISS_QUANTIZED_PATH
+
+
+def choose_nlist(ntotal: int) -> int:
+    """벡터 수에 맞는 IVF 클러스터 수 (클러스터당 최소 39개 학습 샘플 확보)"""
+    nlist = int(4 * math.sqrt(ntotal))
+    return max(1, min(nlist, ntotal // 39))
+
+
+def build_quantized_index(
+    flat_index: faiss.Index,
+    index_type: str = "sq8",
+    nlist: int = None,
+    pq_m: int = 96,
+    pq_nbits: int = 8,
+) -> faiss.Index:
+    ntotal, dim = flat_index.ntotal, flat_index.d
+    vectors = flat_index.reconstruct_n(0, ntotal)
+
+    nlist = nlist or choose_nlist(ntotal)
+    metric = flat_index.metric_type
+    quantizer = (
+        faiss.IndexFlatIP(dim) if metric == faiss.METRIC_INNER_PRODUCT else faiss.IndexFlatL2(dim)
+    )
+
+    if index_type == "pq":
+        if dim % pq_m != 0:
+            raise ValueError(f"❌ 차원({dim})이 pq_m({pq_m})로 나누어 떨어지지 않습니다.")
+        # ✅ 학습 샘플이 부족하면 코드북 비트 수를 줄임
+        while pq_nbits > 4 and ntotal < 39 * (1 << pq_nbits):
+            pq_nbits -= 1
+        index = faiss.IndexIVFPQ(quantizer, dim, nlist, pq_m, pq_nbits, metric)
+    elif index_type == "sq8":
+        index = faiss.IndexIVFScalarQuantizer(
+            quantizer, dim, nlist, faiss.ScalarQuantizer.QT_8bit, metric
+        )
+    else:
+        raise ValueError(f"❌ 지원하지 않는 인덱스 타입: {index_type}")
+
+    index.train(vectors)
+    # ✅ 0..n-1 순서대로 추가해야 index.pkl 의 id 매핑이 그대로 유효함
+    index.add(vectors)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FAISS flat → IVF 양자화 인덱스 변환")
+    parser.add_argument("--src", default=DB_FAISS_PATH)
+    parser.add_argument("--dst", default=DB_FAISS_QUANTIZED_PATH)
+    parser.add_argument("--type", choices=["sq8", "pq"], default="sq8")
+    parser.add_argument("--nlist", type=int, default=None)
+    parser.add_argument("--pq-m", type=int, default=96)
+    parser.add_argument("--pq-nbits", type=int, default=8)
+    args = parser.parse_args()
+
+    flat_index = faiss.read_index(os.path.join(args.src, "index.faiss"))
+    print(f"📦 원본 인덱스: {flat_index.ntotal}개 벡터, {flat_index.d}차원")
+
+    index = build_quantized_index(
+        flat_index,
+        index_type=args.type,
+        nlist=args.nlist,
+        pq_m=args.pq_m,
+        pq_nbits=args.pq_nbits,
+    )
+
+    # ✅ 임시 파일에 쓴 뒤 교체 (서버의 hot reload 가 반쯤 쓰인 파일을 읽지 않도록)
+    os.makedirs(args.dst, exist_ok=True)
+    tmp_index = os.path.join(args.dst, "index.faiss.tmp")
+    tmp_pkl = os.path.join(args.dst, "index.pkl.tmp")
+    faiss.write_index(index, tmp_index)
+    shutil.copyfile(os.path.join(args.src, "index.pkl"), tmp_pkl)
+    os.replace(tmp_index, os.path.join(args.dst, "index.faiss"))
+    os.replace(tmp_pkl, os.path.join(args.dst, "index.pkl"))
+
+    src_size = os.path.getsize(os.path.join(args.src, "index.faiss"))
+    dst_size = os.path.getsize(os.path.join(args.dst, "index.faiss"))
+    print(
+        f"✅ 변환 완료 ({args.type}, nlist={faiss.extract_index_ivf(index).nlist}): "
+        f"{src_size / 1e6:.1f}MB → {dst_size / 1e6:.1f}MB ({args.dst})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+양자화 인덱스의 recall@k 를 기존 flat 인덱스와 비교하는 평가 스크립트.
+
+    python -m app.chatbot_term.evaluate_index --k 15 --nprobe 8 16 32
+
+인덱스에 저장된 벡터 일부를 질의로 사용하며 (외부 API 호출 없음),
+자기 자신은 정답/결과 양쪽에서 제외하고 flat 검색 결과를 정답으로 삼는다.
+"""
+import os
+import time
+import argparse
+import numpy as np
+import faiss
+from app.core.vectorstore import DB_FAISS_PATH, DB_FAISS_QUANTIZED_PATH
+
+
+def _drop_self(ids: np.ndarray, query_ids: np.ndarray, k: int) -> list:
+    return [[i for i in row if i != qid and i != -1][:k] for row, qid in zip(ids, query_ids)]
+
+
+def recall_at_k(truth: list, found: list) -> float:
+    hits = sum(len(set(t) & set(f)) for t, f in zip(truth, found))
+    total = sum(len(t) for t in truth)
+    return hits / total if total else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="양자화 FAISS 인덱스 recall 평가")
+    parser.add_argument("--flat", default=DB_FAISS_PATH)
+    parser.add_argument("--quantized", default=DB_FAISS_QUANTIZED_PATH)
+    parser.add_argument("--k", type=int, default=15)  # extract_top_keywords_faiss 와 동일
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    flat = faiss.read_index(os.path.join(args.flat, "index.faiss"))
+    flat_load = time.perf_counter() - started
+
+    started = time.perf_counter()
+    quantized = faiss.read_index(
+        os.path.join(args.quantized, "index.faiss"), faiss.IO_FLAG_MMAP
+    )
+    quantized_load = time.perf_counter() - started
+
+    rng = np.random.default_rng(args.seed)
+    n_queries = min(args.queries, flat.ntotal)
+    query_ids = rng.choice(flat.ntotal, size=n_queries, replace=False)
+    queries = np.vstack([flat.reconstruct(int(i)) for i in query_ids]).astype("float32")
+
+    _, truth_ids = flat.search(queries, args.k + 1)
+    truth = _drop_self(truth_ids, query_ids, args.k)
+
+    print(f"📦 flat: {flat.ntotal}개 / 로드 {flat_load * 1000:.1f}ms / "
+          f"{os.path.getsize(os.path.join(args.flat, 'index.faiss')) / 1e6:.1f}MB")
+    print(f"📦 quantized(mmap): 로드 {quantized_load * 1000:.1f}ms / "
+          f"{os.path.getsize(os.path.join(args.quantized, 'index.faiss')) / 1e6:.1f}MB")
+    print(f"🔍 질의 {n_queries}개, k={args.k}")
+
+    ivf = faiss.extract_index_ivf(quantized)
+    for nprobe in args.nprobe:
+        ivf.nprobe = min(nprobe, ivf.nlist)
+        started = time.perf_counter()
+        _, found_ids = quantized.search(queries, args.k + 1)
+        elapsed = (time.perf_counter() - started) / n_queries
+        found = _drop_self(found_ids, query_ids, args.k)
+        print(
+            f"  nprobe={ivf.nprobe:<4} recall@{args.k}={recall_at_k(truth, found):.4f} "
+            f"질의당 {elapsed * 1000:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,12 @@
-from langchain_community.vectorstores import FAISS
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
 from langchain_core.runnables import RunnableSequence
+from app.core.vectorstore import get_faiss
 
-# 벡터 저장 위치
-DB_FAISS_PATH = "./app/chatbot_term/vectorstore"
 
-# 벡터 DB 로드
-embedding = OpenAIEmbeddings()
-db = FAISS.load_local(DB_FAISS_PATH, embedding, allow_dangerous_deserialization=True)
-retriever = db.as_retriever(search_kwargs={"k": 10})
+# ✅ 챗봇과 같은 공유 벡터스토어 사용 (import 시점 로드 X, 재로딩 반영)
+def get_retriever():
+    return get_faiss().as_retriever(search_kwargs={"k": 10})
 
 # 프롬프트 템플릿
 template = """당신은 법률 분야에 전문적인 지식을 가진 AI 어시스턴트입니다.
@@ -44,7 +41,7 @@ qa_chain = QA_PROMPT | llm
 def get_legal_term_answer(query: str) -> str:
     try:
         # 문서 검색
-        docs = retriever.get_relevant_documents(query)
+        docs = get_retriever().get_relevant_documents(query)
 
         exact_match = None
         partial_matches = []
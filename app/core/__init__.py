@@ -1,6 +1,7 @@
 from .config import (
     # 데이터베이스 설정
     DATABASE_URL,
+    ASYNC_DATABASE_URL,
     DB_HOST,
     DB_NAME,
     DB_USER,
@@ -21,13 +22,18 @@ from .database import (
     Base,
     SessionLocal,
     engine,
+    async_engine,
     get_db,
-    execute_sql
+    execute_sql,
+    execute_sql_async,
+    execute_write_async,
+    get_pool_metrics,
 )
 
 __all__ = [
     # 데이터베이스 설정
     'DATABASE_URL',
+    'ASYNC_DATABASE_URL',
     'DB_HOST',
     'DB_NAME',
     'DB_USER',
@@ -47,6 +53,10 @@ __all__ = [
     'Base',
     'SessionLocal',
     'engine',
+    'async_engine',
     'get_db',
-    'execute_sql'
+    'execute_sql',
+    'execute_sql_async',
+    'execute_write_async',
+    'get_pool_metrics',
 ]
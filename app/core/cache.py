@@ -0,0 +1,102 @@
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+_MISSING = object()
+
+
+class AsyncTTLCache:
+    """
+    비동기 함수 결과용 TTL + LRU 캐시.
+    - ttl(초)이 지난 값은 다시 조회
+    - maxsize 를 넘으면 가장 오래 사용하지 않은 값부터 제거
+    - 같은 키로 동시에 들어온 요청은 진행 중인 한 번의 호출 결과를 공유 (in-flight coalescing)
+    - 호출자 하나가 취소되어도 진행 중인 호출은 계속되어 나머지 호출자에게 결과 전달
+    - factory 가 예외를 던지면 캐시에 저장하지 않고 그대로 전달
+    """
+
+    def __init__(self, name: str, ttl: float = 300, maxsize: int = 512):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._inflight: dict[tuple[int, Hashable], asyncio.Task] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, key: Hashable, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def lookup(self, key: Hashable):
+        """get 과 같지만 hit/miss 통계에 반영 (직접 배치 조회하는 경우용). 없으면 None"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    async def get_or_set(self, key: Hashable, factory: Callable[[], Awaitable[Any]]):
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        # ✅ Future 는 이벤트 루프에 묶이므로 루프별로 진행 중인 요청을 구분
+        loop = asyncio.get_running_loop()
+        inflight_key = (id(loop), key)
+        pending = self._inflight.get(inflight_key)
+        if pending is None:
+            self.misses += 1
+            # ✅ 조회는 독립 태스크로 실행: 처음 요청한 쪽이 취소되어도 기다리는 다른 요청은 결과를 받음
+            pending = loop.create_task(self._fill(key, inflight_key, factory))
+            # 모든 호출자가 취소된 뒤 실패해도 "exception was never retrieved" 경고 방지
+            pending.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._inflight[inflight_key] = pending
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(pending)
+
+    async def _fill(self, key: Hashable, inflight_key, factory: Callable[[], Awaitable[Any]]):
+        try:
+            value = await factory()
+            self.set(key, value)
+            return value
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses + self.coalesced
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "max_size": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+            "hit_rate": round((self.hits + self.coalesced) / total, 4) if total else 0.0,
+        }
@@ -13,6 +13,14 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = os.getenv("DB_PASSWORD")
     DB_PORT: str = os.getenv("DB_PORT", "5432")  # 기본값 5432 설정
 
+    # ✅ 커넥션 풀 설정 (동기: ORM/execute_sql, 비동기: execute_sql_async)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    ASYNC_DB_POOL_SIZE: int = int(os.getenv("ASYNC_DB_POOL_SIZE", "20"))
+    ASYNC_DB_MAX_OVERFLOW: int = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "20"))
+
     # ✅ JWT 시크릿 키
     SECRET_KEY: str = os.getenv("SECRET_KEY", "default_secret_key")  # 기본값 설정
     ALGORITHM: str = "HS256"  # 기본 알고리즘
@@ -21,7 +29,12 @@ class Settings(BaseSettings):
     # ✅ SQLAlchemy에서 사용할 데이터베이스 URL 생성
     @property
     def DATABASE_URL(self):
-        return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        return f"postgresql+psycopg2://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
+    # ✅ 비동기 엔진(asyncpg)용 URL
+    @property
+    def ASYNC_DATABASE_URL(self):
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     
     # 법률상담 챗봇
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY")
@@ -33,6 +46,7 @@ settings = Settings()
 
 # ✅ 다른 모듈에서 사용할 변수들을 명시적으로 export
 DATABASE_URL = settings.DATABASE_URL
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
@@ -2,15 +2,26 @@ from sqlalchemy import create_engine, text, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.exc import SQLAlchemyError 
 from sqlalchemy.orm import sessionmaker
-from .config import DATABASE_URL
+from sqlalchemy.ext.asyncio import create_async_engine
+from .config import DATABASE_URL, ASYNC_DATABASE_URL, settings
 
 # ✅ SQLAlchemy 엔진 생성 (커넥션 풀 설정 추가)
 engine = create_engine(
     DATABASE_URL,
-    pool_size=10,       # 최대 10개의 커넥션 유지
-    max_overflow=20,    # 최대 20개까지 추가 가능
-    pool_timeout=30,    # 30초 동안 연결을 기다림
-    pool_recycle=1800   # 30분마다 커넥션 재사용
+    pool_size=settings.DB_POOL_SIZE,        # 기본 10개의 커넥션 유지
+    max_overflow=settings.DB_MAX_OVERFLOW,  # 기본 20개까지 추가 가능
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # 30초 동안 연결을 기다림
+    pool_recycle=settings.DB_POOL_RECYCLE,  # 30분마다 커넥션 재사용
+)
+
+# ✅ 비동기 엔진 (asyncpg) - 챗봇 / 검색처럼 이벤트 루프에서 직접 SQL을 실행하는 경로용
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=settings.ASYNC_DB_POOL_SIZE,
+    max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
 )
 
 # ✅ ORM을 위한 세션 팩토리 (유저 관리용)
@@ -58,6 +69,65 @@ def execute_sql(query: str, params: dict | None = None, fetch_one: bool = False)
         print(f"SQL 실행 중 오류 발생: {e}")  # 로깅 추가 가능
         return None if fetch_one else []
 
+# ✅ execute_sql 의 비동기 버전 (반환 형태 / 오류 처리 동일)
+async def execute_sql_async(query: str, params: dict | None = None, fetch_one: bool = False):
+    """
+    비동기 엔진으로 SQL 쿼리를 실행하고 결과를 반환하는 함수.
+    스레드 풀 없이 이벤트 루프에서 바로 실행되므로 동시성은 커넥션 풀 크기로만 제한됩니다.
+    오류 발생 시 빈 리스트(fetch_one 이면 None)를 반환합니다.
+    """
+    if params is None:
+        params = {}
+
+    try:
+        async with async_engine.connect() as connection:
+            result = await connection.execute(text(query), params)
+            mapped_result = result.mappings().all()
+
+            if fetch_one:
+                return mapped_result[0] if mapped_result else None
+
+            return mapped_result
+    except SQLAlchemyError as e:
+        print(f"SQL 실행 중 오류 발생: {e}")
+        return None if fetch_one else []
+
+# ✅ 비동기 쓰기 (INSERT / UPDATE / DELETE) - 하나의 트랜잭션으로 커밋
+async def execute_write_async(query: str, params: dict | None = None) -> int:
+    """
+    비동기 엔진으로 쓰기 쿼리를 실행하고 커밋한다.
+    영향받은 행 수를 반환하며, 오류 발생 시 -1 을 반환합니다.
+    """
+    if params is None:
+        params = {}
+
+    try:
+        async with async_engine.begin() as connection:
+            result = await connection.execute(text(query), params)
+            return result.rowcount
+    except SQLAlchemyError as e:
+        print(f"SQL 실행 중 오류 발생: {e}")
+        return -1
+
+# ✅ 커넥션 풀 상태 (모니터링용)
+def _pool_status(pool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+def get_pool_metrics() -> dict:
+    return {
+        "sync": _pool_status(engine.pool),
+        "async": _pool_status(async_engine.sync_engine.pool),
+    }
+
+# ✅ 서버 종료 시 비동기 커넥션 정리
+async def dispose_async_engine():
+    await async_engine.dispose()
+
 # ✅ 테이블 자동 생성 함수 (중복 생성 방지)
 def init_db():
     from app.models.user import User, EmailVerification
@@ -0,0 +1,84 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Optional
+
+
+class SQLiteKVStore:
+    """
+    sqlite 기반 로컬 key-value 저장소 (여러 uvicorn 워커가 같은 파일을 공유).
+    - value 는 bytes 로 저장 (직렬화/압축은 호출하는 쪽에서 결정)
+    - ttl(초)을 지정하면 만료된 값은 조회되지 않음
+    """
+
+    def __init__(self, path: str, table: str = "kv"):
+        if not table.isidentifier():
+            raise ValueError(f"❌ 유효하지 않은 테이블 이름: {table}")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    expires_at REAL
+                )
+                """
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            self.delete(key)
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        try:
+            with self._lock:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, sqlite3.Binary(value), expires_at),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            # ✅ 캐시 저장 실패는 서비스 오류로 취급하지 않음
+            print(f"⚠️ 디스크 캐시 저장 실패 ({self.path}): {e}")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (time.time(),),
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,132 @@
+import os
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Optional
+from langchain_core.embeddings import Embeddings
+from app.core.disk_cache import SQLiteKVStore
+
+# ✅ 임베딩 캐시 설정
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "2048"))
+# 비어 있으면 디스크 캐시 비활성화 (예: ./cache/embeddings.sqlite3)
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "")
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    임베딩 모델을 감싸는 content-addressed 캐시.
+    - 1차: 프로세스 내 LRU
+    - 2차: (선택) sqlite 디스크 캐시 - 워커 간 / 재시작 후에도 재사용
+    키는 (모델명, 텍스트)의 sha256 이므로 같은 질문은 어디서 호출해도 한 번만 임베딩된다.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        model_name: str = "",
+        max_size: int = EMBEDDING_CACHE_SIZE,
+        disk_path: Optional[str] = EMBEDDING_CACHE_PATH,
+    ):
+        self.underlying = underlying
+        self.model_name = model_name or getattr(underlying, "model", "")
+        self.max_size = max_size
+        self._lru: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = SQLiteKVStore(disk_path, table="embeddings") if disk_path else None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------ 키 / 저장
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\x00{text}".encode("utf-8")).hexdigest()
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._lru.get(key)
+            if vector is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return vector
+
+        if self._disk is not None:
+            raw = self._disk.get(key)
+            if raw is not None:
+                vector = array("f", raw).tolist()
+                with self._lock:
+                    self.disk_hits += 1
+                self._put_memory(key, vector)
+                return vector
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _put_memory(self, key: str, vector: List[float]) -> None:
+        with self._lock:
+            self._lru[key] = vector
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_size:
+                self._lru.popitem(last=False)
+
+    def _put(self, key: str, vector: List[float]) -> None:
+        self._put_memory(key, vector)
+        if self._disk is not None:
+            self._disk.set(key, array("f", vector).tobytes())
+
+    # ------------------------------------------------------------------ Embeddings
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = self.underlying.embed_query(text)
+            self._put(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = await self.underlying.aembed_query(text)
+            self._put(key, vector)
+        return vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        vectors = [self._get(key) for key in keys]
+
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            embedded = self.underlying.embed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, embedded):
+                vectors[i] = vector
+                self._put(keys[i], vector)
+        return vectors
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        vectors = [self._get(key) for key in keys]
+
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            embedded = await self.underlying.aembed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, embedded):
+                vectors[i] = vector
+                self._put(keys[i], vector)
+        return vectors
+
+    # ------------------------------------------------------------------ 통계
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.disk_hits + self.misses
+            return {
+                "size": len(self._lru),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.disk_hits) / total, 4) if total else 0.0,
+                "disk_enabled": self._disk is not None,
+            }
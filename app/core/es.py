@@ -0,0 +1,68 @@
+import os
+from typing import Optional
+from elasticsearch import AsyncElasticsearch
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ✅ Elasticsearch 접속 / 커넥션 풀 설정
+ES_HOST = os.getenv("ES_HOST")
+ES_USER = os.getenv("ES_USER")
+ES_PASSWORD = os.getenv("ES_PASSWORD")
+
+ES_CONNECTIONS_PER_NODE = int(os.getenv("ES_CONNECTIONS_PER_NODE", "20"))  # 노드당 keep-alive 커넥션 수
+ES_REQUEST_TIMEOUT = float(os.getenv("ES_REQUEST_TIMEOUT", "5"))  # 요청 타임아웃 (초)
+ES_MAX_RETRIES = int(os.getenv("ES_MAX_RETRIES", "2"))
+ES_RETRY_ON_TIMEOUT = os.getenv("ES_RETRY_ON_TIMEOUT", "true").lower() == "true"
+ES_HTTP_COMPRESS = os.getenv("ES_HTTP_COMPRESS", "true").lower() == "true"
+ES_VERIFY_CERTS = os.getenv("ES_VERIFY_CERTS", "false").lower() == "true"
+
+_es_client: Optional[AsyncElasticsearch] = None
+
+
+def create_es_client() -> AsyncElasticsearch:
+    if not ES_HOST:
+        raise ValueError("❌ ES_HOST 환경변수 누락")
+
+    return AsyncElasticsearch(
+        hosts=[ES_HOST],
+        basic_auth=(ES_USER, ES_PASSWORD),
+        verify_certs=ES_VERIFY_CERTS,
+        connections_per_node=ES_CONNECTIONS_PER_NODE,
+        request_timeout=ES_REQUEST_TIMEOUT,
+        max_retries=ES_MAX_RETRIES,
+        retry_on_timeout=ES_RETRY_ON_TIMEOUT,
+        retry_on_status=(502, 503, 504),
+        http_compress=ES_HTTP_COMPRESS,
+    )
+
+
+def init_es_client() -> AsyncElasticsearch:
+    """FastAPI lifespan 시작 시 호출 (워커 당 1개 클라이언트)"""
+    global _es_client
+    if _es_client is None:
+        _es_client = create_es_client()
+        print("✅ ES 클라이언트 초기화 완료")
+    return _es_client
+
+
+def set_es_client(client: Optional[AsyncElasticsearch]) -> None:
+    """외부에서 만든 클라이언트 주입 (테스트 / 스크립트용)"""
+    global _es_client
+    _es_client = client
+
+
+def get_es_client() -> AsyncElasticsearch:
+    """
+    공용 ES 클라이언트 (FastAPI Depends 로도 사용).
+    lifespan 밖(스크립트 등)에서 호출되면 그때 생성한다.
+    """
+    return _es_client or init_es_client()
+
+
+async def close_es_client() -> None:
+    """FastAPI lifespan 종료 시 커넥션 정리"""
+    global _es_client
+    if _es_client is not None:
+        await _es_client.close()
+        _es_client = None
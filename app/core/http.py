@@ -0,0 +1,84 @@
+import os
+import threading
+from typing import Dict, Optional
+import httpx
+
+# ✅ 외부 API 호출용 공용 httpx 클라이언트 (워커 당 이름별 1개, keep-alive 커넥션 재사용)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+
+_async_clients: Dict[str, httpx.AsyncClient] = {}
+_sync_clients: Dict[str, httpx.Client] = {}
+_lock = threading.Lock()
+
+
+def _client_options(
+    max_connections: Optional[int],
+    max_keepalive: Optional[int],
+    timeout: Optional[float],
+) -> dict:
+    return {
+        "limits": httpx.Limits(
+            max_connections=max_connections or HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=max_keepalive or HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(timeout or HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    }
+
+
+def get_async_http_client(
+    name: str = "default",
+    max_connections: Optional[int] = None,
+    max_keepalive: Optional[int] = None,
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> httpx.AsyncClient:
+    """이름별 공용 AsyncClient (설정값은 처음 생성할 때만 적용)"""
+    client = _async_clients.get(name)
+    if client is None or client.is_closed:
+        with _lock:
+            client = _async_clients.get(name)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    **_client_options(max_connections, max_keepalive, timeout), **kwargs
+                )
+                _async_clients[name] = client
+    return client
+
+
+def get_sync_http_client(
+    name: str = "default",
+    max_connections: Optional[int] = None,
+    max_keepalive: Optional[int] = None,
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> httpx.Client:
+    """이름별 공용 동기 Client (스트리밍 등 동기 호출 경로용)"""
+    client = _sync_clients.get(name)
+    if client is None or client.is_closed:
+        with _lock:
+            client = _sync_clients.get(name)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    **_client_options(max_connections, max_keepalive, timeout), **kwargs
+                )
+                _sync_clients[name] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """FastAPI lifespan 종료 시 호출"""
+    with _lock:
+        async_clients = list(_async_clients.values())
+        sync_clients = list(_sync_clients.values())
+        _async_clients.clear()
+        _sync_clients.clear()
+
+    for client in async_clients:
+        await client.aclose()
+    for client in sync_clients:
+        client.close()
@@ -0,0 +1,133 @@
+import os
+import asyncio
+import threading
+from typing import Dict, Tuple
+from langchain_openai import ChatOpenAI
+from app.core.http import get_async_http_client, get_sync_http_client
+
+# ✅ LLM 호출 공통 설정
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# 한 번의 GPT 호출이 이 시간(초)을 넘기면 취소하고 asyncio.TimeoutError 를 올린다
+LLM_CALL_TIMEOUT = float(os.getenv("LLM_CALL_TIMEOUT", "60"))
+# OpenAI 로 나가는 커넥션 풀 (모든 ChatOpenAI 인스턴스가 공유)
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "50"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "20"))
+LLM_HTTP_TIMEOUT = float(os.getenv("LLM_HTTP_TIMEOUT", "120"))
+# 모델별 동시 호출 수 (LLM_MAX_CONCURRENCY_GPT_4=4 처럼 모델별로 덮어쓸 수 있음)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+
+_OPENAI_HTTP_CLIENT = "openai"
+
+_models: Dict[Tuple, ChatOpenAI] = {}
+_semaphores: Dict[str, asyncio.Semaphore] = {}
+_limits: Dict[str, int] = {}
+_in_use: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def _http_clients() -> dict:
+    options = {
+        "max_connections": LLM_MAX_CONNECTIONS,
+        "max_keepalive": LLM_MAX_KEEPALIVE,
+        "timeout": LLM_HTTP_TIMEOUT,
+    }
+    return {
+        "http_client": get_sync_http_client(_OPENAI_HTTP_CLIENT, **options),
+        "http_async_client": get_async_http_client(_OPENAI_HTTP_CLIENT, **options),
+    }
+
+
+def get_chat_model(
+    model: str = "gpt-3.5-turbo",
+    temperature: float = 0.3,
+    streaming: bool = False,
+    **kwargs,
+) -> ChatOpenAI:
+    """
+    (model, temperature, streaming, 추가 옵션) 별로 ChatOpenAI 를 한 번만 만들어 재사용.
+    모든 인스턴스가 공용 httpx 커넥션 풀을 사용하므로 호출마다 TLS 핸드셰이크가 생기지 않는다.
+    """
+    key = (model, temperature, streaming, tuple(sorted(kwargs.items())))
+    llm = _models.get(key)
+    if llm is None:
+        with _lock:
+            llm = _models.get(key)
+            if llm is None:
+                llm = ChatOpenAI(
+                    model=model,
+                    api_key=OPENAI_API_KEY,
+                    temperature=temperature,
+                    streaming=streaming,
+                    **_http_clients(),
+                    **kwargs,
+                )
+                _models[key] = llm
+    return llm
+
+
+def warm_chat_models(specs) -> None:
+    """
+    ChatOpenAI 를 미리 생성 (FastAPI lifespan 시작 시 호출).
+    첫 생성 때 openai.resources 지연 import 로 이벤트 루프가 1초 가량 멈추므로 요청 전에 끝내 둔다.
+    specs: get_chat_model 인자 dict 목록
+    """
+    for spec in specs:
+        try:
+            get_chat_model(**spec)
+        except Exception as e:
+            # 키 누락 등은 첫 요청에서 다시 드러나므로 서버 시작은 막지 않음
+            print(f"⚠️ LLM 모델 선생성 실패 ({spec.get('model')}): {e}")
+            return
+
+
+def _model_name(llm) -> str:
+    return getattr(llm, "model_name", None) or getattr(llm, "model", "") or "default"
+
+
+def get_llm_semaphore(model: str) -> asyncio.Semaphore:
+    """모델별 동시 호출 제한"""
+    semaphore = _semaphores.get(model)
+    if semaphore is None:
+        with _lock:
+            semaphore = _semaphores.get(model)
+            if semaphore is None:
+                env_key = "LLM_MAX_CONCURRENCY_" + "".join(
+                    ch if ch.isalnum() else "_" for ch in model
+                ).upper()
+                _limits[model] = int(os.getenv(env_key, LLM_MAX_CONCURRENCY))
+                semaphore = asyncio.Semaphore(_limits[model])
+                _semaphores[model] = semaphore
+    return semaphore
+
+
+async def ainvoke_with_timeout(llm, messages, timeout: float = LLM_CALL_TIMEOUT):
+    """
+    llm.ainvoke 를 모델별 동시 호출 제한 + 타임아웃과 함께 실행 (이벤트 루프를 막지 않음).
+    타임아웃은 슬롯을 얻은 뒤의 호출에만 적용 (대기열에서 기다린 시간은 포함하지 않음).
+    타임아웃이 나거나 호출한 태스크가 취소되면 진행 중인 HTTP 요청도 함께 취소된다.
+    """
+    model = _model_name(llm)
+    async with get_llm_semaphore(model):
+        _in_use[model] = _in_use.get(model, 0) + 1
+        try:
+            return await asyncio.wait_for(llm.ainvoke(messages), timeout=timeout)
+        except asyncio.TimeoutError:
+            print(f"⏱️ LLM 호출 타임아웃 ({timeout}s): {model}")
+            raise
+        finally:
+            _in_use[model] -= 1
+
+
+def llm_pool_stats() -> dict:
+    """생성된 모델 인스턴스 수 / 모델별 동시 호출 슬롯 사용량"""
+    return {
+        "models": len(_models),
+        "semaphores": {
+            model: {
+                "limit": limit,
+                "in_use": _in_use.get(model, 0),
+                "available": limit - _in_use.get(model, 0),
+            }
+            for model, limit in _limits.items()
+        },
+    }
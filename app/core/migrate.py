@@ -0,0 +1,81 @@
+"""
+migrations/*.sql 을 파일명 순서대로 적용하는 간단한 마이그레이션 실행기.
+
+    python -m app.core.migrate          # 미적용 마이그레이션 적용
+    python -m app.core.migrate --list   # 적용 상태 확인
+
+적용 이력은 schema_migrations 테이블에 기록된다.
+"""
+import os
+import argparse
+from sqlalchemy import text
+from app.core.database import engine
+
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "migrations",
+)
+
+
+def list_migrations() -> list[str]:
+    return sorted(name for name in os.listdir(MIGRATIONS_DIR) if name.endswith(".sql"))
+
+
+def read_migration(name: str) -> str:
+    with open(os.path.join(MIGRATIONS_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def applied_migrations(connection) -> set[str]:
+    connection.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version TEXT PRIMARY KEY,
+                applied_at TIMESTAMP NOT NULL DEFAULT now()
+            )
+            """
+        )
+    )
+    rows = connection.execute(text("SELECT version FROM schema_migrations"))
+    return {row[0] for row in rows}
+
+
+def apply_migrations() -> list[str]:
+    applied = []
+    with engine.begin() as connection:
+        done = applied_migrations(connection)
+
+    for name in list_migrations():
+        if name in done:
+            continue
+        # ✅ 마이그레이션 파일 하나를 하나의 트랜잭션으로 적용
+        with engine.begin() as connection:
+            connection.exec_driver_sql(read_migration(name))
+            connection.execute(
+                text("INSERT INTO schema_migrations (version) VALUES (:version)"),
+                {"version": name},
+            )
+        print(f"✅ 마이그레이션 적용: {name}")
+        applied.append(name)
+    return applied
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQL 마이그레이션 실행")
+    parser.add_argument("--list", action="store_true", help="적용 상태만 출력")
+    args = parser.parse_args()
+
+    if args.list:
+        with engine.begin() as connection:
+            done = applied_migrations(connection)
+        for name in list_migrations():
+            print(f"{'✅' if name in done else '⬜'} {name}")
+        return
+
+    if not apply_migrations():
+        print("적용할 마이그레이션이 없습니다.")
+
+
+if __name__ == "__main__":
+    main()
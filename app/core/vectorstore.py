@@ -0,0 +1,176 @@
+import os
+import time
+import pickle
+import threading
+from typing import Callable, List, Optional
+from dotenv import load_dotenv
+from langchain_openai import OpenAIEmbeddings
+from langchain_community.vectorstores import FAISS
+from app.core.embedding_cache import CachedEmbeddings
+
+load_dotenv()
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# ✅ 법률 용어 벡터스토어 위치 (챗봇 / 용어 검색이 같은 인덱스를 공유)
+DB_FAISS_PATH = "./app/chatbot_term/vectorstore"
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# ✅ 인덱스 포맷: flat (기존 FAISS.load_local) / ivf (양자화 + mmap)
+# ivf 인덱스는 app/chatbot_term/build_quantized_index.py 로 생성
+FAISS_INDEX_FORMAT = os.getenv("FAISS_INDEX_FORMAT", "flat")
+DB_FAISS_QUANTIZED_PATH = os.getenv(
+    "FAISS_QUANTIZED_PATH", "./app/chatbot_term/vectorstore_ivf"
+)
+FAISS_NPROBE = int(os.getenv("FAISS_NPROBE", "16"))
+
+# ✅ 디스크 변경 확인 주기 (초) - 매 요청마다 stat 호출하지 않도록 제한
+FAISS_RELOAD_CHECK_INTERVAL = float(os.getenv("FAISS_RELOAD_CHECK_INTERVAL", "30"))
+
+_INDEX_FILES = ("index.faiss", "index.pkl")
+
+
+def _index_signature(path: str) -> Optional[tuple]:
+    """인덱스 파일들의 (mtime, size) 조합. 파일이 없으면 None"""
+    try:
+        return tuple(
+            (os.stat(os.path.join(path, name)).st_mtime_ns,
+             os.stat(os.path.join(path, name)).st_size)
+            for name in _INDEX_FILES
+        )
+    except OSError:
+        return None
+
+
+def load_quantized_faiss(path: str, embedding_model, nprobe: int = FAISS_NPROBE) -> FAISS:
+    """
+    IVF 양자화 인덱스를 mmap 으로 열어 LangChain FAISS 로 감싼다.
+    역색인 리스트는 페이지 캐시에 매핑되므로 여러 uvicorn 워커가 같은 물리 메모리를 공유한다.
+    """
+    import faiss
+
+    index = faiss.read_index(os.path.join(path, "index.faiss"), faiss.IO_FLAG_MMAP)
+    faiss.extract_index_ivf(index).nprobe = nprobe
+
+    # ✅ docstore / id 매핑은 기존 flat 인덱스와 같은 index.pkl 포맷
+    with open(os.path.join(path, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+
+    return FAISS(
+        embedding_function=embedding_model,
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id,
+    )
+
+
+class VectorStoreRegistry:
+    """
+    프로세스(워커) 당 한 번만 FAISS 인덱스를 로드하여 읽기 전용으로 공유하는 레지스트리.
+    - 최초 접근 시 지연 로딩
+    - 인덱스 파일이 디스크에서 바뀌면 다음 접근 시 자동 재로딩 (hot reload)
+    """
+
+    def __init__(self, path: str = None, index_format: str = FAISS_INDEX_FORMAT):
+        self.index_format = index_format
+        if path is None:
+            path = DB_FAISS_QUANTIZED_PATH if index_format == "ivf" else DB_FAISS_PATH
+        self.path = path
+        self._lock = threading.Lock()
+        # 인덱스 로드 중(self._lock 보유)에도 임베딩 모델을 만들 수 있도록 별도 lock
+        self._embedding_lock = threading.Lock()
+        self._embedding_model = None
+        self._db = None
+        self._signature = None
+        self._last_checked = 0.0
+        self._reload_listeners: List[Callable[[], None]] = []
+
+    def get_embedding_model(self) -> CachedEmbeddings:
+        if self._embedding_model is None:
+            with self._embedding_lock:
+                if self._embedding_model is None:
+                    # ✅ 같은 질문의 반복 임베딩 호출을 막기 위해 캐시로 감쌈
+                    self._embedding_model = CachedEmbeddings(
+                        OpenAIEmbeddings(
+                            model=EMBEDDING_MODEL,
+                            openai_api_key=OPENAI_API_KEY,
+                        ),
+                        model_name=EMBEDDING_MODEL,
+                    )
+        return self._embedding_model
+
+    def _load(self, embedding_model: CachedEmbeddings) -> FAISS:
+        if self.index_format == "ivf":
+            return load_quantized_faiss(self.path, embedding_model)
+        return FAISS.load_local(
+            self.path,
+            embedding_model,
+            allow_dangerous_deserialization=True,
+        )
+
+    def _is_stale(self) -> bool:
+        now = time.monotonic()
+        if now - self._last_checked < FAISS_RELOAD_CHECK_INTERVAL:
+            return False
+        self._last_checked = now
+        signature = _index_signature(self.path)
+        return signature is not None and signature != self._signature
+
+    def get(self) -> FAISS:
+        """공유 FAISS 인스턴스 반환 (필요 시 로드/재로드)"""
+        db = self._db
+        if db is not None and not self._is_stale():
+            return db
+
+        # ✅ 임베딩 모델은 인덱스 lock 밖에서 먼저 준비 (lock 재진입으로 인한 교착 방지)
+        embedding_model = self.get_embedding_model()
+        with self._lock:
+            # ✅ 다른 스레드가 이미 로드한 경우 재사용
+            signature = _index_signature(self.path)
+            if self._db is not None and signature == self._signature:
+                return self._db
+
+            reloaded = self._db is not None
+            self._db = self._load(embedding_model)
+            self._signature = signature
+            self._last_checked = time.monotonic()
+
+        if reloaded:
+            print(f"🔄 FAISS 인덱스 재로딩 완료: {self.path}")
+            for listener in list(self._reload_listeners):
+                listener()
+        return self._db
+
+    def add_reload_listener(self, listener: Callable[[], None]) -> None:
+        """인덱스가 재로딩될 때 호출될 콜백 등록 (파생 캐시 무효화용)"""
+        self._reload_listeners.append(listener)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._db = None
+            self._signature = None
+
+
+# ✅ 프로세스 전역 레지스트리
+_registry = VectorStoreRegistry()
+
+
+def get_vectorstore_registry() -> VectorStoreRegistry:
+    return _registry
+
+
+def get_faiss() -> FAISS:
+    """공유 FAISS 벡터스토어 (로드 실패 시 예외 발생)"""
+    return _registry.get()
+
+
+def get_embedding_model() -> CachedEmbeddings:
+    return _registry.get_embedding_model()
+
+
+def load_faiss() -> Optional[FAISS]:
+    """기존 load_faiss() 호환: 실패 시 None 반환"""
+    try:
+        return get_faiss()
+    except Exception as e:
+        print(f"❌ FAISS 로드 실패: {e}")
+        return None
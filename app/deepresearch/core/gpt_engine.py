@@ -1,19 +1,37 @@
-from typing import Optional
+from typing import Callable, Optional
 from pydantic import BaseModel
 import re
 
-def llm_call(prompt: str, model: str, client, max_tokens: int = 1000, temperature: float = 0.2) -> str:
+# 응답의 사용 토큰 수를 받는 콜백 (리서치 토큰 예산 집계용)
+UsageCallback = Callable[[int], None]
+
+
+def _report_usage(response, on_usage: Optional[UsageCallback]) -> None:
+    usage = getattr(response, "usage", None)
+    if on_usage and usage is not None:
+        on_usage(usage.total_tokens)
+
+
+async def llm_call(
+    prompt: str,
+    model: str,
+    client,
+    max_tokens: int = 1000,
+    temperature: float = 0.2,
+    on_usage: Optional[UsageCallback] = None,
+) -> str:
     """
-    주어진 프롬프트로 LLM을 동기적으로 호출합니다.
+    주어진 프롬프트로 LLM을 비동기로 호출합니다 (client: AsyncOpenAI).
     이는 메시지를 하나의 프롬프트로 연결하는 일반적인 헬퍼 함수입니다.
     """
     messages = [{"role": "user", "content": prompt}]
-    chat_completion = client.chat.completions.create(
+    chat_completion = await client.chat.completions.create(
         model=model,
         messages=messages,
         max_tokens=max_tokens,
         temperature=temperature
     )
+    _report_usage(chat_completion, on_usage)
     # print(model, "완료")
     return chat_completion.choices[0].message.content
 
@@ -21,7 +39,14 @@ def clean_json_block(text: str) -> str:
     # 마크다운 블록 제거 (```json ... ``` 포함)
     return re.sub(r"^```(?:json)?\n|\n```$", "", text.strip())
 
-def JSON_llm(user_prompt: str, schema: BaseModel, client, system_prompt: Optional[str] = None, model: Optional[str] = None):
+async def JSON_llm(
+    user_prompt: str,
+    schema: BaseModel,
+    client,
+    system_prompt: Optional[str] = None,
+    model: Optional[str] = None,
+    on_usage: Optional[UsageCallback] = None,
+):
     # print(f"[DEBUG] JSON_llm 내부 model: {model}")
     # print(f"[DEBUG] client 타입: {type(client)}")
 
@@ -34,11 +59,12 @@ def JSON_llm(user_prompt: str, schema: BaseModel, client, system_prompt: Optiona
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": user_prompt})
 
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=0.2
         )
+        _report_usage(response, on_usage)
 
         raw_text = response.choices[0].message.content
         # print(f"[DEBUG] raw_text: {raw_text}")
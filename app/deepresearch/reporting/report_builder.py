@@ -3,7 +3,7 @@ from app.deepresearch.core.gpt_engine import llm_call
 from app.deepresearch.prompts.system_prompt import system_prompt
 from app.deepresearch.prompts.report_prompts import generate_legal_prompt, generate_tax_prompt
 
-def write_final_report(
+async def write_final_report(
     prompt: str,
     learnings: List[str],
     visited_urls: List[str],
@@ -26,7 +26,7 @@ def write_final_report(
         user_prompt = f"{sys_prompt}\n\n{user_prompt}"
 
     try:
-        report = llm_call(
+        report = await llm_call(
             user_prompt,
             model,
             client,
@@ -1,75 +1,179 @@
-from typing import Literal
+import os
+import time
+import asyncio
+from typing import List, Literal, Optional, Set
 from app.deepresearch.core.firecrawl_client import FirecrawlClient
-from app.deepresearch.research.research_models import ResearchResult, SearchResult
+from app.deepresearch.research.research_models import ResearchResult, SearchResult, SerpQuery
 from app.deepresearch.research.keyword_generator import generate_serp_queries
 from app.deepresearch.research.search_result_processor import process_serp_result
 
+# ✅ 동시에 처리하는 검색 쿼리 수 (Firecrawl 검색 + 학습 추출 LLM 호출 단위)
+DEEP_RESEARCH_CONCURRENCY = int(os.getenv("DEEP_RESEARCH_CONCURRENCY", "3"))
+# ✅ 리서치 전체 예산: 시간(초) / LLM 토큰. 초과하면 새 분기를 만들지 않고 모인 결과만 반환
+DEEP_RESEARCH_TIME_BUDGET = float(os.getenv("DEEP_RESEARCH_TIME_BUDGET", "120"))
+DEEP_RESEARCH_TOKEN_BUDGET = int(os.getenv("DEEP_RESEARCH_TOKEN_BUDGET", "100000"))
 
-def deep_research(
+
+class ResearchBudget:
+    """리서치 한 번에 쓸 수 있는 시간 / 토큰 예산 (모든 분기가 공유)"""
+
+    def __init__(self, time_budget: float, token_budget: int):
+        self.deadline = time.monotonic() + time_budget
+        self.token_budget = token_budget
+        self.tokens_used = 0
+
+    def add_tokens(self, tokens: int) -> None:
+        self.tokens_used += tokens
+
+    def remaining_time(self) -> float:
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining_time() <= 0 or self.tokens_used >= self.token_budget
+
+
+async def deep_research(
     query: str,
     breadth: int = 2,
     depth: int = 1,
     client = None,
     model: str = "gpt-4o-mini",
-    search_type: Literal["legal", "tax"] = "legal"
+    search_type: Literal["legal", "tax"] = "legal",
+    concurrency: int = DEEP_RESEARCH_CONCURRENCY,
+    time_budget: float = DEEP_RESEARCH_TIME_BUDGET,
+    token_budget: int = DEEP_RESEARCH_TOKEN_BUDGET,
 ) -> ResearchResult:
     """
-    주어진 쿼리에 대해 다단계 리서치를 수행합니다. (동기 버전)
-    breadth: 생성할 쿼리 수, depth: 각 쿼리에 대해 반복 횟수
+    주어진 쿼리에 대해 다단계 리서치를 수행합니다. (비동기 버전, client: AsyncOpenAI)
+    breadth: 단계별 생성할 쿼리 수 (다음 단계는 절반씩 감소)
+    depth: followUpQuestions 를 따라 내려가는 단계 수 (1 이면 재귀 없음)
+    - 검색 쿼리는 concurrency 개까지 동시에 처리
+    - 이미 다른 분기에서 본 URL 은 다시 학습 추출에 넣지 않음
+    - 시간 / 토큰 예산을 넘으면 진행 중인 분기를 정리하고 그때까지의 결과를 반환
     """
     try:
         crawler = FirecrawlClient(search_type=search_type)
+    except Exception as e:
+        print(f"심층 리서치 중 오류 발생: {e}")
+        return ResearchResult(learnings=[], visited_urls=[])
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    budget = ResearchBudget(time_budget, token_budget)
 
-        all_learnings = []
-        all_urls = []
+    all_learnings: List[str] = []
+    visited_urls: List[str] = []
+    seen_urls: Set[str] = set()
+
+    async def explore(
+        current_query: str,
+        current_breadth: int,
+        current_depth: int,
+        learnings: Optional[List[str]] = None,
+    ) -> None:
+        if budget.exhausted:
+            return
 
         # Step 1. 관련 검색 쿼리 생성
-        serp_queries = generate_serp_queries(
-            query=query,
+        serp_queries = await generate_serp_queries(
+            query=current_query,
             client=client,
             model=model,
-            num_queries=breadth
+            num_queries=current_breadth,
+            learnings=learnings,
+            on_usage=budget.add_tokens,
+        )
+        results = await asyncio.gather(
+            *(
+                research_serp(serp, current_breadth, current_depth, learnings or [])
+                for serp in serp_queries
+            ),
+            return_exceptions=True,
         )
+        # ✅ 한 분기가 실패해도 나머지 분기 결과는 유지
+        for serp, result in zip(serp_queries, results):
+            if isinstance(result, Exception):
+                print(f"심층 리서치 분기 오류 ({serp.query}): {result}")
 
-        for serp in serp_queries:
-            # Step 2. 검색 수행
-            search_results = crawler.search(serp.query)
+    async def research_serp(
+        serp: SerpQuery, current_breadth: int, current_depth: int, learnings: List[str]
+    ) -> None:
+        async with semaphore:
+            if budget.exhausted:
+                return
 
-            # Step 3. 결과 정제
-            processed = crawler.process_results(search_results)
+            # Step 2. 검색 수행 (Firecrawl SDK 는 동기 → 스레드에서 실행)
+            search_results = await asyncio.to_thread(crawler.search, serp.query)
 
-            # Step 4. 컨텐츠 추출
+            # Step 3. 결과 정제 + 다른 분기에서 이미 본 URL 제외
             search_result_objects = []
-            for item in processed:
+            for item in crawler.process_results(search_results):
                 url = item["url"]
-                content = item.get("markdown", "")  # ✅ markdown은 이미 포함되어 있음
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                visited_urls.append(url)
+
+                # Step 4. 컨텐츠 추출
                 search_result_objects.append(SearchResult(
                     url=url,
                     title=item.get("title", ""),
                     description=item.get("snippet", ""),
-                    markdown=content
+                    markdown=item.get("markdown", "")  # ✅ markdown은 이미 포함되어 있음
                 ))
-                all_urls.append(url)
+
+            if not search_result_objects:
+                return
 
             # Step 5. 학습 추출
-            serp_output = process_serp_result(
+            serp_output = await process_serp_result(
                 query=serp.query,
                 search_result=search_result_objects,
                 client=client,
-                model=model
+                model=model,
+                on_usage=budget.add_tokens,
             )
-            all_learnings.extend(serp_output.get("learnings", []))
 
-        # print("[DEBUG] 최종 결과 learnings:")
-        # print(all_learnings)
-        # print("[DEBUG] 최종 결과 visited_urls:")
-        # print(all_urls)
+        new_learnings = serp_output.get("learnings", [])
+        all_learnings.extend(new_learnings)
 
-        return ResearchResult(
-            learnings=list(set(all_learnings)),
-            visited_urls=list(set(all_urls))
-        )
+        # Step 6. 후속 질문으로 한 단계 더 (semaphore 를 놓은 뒤 재귀 → 교착 방지)
+        follow_ups = serp_output.get("followUpQuestions", [])
+        if current_depth > 1 and follow_ups and not budget.exhausted:
+            next_query = (
+                f"이전 연구 목표: {serp.research_goal}\n"
+                "후속 연구 방향:\n" + "\n".join(follow_ups)
+            )
+            await explore(
+                next_query,
+                max(current_breadth // 2, 1),
+                current_depth - 1,
+                learnings + new_learnings,
+            )
 
+    started = time.perf_counter()
+    task = asyncio.create_task(explore(query, breadth, depth))
+    try:
+        done, _ = await asyncio.wait({task}, timeout=budget.remaining_time())
+        if done:
+            task.result()
+        else:
+            print("⏱️ 심층 리서치 시간 예산 초과 → 진행 중인 분기 취소")
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
     except Exception as e:
         print(f"심층 리서치 중 오류 발생: {e}")
-        return ResearchResult(learnings=[], visited_urls=[])
+    finally:
+        if not task.done():
+            # 요청 취소 등으로 이 코루틴이 중단된 경우
+            task.cancel()
+
+    print(
+        f"🔎 심층 리서치 완료: {time.perf_counter() - started:.1f}s, "
+        f"URL {len(visited_urls)}개, 토큰 {budget.tokens_used}"
+    )
+
+    return ResearchResult(
+        learnings=list(dict.fromkeys(all_learnings)),
+        visited_urls=visited_urls
+    )
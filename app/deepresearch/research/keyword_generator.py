@@ -1,17 +1,18 @@
 from typing import List, Optional
 from app.deepresearch.research.research_models import SerpQueryResponse, SerpQuery
-from app.deepresearch.core.gpt_engine import JSON_llm
+from app.deepresearch.core.gpt_engine import JSON_llm, UsageCallback
 from app.deepresearch.prompts.system_prompt import system_prompt
 
-def generate_serp_queries(
+async def generate_serp_queries(
     query: str,
     client,
     model: str,
     num_queries: int = 2,
-    learnings: Optional[List[str]] = None
+    learnings: Optional[List[str]] = None,
+    on_usage: Optional[UsageCallback] = None,
 ) -> List[SerpQuery]:
     """
-    사용자의 입력을 바탕으로 검색 쿼리를 생성합니다. (동기 버전)
+    사용자의 입력을 바탕으로 검색 쿼리를 생성합니다. (비동기 버전)
     """
     prompt = f"""
     다음 사용자 입력을 기반으로, 사용자가 겪고 있는 소송 또는 세무 신고 상황에 대해 다음 정보를 조사할 수 있도록 검색 쿼리를 생성하세요.
@@ -30,13 +31,12 @@ def generate_serp_queries(
 
     system_msg = system_prompt()
 
-    def call_llm():
-        response_json = JSON_llm(prompt, SerpQueryResponse, client, system_msg, model)
-        try:
-            result = SerpQueryResponse.model_validate(response_json)
-            return result.queries[:num_queries]
-        except Exception as e:
-            print(f"generate_serp_queries 오류: {e}")
-            return []
-
-    return call_llm()
+    response_json = await JSON_llm(
+        prompt, SerpQueryResponse, client, system_msg, model, on_usage=on_usage
+    )
+    try:
+        result = SerpQueryResponse.model_validate(response_json)
+        return result.queries[:num_queries]
+    except Exception as e:
+        print(f"generate_serp_queries 오류: {e}")
+        return []
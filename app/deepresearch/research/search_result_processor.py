@@ -1,15 +1,16 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.deepresearch.research.research_models import SearchResult, SerpResultResponse
-from app.deepresearch.core.gpt_engine import JSON_llm
+from app.deepresearch.core.gpt_engine import JSON_llm, UsageCallback
 from app.deepresearch.prompts.system_prompt import system_prompt
 
 
-def process_serp_result(
+async def process_serp_result(
     query: str,
     search_result: List[SearchResult],
     client,
     model: str,
-    num_learnings: int = 3
+    num_learnings: int = 3,
+    on_usage: Optional[UsageCallback] = None,
 ) -> Dict[str, List[str]]:
     """
     검색 결과를 바탕으로 학습 내용과 후속 질문을 추출합니다.
@@ -37,7 +38,9 @@ def process_serp_result(
 
     system_msg = system_prompt()
 
-    response_json = JSON_llm(prompt, SerpResultResponse, client, system_msg, model)
+    response_json = await JSON_llm(
+        prompt, SerpResultResponse, client, system_msg, model, on_usage=on_usage
+    )
 
     try:
         result = SerpResultResponse.model_validate(response_json)
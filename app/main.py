@@ -18,15 +18,40 @@ from app.routes import (
     legal_term,
     deepresearch,
 )
-from app.core.database import init_db
+from app.core.database import init_db, dispose_async_engine
+from app.core.vectorstore import load_faiss
+from app.services.precedent_search import start_precedent_refresh_scheduler
+from app.core.es import init_es_client, close_es_client
+from app.core.http import close_http_clients
+from app.chatbot.memory.session_store import close_session_store
 from app.chatbot.routes import router as chatbot_router
+from app.chatbot.tool_agents.controller import warm_llm2_models
 import os
 import signal
 import sys
 import asyncio
+from contextlib import asynccontextmanager
+
+
+# ✅ 서버 시작 / 종료 시 공용 리소스 관리 (워커 당 1회)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_db()  # ✅ `Base.metadata.create_all(bind=engine)` 제거
+    load_faiss()  # ✅ 워커 당 1회 FAISS 선로딩 (첫 요청 지연 방지)
+    start_precedent_refresh_scheduler()  # ✅ precedent_recent 뷰 주기적 갱신
+    init_es_client()  # ✅ ES 클라이언트 (커넥션 풀) 생성
+    warm_llm2_models()  # ✅ 첫 요청이 ChatOpenAI 생성(openai 지연 import)으로 멈추지 않도록
+    try:
+        yield
+    finally:
+        await close_es_client()  # ✅ ES 커넥션 정리
+        await dispose_async_engine()  # ✅ 비동기 DB 커넥션 정리
+        await close_http_clients()  # ✅ 공용 httpx 커넥션 정리
+        await close_session_store()  # ✅ redis 세션 저장소 커넥션 정리
+
 
 # ✅ FastAPI 애플리케이션 생성 (기본 응답을 ORJSONResponse로 설정)
-app = FastAPI(default_response_class=ORJSONResponse)
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # ✅ CORS 설정 (React와 연결할 경우 필수)
 app.add_middleware(
@@ -57,12 +82,6 @@ def read_root():
     return {"message": "Hello, FastAPI!"}
 
 
-# ✅ 서버 시작 시 데이터베이스 초기화
-@app.on_event("startup")
-def on_startup():
-    init_db()  # ✅ `Base.metadata.create_all(bind=engine)` 제거
-
-
 # ✅ 공통 예외 처리 (404 & 500 에러 핸들러)
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc: HTTPException):
@@ -1,7 +1,16 @@
 from fastapi import APIRouter, Depends
+from elasticsearch import AsyncElasticsearch
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from ..core import get_db
+from ..core import get_db, get_pool_metrics
+from ..core.vectorstore import get_embedding_model
+from ..core.es import get_es_client
+from ..core.llm import llm_pool_stats
+from ..chatbot.tool_agents.tools import es_result_cache
+from ..chatbot.memory.session_store import get_session_store
+from ..chatbot.memory.semantic_cache import semantic_cache_stats
+from ..chatbot.tool_agents.tavily import tavily_cache_stats
+from ..services.precedent_gpt_summary_service import precedent_gpt_summary_cache
 
 router = APIRouter()
 
@@ -11,4 +20,44 @@ def check_db(db:Session = Depends(get_db)):
     db.execute(text("SELECT 1"))
     return {"status": "DB 연결 성공!"}
   except Exception as e:
-    return {"status": "DB 연결 실패", "error": str(e)}
\ No newline at end of file
+    return {"status": "DB 연결 실패", "error": str(e)}
+
+@router.get("/embedding-cache")
+def check_embedding_cache():
+  return get_embedding_model().stats()
+
+@router.get("/db-pool")
+def check_db_pool():
+  return get_pool_metrics()
+
+@router.get("/es-cache")
+def check_es_cache():
+  return es_result_cache.stats()
+
+@router.get("/sessions")
+def check_sessions():
+  return get_session_store().stats()
+
+@router.get("/semantic-cache")
+def check_semantic_cache():
+  return semantic_cache_stats()
+
+@router.get("/tavily-cache")
+def check_tavily_cache():
+  return tavily_cache_stats()
+
+@router.get("/precedent-summary-cache")
+def check_precedent_summary_cache():
+  return precedent_gpt_summary_cache.stats()
+
+@router.get("/es")
+async def check_es(es: AsyncElasticsearch = Depends(get_es_client)):
+  try:
+    health = await es.cluster.health()
+    return {"status": "ES 연결 성공!", "cluster_status": health.get("status")}
+  except Exception as e:
+    return {"status": "ES 연결 실패", "error": str(e)}
+
+@router.get("/llm-pool")
+def check_llm_pool():
+  return llm_pool_stats()
@@ -1,13 +1,32 @@
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
-from openai import OpenAI
+from openai import AsyncOpenAI
+from app.core.http import get_async_http_client
 from app.deepresearch.research.deep_research import deep_research
 from app.deepresearch.reporting.report_builder import write_final_report
 import os
 from datetime import datetime
 
-def get_openai_client():
-    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# ✅ 리서치 범위 (depth > 1 이면 후속 질문으로 재귀, 전체 시간 / 토큰 예산은 deep_research 설정)
+DEEP_RESEARCH_BREADTH = int(os.getenv("DEEP_RESEARCH_BREADTH", "2"))
+DEEP_RESEARCH_DEPTH = int(os.getenv("DEEP_RESEARCH_DEPTH", "2"))
+
+DEEP_RESEARCH_LLM_TIMEOUT = float(os.getenv("DEEP_RESEARCH_LLM_TIMEOUT", "120"))  # 보고서 생성이 길어 기본값보다 여유 있게
+
+_openai_client: AsyncOpenAI | None = None
+
+# ✅ 요청마다 새로 만들지 않고 공용 httpx 커넥션 풀을 쓰는 AsyncOpenAI 재사용
+def get_openai_client() -> AsyncOpenAI:
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            timeout=DEEP_RESEARCH_LLM_TIMEOUT,
+            http_client=get_async_http_client(
+                "deepresearch_openai", timeout=DEEP_RESEARCH_LLM_TIMEOUT
+            ),
+        )
+    return _openai_client
 
 router = APIRouter()
 
@@ -38,7 +57,7 @@ class ResearchResponse(BaseModel):
 @router.post("/structured-research/legal", response_model=ResearchResponse)
 async def structured_research_legal(
     case: LegalCase,
-    client: OpenAI = Depends(get_openai_client)
+    client: AsyncOpenAI = Depends(get_openai_client)
 ):
     try:
         prompt = (
@@ -51,15 +70,16 @@ async def structured_research_legal(
             f"[바람] {case.desired_result}"
         )
 
-        research_results = deep_research(
+        research_results = await deep_research(
             query=prompt,
-            breadth=2,
-            depth=1,
+            breadth=DEEP_RESEARCH_BREADTH,
+            depth=DEEP_RESEARCH_DEPTH,
             client=client,
-            model="gpt-4o-mini"
+            model="gpt-4o-mini",
+            search_type="legal"
         )
 
-        final_report = write_final_report(
+        final_report = await write_final_report(
             prompt=prompt,
             learnings=research_results.learnings,
             visited_urls=research_results.visited_urls,
@@ -83,7 +103,7 @@ async def structured_research_legal(
 @router.post("/structured-research/tax", response_model=ResearchResponse)
 async def structured_research_tax(
     case: TaxCase,
-    client: OpenAI = Depends(get_openai_client)
+    client: AsyncOpenAI = Depends(get_openai_client)
 ):
     try:
         # additional_info가 None인 경우 빈 문자열로 처리
@@ -98,15 +118,16 @@ async def structured_research_tax(
             f"[기타상황] {additional_info}"
         )
 
-        research_results = deep_research(
+        research_results = await deep_research(
             query=prompt,
-            breadth=2,
-            depth=1,
+            breadth=DEEP_RESEARCH_BREADTH,
+            depth=DEEP_RESEARCH_DEPTH,
             client=client,
-            model="gpt-4o-mini"
+            model="gpt-4o-mini",
+            search_type="tax"
         )
 
-        final_report = write_final_report(
+        final_report = await write_final_report(
             prompt=prompt,
             learnings=research_results.learnings,
             visited_urls=research_results.visited_urls,
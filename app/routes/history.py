@@ -64,11 +64,11 @@ def delete_all_viewed(user_id: int, db: Session = Depends(get_db)):
 
 # ✅ 열람 목록에서 판례 정보를 조회하는 API
 @router.get("/precedent-info/{precedent_id}")
-def get_precedent_data(precedent_id: int):
+async def get_precedent_data(precedent_id: int):
     """
     판례 번호를 기반으로 판례 정보를 조회하는 엔드포인트
     """
-    precedent_info = get_precedent_detail(precedent_id)
+    precedent_info = await get_precedent_detail(precedent_id)
 
     if not precedent_info:
         return {"error": "해당 판례 정보를 찾을 수 없습니다."}
@@ -1,47 +1,82 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.core.database import get_db
+from app.services.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, InvalidCursorError
 from app.services.precedent_service import search_precedents, search_precedents_by_category
 from app.services.consultation import search_consultations, search_consultations_by_category
 
 router = APIRouter()
 
-@router.get("/precedents/{keyword}")
-def fetch_precedents(keyword: str, db: Session = Depends(get_db)):
-    try:
-        results = search_precedents(keyword)
+# ✅ 목록 응답: {"items": [...], "next_cursor": str | None, "approx_total": int}
+#    다음 페이지는 ?after={next_cursor} 로 요청
+LIMIT_QUERY = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT)
 
-        if not results:
-            raise HTTPException(status_code=404, detail="검색 결과 없음")  # ✅ FastAPI 기본 예외 처리 활용
 
-        return results  # ✅ FastAPI가 자동으로 JSON 변환
+def _ensure_found(page: dict, after: str | None) -> dict:
+    # 첫 페이지가 비어 있을 때만 404 (다음 페이지가 비는 것은 정상)
+    if not page["items"] and not after:
+        raise HTTPException(status_code=404, detail="검색 결과 없음")
+    return page
+
+
+@router.get("/precedents/{keyword}")
+def fetch_precedents(
+    keyword: str,
+    limit: int = LIMIT_QUERY,
+    after: str | None = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        page = search_precedents(keyword, limit=limit, after=after)
+        return _ensure_found(page, after)  # ✅ FastAPI가 자동으로 JSON 변환
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))  # ✅ 예외 메시지만 반환
 
 @router.get("/precedents/category/{c_type}")
-def fetch_precedents_by_category(c_type: str, db: Session = Depends(get_db)):
-    results = search_precedents_by_category(c_type)
-    if not results:
-        raise HTTPException(status_code=404, detail="검색 결과 없음")
-    return results
+def fetch_precedents_by_category(
+    c_type: str,
+    limit: int = LIMIT_QUERY,
+    after: str | None = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        page = search_precedents_by_category(c_type, limit=limit, after=after)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _ensure_found(page, after)
 
 @router.get("/consultations/{keyword}")
-def fetch_consultations(keyword: str, db: Session = Depends(get_db)):
+def fetch_consultations(
+    keyword: str,
+    limit: int = LIMIT_QUERY,
+    after: str | None = None,
+    db: Session = Depends(get_db),
+):
     try:
-        results = search_consultations(keyword)
-
-        if not results:
-            raise HTTPException(status_code=404, detail="검색 결과 없음")  # ✅ FastAPI 기본 예외 처리 활용
-
-        return results  # ✅ FastAPI가 자동으로 JSON 변환
+        page = search_consultations(keyword, limit=limit, after=after)
+        return _ensure_found(page, after)  # ✅ FastAPI가 자동으로 JSON 변환
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))  # ✅ 예외 메시지만 반환
 
 @router.get("/consultations/category/{category}")
-def fetch_consultations_by_category(category: str, db: Session = Depends(get_db)):
-    results = search_consultations_by_category(category)
-    if not results:
-        raise HTTPException(status_code=404, detail="검색 결과 없음")
-    return results
\ No newline at end of file
+def fetch_consultations_by_category(
+    category: str,
+    limit: int = LIMIT_QUERY,
+    after: str | None = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        page = search_consultations_by_category(category, limit=limit, after=after)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _ensure_found(page, after)
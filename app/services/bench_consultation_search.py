@@ -0,0 +1,176 @@
+"""
+상담 정밀 검색 쿼리 벤치마크 (기존 문자열 삽입 쿼리 vs 인덱스 기반 쿼리).
+
+    python -m app.services.bench_consultation_search --rows 100000 --runs 20
+
+별도 스키마(bench_consultation)에 합성 legal_consultation 테이블을 만들고
+migrations/001 을 그대로 적용한 뒤 두 쿼리의 지연 시간을 비교한다. 종료 시 스키마는 삭제된다.
+"""
+import time
+import argparse
+import statistics
+from sqlalchemy import text
+from app.core.database import engine
+from app.core.migrate import read_migration
+from app.services.consultation_search import build_consultation_search_query
+
+BENCH_SCHEMA = "bench_consultation"
+MIGRATION = "001_legal_consultation_search_document.sql"
+
+CATEGORIES = ["민사", "형사", "가사", "노동", "부동산", "행정"]
+SUB_CATEGORIES = ["임대차", "임금체불", "손해배상", "이혼", "상속", "사기", "명예훼손", "해고", "교통사고", "채권추심"]
+WORDS = [
+    "전세보증금", "반환", "임대인", "임차인", "계약", "해지", "손해", "배상", "청구", "소송",
+    "임금", "체불", "근로자", "사업주", "퇴직금", "해고", "부당", "위자료", "양육권", "재산분할",
+    "상속", "유류분", "사기", "고소", "명예훼손", "모욕", "교통사고", "과실", "보험", "합의",
+    "채권", "채무", "압류", "가압류", "지급명령", "내용증명", "증거", "판결", "항소", "변호사",
+]
+KEYWORD_SETS = [
+    ["전세보증금", "반환"],
+    ["임금", "체불", "퇴직금"],
+    ["교통사고", "과실", "합의"],
+    ["명예훼손", "고소"],
+    ["상속", "유류분", "재산분할"],
+]
+
+
+def legacy_consultation_query(keywords: list[str]) -> str:
+    """변경 전 async_search_consultation 쿼리 (비교용)"""
+    formatted_keywords = ", ".join(f"'{kw}'" for kw in keywords)
+
+    def weighted(column, weight):
+        terms = " + ".join(f"COALESCE(similarity({column}, '{kw}'), 0)" for kw in keywords)
+        return f"({terms}) / {len(keywords)} * {weight}"
+
+    return f"""
+    SET pg_trgm.similarity_threshold = 0.1;
+
+    SELECT id, category, sub_category, title, question, answer,
+        (
+            {weighted("title", 0.45)}
+            + {weighted("question", 0.35)}
+            + {weighted("answer", 0.15)}
+            + {weighted("sub_category", 0.05)}
+        ) AS precise_similarity_score
+    FROM legal_consultation
+    WHERE
+        title % ANY(ARRAY[{formatted_keywords}])
+        OR question % ANY(ARRAY[{formatted_keywords}])
+        OR answer % ANY(ARRAY[{formatted_keywords}])
+        OR sub_category % ANY(ARRAY[{formatted_keywords}])
+    ORDER BY precise_similarity_score DESC
+    LIMIT 5;
+    """
+
+
+def _sentence(n: int, offset: str) -> str:
+    """WORDS 에서 n개 단어를 골라 문장을 만드는 SQL 식"""
+    return (
+        "array_to_string(ARRAY(SELECT (:words)[1 + floor(random() * :word_count)::int] "
+        f"FROM generate_series(1, {n}) WHERE g > {offset}), ' ')"
+    )
+
+
+def create_synthetic_table(connection, rows: int) -> None:
+    connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public")
+    connection.exec_driver_sql(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    connection.exec_driver_sql(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    connection.exec_driver_sql(f"SET search_path TO {BENCH_SCHEMA}, public")
+    connection.exec_driver_sql(
+        """
+        CREATE TABLE legal_consultation (
+            id SERIAL PRIMARY KEY,
+            category TEXT,
+            sub_category TEXT,
+            title TEXT,
+            question TEXT,
+            answer TEXT
+        )
+        """
+    )
+    # ✅ 상관 서브쿼리가 행마다 다시 평가되도록 g 를 참조
+    connection.execute(
+        text(
+            f"""
+            INSERT INTO legal_consultation (category, sub_category, title, question, answer)
+            SELECT
+                (:categories)[1 + floor(random() * :category_count)::int],
+                (:sub_categories)[1 + floor(random() * :sub_category_count)::int],
+                {_sentence(4, "-1")},
+                {_sentence(30, "-2")},
+                {_sentence(120, "-3")}
+            FROM generate_series(1, :rows) AS g
+            """
+        ),
+        {
+            "categories": CATEGORIES,
+            "category_count": len(CATEGORIES),
+            "sub_categories": SUB_CATEGORIES,
+            "sub_category_count": len(SUB_CATEGORIES),
+            "words": WORDS,
+            "word_count": len(WORDS),
+            "rows": rows,
+        },
+    )
+
+
+def _time_query(run_query, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run_query()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(f"  {label:<8} 평균 {statistics.mean(timings):8.2f}ms  p95 {p95:8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상담 정밀 검색 쿼리 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="벤치 스키마를 삭제하지 않음")
+    args = parser.parse_args()
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        print(f"📦 합성 데이터 {args.rows}행 생성 중...")
+        started = time.perf_counter()
+        create_synthetic_table(connection, args.rows)
+        print(f"   완료 ({time.perf_counter() - started:.1f}s)")
+
+        print("🛠 마이그레이션 적용 중 (search_document + GIN trigram)...")
+        started = time.perf_counter()
+        connection.exec_driver_sql(read_migration(MIGRATION))
+        print(f"   완료 ({time.perf_counter() - started:.1f}s)")
+
+        try:
+            for keywords in KEYWORD_SETS:
+                print(f"🔍 키워드: {keywords}")
+
+                legacy_sql = legacy_consultation_query(keywords)
+                legacy = _time_query(
+                    lambda: connection.exec_driver_sql(legacy_sql).fetchall(),
+                    args.runs,
+                )
+                # 레거시 쿼리의 세션 SET 이 다음 쿼리에 영향을 주지 않도록 초기화
+                connection.exec_driver_sql("RESET pg_trgm.similarity_threshold")
+
+                query, params = build_consultation_search_query(keywords)
+                indexed = _time_query(
+                    lambda: connection.execute(text(query), params).mappings().all(),
+                    args.runs,
+                )
+
+                _report("legacy", legacy)
+                _report("indexed", indexed)
+        finally:
+            if not args.keep:
+                connection.exec_driver_sql(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+
+
+if __name__ == "__main__":
+    main()
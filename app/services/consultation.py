@@ -1,65 +1,69 @@
-from app.core.database import execute_sql
+from app.services.pagination import DEFAULT_PAGE_LIMIT, fetch_keyset_page
+from app.services.search_text import contains_pattern
 
-def search_consultations(keyword: str):
+# ✅ 목록 조회용 컬럼 (answer 본문 제외, 질문은 미리보기 길이로 자름 → 전체 내용은 상세 API)
+CONSULTATION_PREVIEW_LENGTH = 200
+CONSULTATION_LIST_SELECT = f"""
+    SELECT id, category, sub_category, title,
+        LEFT(question, {CONSULTATION_PREVIEW_LENGTH}) AS question
+    FROM legal_consultation
+"""
+
+
+def _fetch_consultation_page(where_sql: str, params: dict, limit: int, after: str | None):
+    """sub_category, id 순 keyset 페이지"""
+    return fetch_keyset_page(
+        CONSULTATION_LIST_SELECT,
+        where_sql,
+        params,
+        sort_column="sub_category",
+        limit=limit,
+        after=after,
+    )
+
+
+def search_consultations(keyword: str, limit: int = DEFAULT_PAGE_LIMIT, after: str | None = None):
     """
     키워드를 기반으로 legal_consultation 테이블을 검색하는 함수.
     - keyword는 title과 question 컬럼에서 검색합니다.
-    - 띄어쓰기와 관계없이 검색이 가능합니다.
+    - 띄어쓰기와 관계없이 검색이 가능합니다. (*_normalized 생성 컬럼 + trigram 인덱스)
     - 여러 단어가 포함된 경우, 각 단어가 모두 포함된 결과를 반환합니다.
+    - limit / after(커서) 로 한 페이지씩 반환: {"items", "next_cursor", "approx_total"}
     """
+    empty_page = {"items": [], "next_cursor": None, "approx_total": 0}
+
     # 키워드 전처리: 앞뒤 공백 제거
     keyword = keyword.strip()
     if not keyword:
-        return []
+        return empty_page
 
-    # 띄어쓰기 제거한 키워드 추가
-    no_space_keyword = keyword.replace(" ", "")
-    
     # 키워드를 공백 기준으로 분리
     tokens = keyword.split()
     token_count = len(tokens)
     if token_count == 0:
-        return []
+        return empty_page
 
-    # title, question 컬럼에 대한 조건 생성
+    # title, question 정규화 컬럼에 대한 조건 생성
     title_conditions = " AND ".join([
-        f"(title ILIKE :token{i} OR REPLACE(title, ' ', '') ILIKE :no_space_token{i})"
-        for i in range(token_count)
+        f"title_normalized LIKE :token{i}" for i in range(token_count)
     ])
     question_conditions = " AND ".join([
-        f"(question ILIKE :token{i} OR REPLACE(question, ' ', '') ILIKE :no_space_token{i})"
-        for i in range(token_count)
+        f"question_normalized LIKE :token{i}" for i in range(token_count)
     ])
+    where_sql = f"({title_conditions}) OR ({question_conditions})"
 
-    query = f"""
-    SELECT id, category, sub_category, title, question, answer
-    FROM legal_consultation
-    WHERE ({title_conditions})
-       OR ({question_conditions})
-    ORDER BY sub_category;
-    """
-
-    # 파라미터 설정 (일반 토큰과 띄어쓰기 제거된 토큰 모두 포함)
-    params = {}
-    for i, token in enumerate(tokens):
-        params[f"token{i}"] = f"%{token}%"
-        params[f"no_space_token{i}"] = f"%{token.replace(' ', '')}%"
+    # 파라미터 설정 (정규화된 토큰 패턴)
+    params = {f"token{i}": contains_pattern(token) for i, token in enumerate(tokens)}
 
-    results = execute_sql(query, params)
-    return [dict(row) for row in results]
+    return _fetch_consultation_page(where_sql, params, limit, after)
 
 
-def search_consultations_by_category(category: str):
+def search_consultations_by_category(
+    category: str, limit: int = DEFAULT_PAGE_LIMIT, after: str | None = None
+):
     """
     주어진 category(상담사례 카테고리)에 해당하는 상담 데이터를 검색합니다.
     """
-    query = """
-    SELECT id, category, sub_category, title, question, answer
-    FROM legal_consultation
-    WHERE category ILIKE :category
-    ORDER BY sub_category;
-    """
+    where_sql = "category ILIKE :category"
     params = {"category": f"%{category}%"}
-    results = execute_sql(query, params)
-   
-    return [dict(row) for row in results]
\ No newline at end of file
+    return _fetch_consultation_page(where_sql, params, limit, after)
@@ -1,7 +1,7 @@
 # app/services/consultation_service.py
-from app.core.database import execute_sql
+from app.core.database import execute_sql_async
 
-def get_consultation_detail_by_id(consultation_id: int):
+async def get_consultation_detail_by_id(consultation_id: int):
     """
     주어진 consultation_id에 해당하는 legal_consultation 테이블의 상세 정보를 조회합니다.
     
@@ -18,7 +18,7 @@ def get_consultation_detail_by_id(consultation_id: int):
         WHERE id = :consultation_id;
     """
     params = {"consultation_id": consultation_id}
-    results = execute_sql(query, params)
+    results = await execute_sql_async(query, params)
     
     # 결과가 있으면 첫 번째 행을 dict로 변환하여 반환
     if results:
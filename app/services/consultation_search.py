@@ -0,0 +1,103 @@
+from app.core.database import execute_sql, execute_sql_async
+
+# ✅ 상담 정밀 검색 (챗봇 LLM2 빌드용)
+# migrations/001_legal_consultation_search_document.sql 의 search_document 컬럼 / GIN 인덱스 필요
+
+# 필드 가중치 (category 는 가중치 0으로 제외)
+CONSULTATION_FIELD_WEIGHTS = {
+    "title": 0.45,
+    "question": 0.35,
+    "answer": 0.15,
+    "sub_category": 0.05,
+}
+# 인덱스로 선별한 후보 중 순위를 계산할 최대 행 수
+CONSULTATION_CANDIDATE_LIMIT = 200
+
+
+def normalize_keywords(keywords) -> list[str]:
+    """공백/중복 키워드 제거 (순서 유지)"""
+    seen = set()
+    result = []
+    for kw in keywords or []:
+        kw = str(kw).strip()
+        if kw and kw not in seen:
+            seen.add(kw)
+            result.append(kw)
+    return result
+
+
+def build_consultation_search_query(
+    keywords: list[str],
+    limit: int = 5,
+    candidate_limit: int = CONSULTATION_CANDIDATE_LIMIT,
+) -> tuple[str, dict]:
+    """
+    바인드 파라미터 기반 상담 검색 쿼리 생성.
+    1) search_document %> :kwN (키워드별 GIN 인덱스 스캔 → BitmapOr) 로 후보 선별,
+       search_document 기준 최대 word_similarity 가 높은 순으로 candidate_limit 개만 남김
+    2) 후보 행에 대해서만 필드별 word_similarity 평균의 가중합으로 순위 계산
+    """
+    params = {f"kw{i}": kw for i, kw in enumerate(keywords)}
+    params.update(
+        {"keywords": list(keywords), "limit": limit, "candidate_limit": candidate_limit}
+    )
+
+    candidate_conditions = " OR ".join(
+        f"search_document %> :kw{i}" for i in range(len(keywords))
+    )
+    # 후보 순서: 인덱스 재검사에서 이미 읽은 search_document 하나로 계산하는 저렴한 관련도
+    candidate_score = ", ".join(
+        f"word_similarity(:kw{i}, search_document)" for i in range(len(keywords))
+    )
+    weighted_score = "\n            + ".join(
+        f"COALESCE(avg(word_similarity(kw, c.{column})), 0) * {weight}"
+        for column, weight in CONSULTATION_FIELD_WEIGHTS.items()
+    )
+
+    query = f"""
+    WITH candidates AS (
+        SELECT id, category, sub_category, title, question, answer
+        FROM legal_consultation
+        WHERE {candidate_conditions}
+        ORDER BY GREATEST({candidate_score}) DESC, id
+        LIMIT :candidate_limit
+    )
+    SELECT
+        c.id,
+        c.category,
+        c.sub_category,
+        c.title,
+        c.question,
+        c.answer,
+        s.score AS precise_similarity_score
+    FROM candidates c
+    CROSS JOIN LATERAL (
+        SELECT (
+            {weighted_score}
+        ) AS score
+        FROM unnest(CAST(:keywords AS text[])) AS kw
+    ) s
+    ORDER BY precise_similarity_score DESC, c.id
+    LIMIT :limit;
+    """
+    return query, params
+
+
+def search_consultation_candidates(keywords, limit: int = 5):
+    """키워드 기반 상담 정밀 검색 (동기 실행)"""
+    keywords = normalize_keywords(keywords)
+    if not keywords:
+        return []
+
+    query, params = build_consultation_search_query(keywords, limit=limit)
+    return execute_sql(query, params)
+
+
+async def search_consultation_candidates_async(keywords, limit: int = 5):
+    """키워드 기반 상담 정밀 검색 (비동기 엔진)"""
+    keywords = normalize_keywords(keywords)
+    if not keywords:
+        return []
+
+    query, params = build_consultation_search_query(keywords, limit=limit)
+    return await execute_sql_async(query, params)
@@ -3,7 +3,7 @@ from sqlalchemy import and_, func
 from app.models.history import History
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from functools import lru_cache
-from app.core.database import execute_sql
+from app.core.database import execute_sql_async
 
 
 # ✅ 열람 기록 저장
@@ -101,7 +101,7 @@ def remove_all_viewed(db: Session, user_id: int):
 
 
 # ✅ 열람기록 판례 목록 정보 불러오기
-def get_precedent_detail(precedent_id: int):
+async def get_precedent_detail(precedent_id: int):
     """
     판례 정보 조회 함수
     """
@@ -110,7 +110,7 @@ def get_precedent_detail(precedent_id: int):
         FROM precedent 
         WHERE pre_number = :precedent_id
     """
-    result = execute_sql(sql, {"precedent_id": precedent_id}, fetch_one=True)
+    result = await execute_sql_async(sql, {"precedent_id": precedent_id}, fetch_one=True)
 
     if not result:
         print(f"판례 정보를 찾을 수 없음: precedent_id={precedent_id}")
@@ -0,0 +1,141 @@
+import json
+import base64
+import datetime
+from app.core.database import execute_sql
+
+# ✅ 검색 목록 공통 페이지네이션 (keyset / cursor 기반)
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+
+
+class InvalidCursorError(ValueError):
+    """after 커서를 해석할 수 없을 때"""
+
+
+def clamp_limit(limit: int | None) -> int:
+    if not limit or limit <= 0:
+        return DEFAULT_PAGE_LIMIT
+    return min(limit, MAX_PAGE_LIMIT)
+
+
+def _to_json_value(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(*values) -> str:
+    """마지막 행의 정렬 키 → URL-safe 커서 문자열"""
+    raw = json.dumps([_to_json_value(v) for v in values], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """encode_cursor 의 역변환 (값 개수가 다르거나 형식이 잘못되면 InvalidCursorError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f"잘못된 커서입니다: {cursor}") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(f"잘못된 커서입니다: {cursor}")
+    return values
+
+
+def keyset_condition(
+    column: str, after_value, after_id, params: dict, descending: bool = False
+) -> str:
+    """
+    (column, id) 정렬 기준 keyset 조건. NULL 은 항상 마지막(NULLS LAST)에 오도록 정렬한다고 가정.
+    :after_value / :after_id 를 params 에 채워 넣는다.
+    """
+    op = "<" if descending else ">"
+    params["after_id"] = after_id
+    if after_value is None:
+        return f"({column} IS NULL AND id {op} :after_id)"
+
+    params["after_value"] = after_value
+    return (
+        f"({column} {op} :after_value"
+        f" OR ({column} = :after_value AND id {op} :after_id)"
+        f" OR {column} IS NULL)"
+    )
+
+
+def estimate_count(query: str, params: dict) -> int:
+    """
+    EXPLAIN 의 예상 행 수로 전체 건수를 근사 (COUNT(*) 풀스캔 없이 플래너 통계만 사용).
+    query 에는 ORDER BY / LIMIT 없이 WHERE 조건까지만 넣는다.
+    """
+    row = execute_sql(f"EXPLAIN (FORMAT JSON) {query}", params, fetch_one=True)
+    if not row:
+        return 0
+
+    plan = list(row.values())[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (KeyError, IndexError, TypeError):
+        return 0
+
+
+def build_page(rows: list[dict], limit: int, cursor_of, approx_total: int) -> dict:
+    """limit + 1 개 조회한 결과로 다음 페이지 커서를 만든다"""
+    has_next = len(rows) > limit
+    items = rows[:limit]
+    return {
+        "items": items,
+        "next_cursor": cursor_of(items[-1]) if has_next and items else None,
+        "approx_total": approx_total,
+    }
+
+
+def fetch_keyset_page(
+    select_sql: str,
+    where_sql: str,
+    params: dict,
+    sort_column: str,
+    limit: int | None = DEFAULT_PAGE_LIMIT,
+    after: str | None = None,
+    descending: bool = False,
+    parse_after_value=None,
+    convert_row=dict,
+) -> dict:
+    """
+    {select_sql} WHERE {where_sql} 를 (sort_column, id) 순서로 한 페이지만 조회.
+    반환: {"items": [...], "next_cursor": str | None, "approx_total": int}
+    """
+    limit = clamp_limit(limit)
+    approx_total = estimate_count(f"{select_sql} WHERE {where_sql}", params)
+
+    page_params = dict(params)
+    conditions = [f"({where_sql})"]
+    if after:
+        after_value, after_id = decode_cursor(after, 2)
+        if after_value is not None and parse_after_value is not None:
+            try:
+                after_value = parse_after_value(after_value)
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError(f"잘못된 커서입니다: {after}") from e
+        conditions.append(
+            keyset_condition(sort_column, after_value, after_id, page_params, descending)
+        )
+
+    direction = "DESC" if descending else "ASC"
+    page_params["page_limit"] = limit + 1
+    query = f"""
+    {select_sql}
+    WHERE {" AND ".join(conditions)}
+    ORDER BY {sort_column} {direction} NULLS LAST, id {direction}
+    LIMIT :page_limit;
+    """
+
+    rows = [convert_row(row) for row in execute_sql(query, page_params)]
+    return build_page(
+        rows,
+        limit,
+        lambda row: encode_cursor(row.get(sort_column), row["id"]),
+        approx_total,
+    )
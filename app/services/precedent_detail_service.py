@@ -1,6 +1,106 @@
+import os
+import json
+import time
+import zlib
+import threading
+from typing import Optional
 import httpx
 from fastapi import HTTPException
 from fastapi.responses import HTMLResponse
+from app.core.disk_cache import SQLiteKVStore
+from app.core.http import get_async_http_client
+
+# ✅ law.go.kr 판례 상세 API 전용 공용 클라이언트 (lifespan 종료 시 close_http_clients 로 정리)
+PRECEDENT_DETAIL_TIMEOUT = float(os.getenv("PRECEDENT_DETAIL_TIMEOUT", "10"))
+PRECEDENT_DETAIL_MAX_CONNECTIONS = int(os.getenv("PRECEDENT_DETAIL_MAX_CONNECTIONS", "20"))
+PRECEDENT_DETAIL_MAX_KEEPALIVE = int(os.getenv("PRECEDENT_DETAIL_MAX_KEEPALIVE", "10"))
+
+# ✅ 판례 본문 디스크 캐시 (zlib 압축, 워커 간 공유)
+# 비어 있으면 디스크 캐시 비활성화
+PRECEDENT_DETAIL_CACHE_PATH = os.getenv(
+    "PRECEDENT_DETAIL_CACHE_PATH", "./cache/precedent_detail.sqlite3"
+)
+# 이 시간 안에는 재검증 없이 바로 반환, 지나면 ETag / Last-Modified 로 조건부 요청
+PRECEDENT_DETAIL_FRESH_TTL = float(os.getenv("PRECEDENT_DETAIL_FRESH_TTL", "86400"))
+# 디스크에 보관하는 기간 (재검증에 실패하면 이 기간 안의 본문을 대신 반환)
+PRECEDENT_DETAIL_CACHE_TTL = float(os.getenv("PRECEDENT_DETAIL_CACHE_TTL", str(30 * 24 * 3600)))
+
+_HTTP_CLIENT = "law_go_kr_detail"
+_API_URL = "https://www.law.go.kr/DRF/lawService.do?OC=youngsunyi&target=prec&ID={pre_number}&type={type}"
+
+_disk: Optional[SQLiteKVStore] = None
+_disk_lock = threading.Lock()
+
+
+def _get_client() -> httpx.AsyncClient:
+    return get_async_http_client(
+        _HTTP_CLIENT,
+        max_connections=PRECEDENT_DETAIL_MAX_CONNECTIONS,
+        max_keepalive=PRECEDENT_DETAIL_MAX_KEEPALIVE,
+        timeout=PRECEDENT_DETAIL_TIMEOUT,
+    )
+
+
+def _get_disk() -> Optional[SQLiteKVStore]:
+    global _disk
+    if not PRECEDENT_DETAIL_CACHE_PATH:
+        return None
+    if _disk is None:
+        with _disk_lock:
+            if _disk is None:
+                _disk = SQLiteKVStore(PRECEDENT_DETAIL_CACHE_PATH, table="precedent_detail")
+    return _disk
+
+
+def _cache_key(pre_number: int) -> str:
+    return f"prec:{pre_number}"
+
+
+def _load_entry(pre_number: int) -> Optional[dict]:
+    disk = _get_disk()
+    if disk is None:
+        return None
+    raw = disk.get(_cache_key(pre_number))
+    if raw is None:
+        return None
+    try:
+        return json.loads(zlib.decompress(raw))
+    except (zlib.error, ValueError) as e:
+        print(f"⚠️ 판례 상세 캐시 손상 (pre_number={pre_number}): {e}")
+        disk.delete(_cache_key(pre_number))
+        return None
+
+
+def _save_entry(pre_number: int, entry: dict) -> None:
+    disk = _get_disk()
+    if disk is None:
+        return
+    raw = zlib.compress(json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+    disk.set(_cache_key(pre_number), raw, ttl=PRECEDENT_DETAIL_CACHE_TTL)
+
+
+def _validators(response: httpx.Response) -> dict:
+    return {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+
+
+def _conditional_headers(entry: Optional[dict]) -> dict:
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def _to_result(entry: dict):
+    if entry["kind"] == "html":
+        return HTMLResponse(content=entry["body"])
+    return entry["body"]
+
 
 async def fetch_external_precedent_detail(pre_number: int):
     """
@@ -8,19 +108,39 @@ async def fetch_external_precedent_detail(pre_number: int):
     2. JSON 응답의 최상위 키를 확인:
        - "PrecService"가 있으면 JSON 반환
        - "Law"가 있으면 HTML API 요청 후 HTML 반환
+    본문은 디스크 캐시에 저장되며, FRESH_TTL 이 지나면 JSON 요청의
+    ETag / Last-Modified 로 재검증한다 (304 이면 캐시 본문 반환).
     """
     if not pre_number or pre_number <= 0:
         raise HTTPException(status_code=400, detail="유효하지 않은 판례 번호입니다.")
 
-    json_api_url = f"https://www.law.go.kr/DRF/lawService.do?OC=youngsunyi&target=prec&ID={pre_number}&type=JSON"
-    html_api_url = f"https://www.law.go.kr/DRF/lawService.do?OC=youngsunyi&target=prec&ID={pre_number}&type=HTML"
+    entry = _load_entry(pre_number)
+    if entry and time.time() - entry.get("fetched_at", 0) < PRECEDENT_DETAIL_FRESH_TTL:
+        return _to_result(entry)
+
+    json_api_url = _API_URL.format(pre_number=pre_number, type="JSON")
+    html_api_url = _API_URL.format(pre_number=pre_number, type="HTML")
+    client = _get_client()
 
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(json_api_url)
+        response = await client.get(json_api_url, headers=_conditional_headers(entry))
     except httpx.RequestError as e:
+        if entry:
+            # ✅ 외부 API 장애 시 보관 중인 본문으로 응답
+            print(f"⚠️ 판례 상세 재검증 실패, 캐시 본문 반환 (pre_number={pre_number}): {e}")
+            return _to_result(entry)
         raise HTTPException(status_code=500, detail=f"외부 API 요청 실패: {str(e)}")
 
+    if response.status_code == 304 and entry:
+        entry["fetched_at"] = time.time()
+        _save_entry(pre_number, entry)
+        return _to_result(entry)
+
+    if response.status_code >= 500 and entry:
+        # ✅ 외부 API 서버 오류도 보관 중인 본문으로 응답
+        print(f"⚠️ 판례 상세 재검증 실패 ({response.status_code}), 캐시 본문 반환 (pre_number={pre_number})")
+        return _to_result(entry)
+
     if response.status_code != 200:
         raise HTTPException(status_code=response.status_code, detail=f"외부 API 호출 실패: {response.text}")
 
@@ -30,19 +150,26 @@ async def fetch_external_precedent_detail(pre_number: int):
         # ✅ 최상위 키 확인
         first_key = next(iter(data))  # 첫 번째 키 가져오기
         if first_key == "PrecService":
-            return data["PrecService"]  # ✅ 정상 JSON 반환
+            entry = {"kind": "json", "body": data["PrecService"]}  # ✅ 정상 JSON 반환
 
         elif first_key == "Law":
-            # ✅ "Law" 키가 있으면 HTML 요청 후 반환
-            async with httpx.AsyncClient(timeout=10) as client:
-                html_response = await client.get(html_api_url)
+            # ✅ "Law" 키가 있으면 HTML 요청 후 반환 (같은 keep-alive 커넥션 재사용)
+            html_response = await client.get(html_api_url)
 
             if html_response.status_code != 200:
                 raise HTTPException(status_code=html_response.status_code, detail="HTML API 호출 실패")
 
-            return HTMLResponse(content=html_response.text)
+            entry = {"kind": "html", "body": html_response.text}
 
-        raise HTTPException(status_code=500, detail="예상치 못한 JSON 응답 형식입니다.")
+        else:
+            raise HTTPException(status_code=500, detail="예상치 못한 JSON 응답 형식입니다.")
 
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"JSON 응답 파싱 오류: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"JSON 응답 파싱 오류: {str(e)}")
+
+    # 재검증은 JSON 요청 기준 (HTML 본문도 같은 판례이므로 함께 유효)
+    entry.update(_validators(response), fetched_at=time.time())
+    _save_entry(pre_number, entry)
+    return _to_result(entry)
@@ -0,0 +1,207 @@
+"""
+판례 GPT 요약 캐시 (/api/detail/precedent/summary/{pre_number}).
+
+    python -m app.services.precedent_gpt_summary_service --limit 200 --concurrency 3
+
+요약은 precedent_gpt_summary 테이블(migrations/005)에 저장되고 워커 메모리에도 캐시된다.
+같은 판례에 대한 동시 요청은 한 번의 생성 결과를 공유한다 (single-flight).
+CLI 는 history 테이블에서 열람 수가 많은 판례부터 미리 요약한다.
+"""
+import os
+import time
+import asyncio
+import argparse
+from typing import Optional
+from fastapi import HTTPException
+from fastapi.responses import HTMLResponse
+from app.core.cache import AsyncTTLCache
+from app.core.database import execute_sql_async, execute_write_async
+from app.core.llm import ainvoke_with_timeout, get_chat_model
+from app.services.precedent_detail_service import fetch_external_precedent_detail
+
+PRECEDENT_GPT_SUMMARY_MODEL = os.getenv("PRECEDENT_GPT_SUMMARY_MODEL", "gpt-3.5-turbo")
+PRECEDENT_GPT_SUMMARY_TEMPERATURE = float(os.getenv("PRECEDENT_GPT_SUMMARY_TEMPERATURE", "0.7"))
+PRECEDENT_GPT_SUMMARY_MEMORY_TTL = float(os.getenv("PRECEDENT_GPT_SUMMARY_MEMORY_TTL", "3600"))
+PRECEDENT_GPT_SUMMARY_MEMORY_SIZE = int(os.getenv("PRECEDENT_GPT_SUMMARY_MEMORY_SIZE", "512"))
+# 프롬프트 / 후처리를 바꾸면 올려서 저장된 요약을 다시 생성
+PRECEDENT_GPT_SUMMARY_PROMPT_VERSION = 1
+
+SUMMARY_PROMPT = """
+        다음은 법원의 판결문입니다. 주어진 내용을 기반으로 판례의 핵심 내용을 요약해주세요.
+
+        **요약 조건**
+        - 사건 개요, 판결 과정, 판결 요약 순으로 정리할 것
+        - 핵심 판결 이유와 법원이 적용한 법 조항을 포함할 것
+        - 법원의 판단이 바뀐 주요 이유를 명확히 설명할 것
+        - 문장의 어미를 최대한 줄여서 통일할 것
+
+        **출력 예시**
+        【 사건 개요 】 피고인은 '사건 개요 요약' 혐의로 기소됨.
+
+        【 판결 과정 】 법원은 '판결 과정'을 근거로 판결을 내림.
+
+        【 판결 요약 】 이 사건은 '핵심 판결 내용 및 적용 법리'에 대한 판결로, 최종적으로 '주요 판결 결과'가 내려짐.
+
+        **판례 원문**
+        {precedent_text}
+        """
+
+# 워커 내 캐시 + 동시 동일 요청 병합 (DB 조회 / 생성은 get_or_set 의 factory 안에서 한 번만)
+# 값: (summary, 생성 여부)
+precedent_gpt_summary_cache = AsyncTTLCache(
+    "precedent_gpt_summary",
+    ttl=PRECEDENT_GPT_SUMMARY_MEMORY_TTL,
+    maxsize=PRECEDENT_GPT_SUMMARY_MEMORY_SIZE,
+)
+
+
+def _format_summary(summary: str) -> str:
+    # ✅ 개행 처리 개선
+    summary = summary.replace(". -", ".\n\n- ")  # 리스트 항목 개행 적용
+    summary = summary.replace("판시함.", "판시함.\n\n")  # 법적 판단 개행 적용
+    summary = summary.replace(". ", ".\n")  # 문장 끝 개행 추가
+    return summary
+
+
+def _precedent_text(detail) -> str:
+    if isinstance(detail, HTMLResponse):
+        return detail.body.decode("utf-8", errors="ignore")
+    return str(detail)
+
+
+async def generate_precedent_summary(pre_number: int) -> str:
+    """판례 원문 조회 → GPT 요약 (캐시를 거치지 않음)"""
+    detail = await fetch_external_precedent_detail(pre_number)
+    if not detail:
+        raise HTTPException(status_code=404, detail="판례 내용을 찾을 수 없습니다.")
+
+    llm = get_chat_model(
+        PRECEDENT_GPT_SUMMARY_MODEL, temperature=PRECEDENT_GPT_SUMMARY_TEMPERATURE
+    )
+    response = await ainvoke_with_timeout(
+        llm, SUMMARY_PROMPT.format(precedent_text=_precedent_text(detail))
+    )
+    return _format_summary(str(response.content))
+
+
+async def load_stored_summary(pre_number: int) -> Optional[str]:
+    row = await execute_sql_async(
+        """
+        SELECT summary
+        FROM precedent_gpt_summary
+        WHERE pre_number = :pre_number AND prompt_version = :prompt_version
+        """,
+        {
+            "pre_number": pre_number,
+            "prompt_version": PRECEDENT_GPT_SUMMARY_PROMPT_VERSION,
+        },
+        fetch_one=True,
+    )
+    return row["summary"] if row else None
+
+
+async def store_summary(pre_number: int, summary: str) -> bool:
+    rowcount = await execute_write_async(
+        """
+        INSERT INTO precedent_gpt_summary (pre_number, summary, model, prompt_version, created_at)
+        VALUES (:pre_number, :summary, :model, :prompt_version, now())
+        ON CONFLICT (pre_number) DO UPDATE
+        SET summary = EXCLUDED.summary,
+            model = EXCLUDED.model,
+            prompt_version = EXCLUDED.prompt_version,
+            created_at = now()
+        """,
+        {
+            "pre_number": pre_number,
+            "summary": summary,
+            "model": PRECEDENT_GPT_SUMMARY_MODEL,
+            "prompt_version": PRECEDENT_GPT_SUMMARY_PROMPT_VERSION,
+        },
+    )
+    return rowcount > 0
+
+
+async def get_or_create_precedent_summary(pre_number: int) -> dict:
+    """
+    메모리 → DB → 생성 순으로 요약 반환. {"summary", "cached"}
+    cached: 이번 요청 중에 새로 생성하지 않은 요약이면 True
+    (진행 중인 다른 요청의 생성 결과를 함께 받은 경우도 False)
+    생성 실패(HTTPException / 타임아웃 등)는 캐시하지 않고 그대로 전달.
+    """
+    in_memory = precedent_gpt_summary_cache.get(pre_number) is not None
+
+    async def load():
+        summary = await load_stored_summary(pre_number)
+        if summary is not None:
+            return summary, False
+        summary = await generate_precedent_summary(pre_number)
+        if not await store_summary(pre_number, summary):
+            print(f"⚠️ 판례 요약 저장 실패 (pre_number={pre_number})")
+        return summary, True
+
+    summary, generated = await precedent_gpt_summary_cache.get_or_set(pre_number, load)
+    return {"summary": summary, "cached": in_memory or not generated}
+
+
+async def _select_most_viewed(limit: int) -> list[dict]:
+    """열람 기록이 많은 판례 중 현재 버전 요약이 없는 것"""
+    return await execute_sql_async(
+        """
+        SELECT h.precedent_id AS pre_number, count(*) AS views
+        FROM history h
+        LEFT JOIN precedent_gpt_summary s
+            ON s.pre_number = h.precedent_id AND s.prompt_version = :prompt_version
+        WHERE h.precedent_id IS NOT NULL AND h.precedent_id > 0 AND s.pre_number IS NULL
+        GROUP BY h.precedent_id
+        ORDER BY views DESC
+        LIMIT :limit
+        """,
+        {"limit": limit, "prompt_version": PRECEDENT_GPT_SUMMARY_PROMPT_VERSION},
+    )
+
+
+async def precompute_summaries(limit: int = 200, concurrency: int = 3) -> dict:
+    targets = await _select_most_viewed(limit)
+    semaphore = asyncio.Semaphore(concurrency)
+    counts = {"targets": len(targets), "stored": 0, "failed": 0}
+
+    async def work(row):
+        pre_number = int(row["pre_number"])
+        async with semaphore:
+            try:
+                summary = await generate_precedent_summary(pre_number)
+            except HTTPException as e:
+                print(f"⚠️ pre_number={pre_number} 요약 실패: {e.detail}")
+                counts["failed"] += 1
+                return
+            except Exception as e:
+                print(f"⚠️ pre_number={pre_number} 요약 실패: {e}")
+                counts["failed"] += 1
+                return
+        if await store_summary(pre_number, summary):
+            counts["stored"] += 1
+            print(f"   ✅ {pre_number} (열람 {row['views']}회)")
+        else:
+            counts["failed"] += 1
+
+    await asyncio.gather(*(work(row) for row in targets))
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="열람 상위 판례 GPT 요약 선 생성")
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"📦 판례 요약 선 생성 (limit={args.limit}, concurrency={args.concurrency})")
+    started = time.perf_counter()
+    counts = asyncio.run(precompute_summaries(args.limit, args.concurrency))
+    print(
+        f"✅ 완료: 대상 {counts['targets']}건 / 저장 {counts['stored']}건 / "
+        f"실패 {counts['failed']}건 ({time.perf_counter() - started:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+import os
+import re
+import atexit
+from typing import Optional
+from sqlalchemy import text
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from app.core.database import engine, execute_sql, execute_sql_async
+from app.services.consultation_search import normalize_keywords
+
+# ✅ 판례 정밀 검색 (챗봇 LLM2 빌드용)
+# migrations/002_precedent_recent_view.sql 의 precedent_recent 뷰 / GIN 인덱스 필요
+
+# precedent_recent 뷰가 담고 있는 기간 (마이그레이션의 INTERVAL 과 동일해야 함)
+PRECEDENT_RECENT_VIEW_YEARS = 10
+# 기본 검색 기간 (년). 0 이하이면 전체 기간 검색
+PRECEDENT_SEARCH_RECENT_YEARS = int(os.getenv("PRECEDENT_SEARCH_RECENT_YEARS", "10"))
+# 뷰 갱신 주기 (시간)
+PRECEDENT_RECENT_REFRESH_HOURS = float(os.getenv("PRECEDENT_RECENT_REFRESH_HOURS", "24"))
+# 여러 워커가 동시에 REFRESH 하지 않도록 사용하는 advisory lock 키
+PRECEDENT_RECENT_REFRESH_LOCK_ID = 7_006_001
+
+# 필드 가중치 (사용자 입력 키워드와의 similarity 평균에 곱함)
+PRECEDENT_FIELD_WEIGHTS = {
+    "c_name": 0.7,
+    "c_number": 0.15,
+    "court": 0.05,
+    "c_type": 0.05,
+}
+# 인덱스로 선별한 후보 중 순위를 계산할 최대 행 수
+PRECEDENT_CANDIDATE_LIMIT = 200
+
+
+def _extract_words(values) -> list[str]:
+    words = []
+    for value in values or []:
+        words.extend(re.findall(r"\b\w+\b", str(value)))
+    return words
+
+
+def resolve_precedent_source(recent_years: Optional[int]) -> str:
+    """검색 기간이 뷰 범위 안이면 precedent_recent, 아니면 원본 precedent 테이블"""
+    if recent_years is not None and 0 < recent_years <= PRECEDENT_RECENT_VIEW_YEARS:
+        return "precedent_recent"
+    return "precedent"
+
+
+def build_precedent_search_query(
+    user_input_keywords: list[str],
+    filter_terms: list[str],
+    recent_years: Optional[int] = PRECEDENT_SEARCH_RECENT_YEARS,
+    limit: int = 5,
+    candidate_limit: int = PRECEDENT_CANDIDATE_LIMIT,
+) -> tuple[str, dict]:
+    """
+    바인드 파라미터 기반 판례 검색 쿼리 생성.
+    1) c_name % :termN (키워드/제목/카테고리 단어별 GIN 인덱스 스캔) + 기간 조건으로 후보 선별,
+       c_name 기준 최대 similarity 가 높은 순으로 candidate_limit 개만 남김
+    2) 후보 행에 대해서만 사용자 키워드 similarity 평균의 가중합을 한 번 계산해 정렬
+    """
+    source = resolve_precedent_source(recent_years)
+    params = {f"term{i}": term for i, term in enumerate(filter_terms)}
+    params.update(
+        {
+            "keywords": list(user_input_keywords),
+            "limit": limit,
+            "candidate_limit": candidate_limit,
+        }
+    )
+
+    conditions = [
+        "(" + " OR ".join(f"c_name % :term{i}" for i in range(len(filter_terms))) + ")"
+    ]
+    if recent_years is not None and recent_years > 0:
+        conditions.append("j_date >= CURRENT_DATE - make_interval(years => :recent_years)")
+        params["recent_years"] = recent_years
+
+    # 후보 순서: 인덱스 재검사에서 이미 읽은 c_name 하나로 계산하는 저렴한 관련도
+    candidate_score = ", ".join(
+        f"similarity(c_name, :term{i})" for i in range(len(filter_terms))
+    )
+    weighted_score = "\n            + ".join(
+        f"COALESCE(avg(similarity(c.{column}, kw)), 0) * {weight}"
+        for column, weight in PRECEDENT_FIELD_WEIGHTS.items()
+    )
+
+    query = f"""
+    WITH candidates AS (
+        SELECT id, c_number, c_type, j_date, court, c_name, d_link
+        FROM {source}
+        WHERE {" AND ".join(conditions)}
+        ORDER BY GREATEST({candidate_score}) DESC, id
+        LIMIT :candidate_limit
+    )
+    SELECT
+        c.id,
+        c.c_number,
+        c.c_type,
+        c.j_date,
+        c.court,
+        c.c_name,
+        c.d_link,
+        s.score AS final_weighted_score
+    FROM candidates c
+    CROSS JOIN LATERAL (
+        SELECT (
+            {weighted_score}
+        ) AS score
+        FROM unnest(CAST(:keywords AS text[])) AS kw
+    ) s
+    ORDER BY final_weighted_score DESC, c.id
+    LIMIT :limit;
+    """
+    return query, params
+
+
+def _prepare_precedent_search(
+    categories, titles, user_input_keywords, recent_years, limit
+) -> Optional[tuple[str, dict]]:
+    keywords = normalize_keywords(user_input_keywords)
+    if not keywords:
+        return None
+
+    filter_terms = normalize_keywords(
+        keywords + _extract_words(titles) + _extract_words(categories)
+    )
+    return build_precedent_search_query(
+        keywords, filter_terms, recent_years=recent_years, limit=limit
+    )
+
+
+def search_precedent_candidates(
+    categories,
+    titles,
+    user_input_keywords,
+    recent_years: Optional[int] = PRECEDENT_SEARCH_RECENT_YEARS,
+    limit: int = 5,
+):
+    """카테고리 + 제목 + 사용자 입력 키워드 기반 판례 정밀 검색 (동기 실행)"""
+    prepared = _prepare_precedent_search(
+        categories, titles, user_input_keywords, recent_years, limit
+    )
+    if prepared is None:
+        return []
+    return execute_sql(*prepared)
+
+
+async def search_precedent_candidates_async(
+    categories,
+    titles,
+    user_input_keywords,
+    recent_years: Optional[int] = PRECEDENT_SEARCH_RECENT_YEARS,
+    limit: int = 5,
+):
+    """search_precedent_candidates 의 비동기 엔진 버전"""
+    prepared = _prepare_precedent_search(
+        categories, titles, user_input_keywords, recent_years, limit
+    )
+    if prepared is None:
+        return []
+    return await execute_sql_async(*prepared)
+
+
+# ---------------------------------------------------------------------------------
+# ✅ precedent_recent 주기적 갱신
+
+
+def refresh_precedent_recent() -> bool:
+    """REFRESH MATERIALIZED VIEW CONCURRENTLY (다른 워커가 갱신 중이면 건너뜀)"""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        locked = connection.execute(
+            text("SELECT pg_try_advisory_lock(:lock_id)"),
+            {"lock_id": PRECEDENT_RECENT_REFRESH_LOCK_ID},
+        ).scalar()
+        if not locked:
+            print("ℹ️ precedent_recent 갱신이 이미 진행 중입니다. 건너뜀")
+            return False
+
+        try:
+            connection.exec_driver_sql(
+                "REFRESH MATERIALIZED VIEW CONCURRENTLY precedent_recent"
+            )
+            connection.exec_driver_sql("ANALYZE precedent_recent")
+            print("✅ precedent_recent 갱신 완료")
+            return True
+        except Exception as e:
+            print(f"❌ precedent_recent 갱신 실패: {e}")
+            return False
+        finally:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:lock_id)"),
+                {"lock_id": PRECEDENT_RECENT_REFRESH_LOCK_ID},
+            )
+
+
+_scheduler: Optional[BackgroundScheduler] = None
+
+
+def start_precedent_refresh_scheduler() -> None:
+    """워커 시작 시 1회 호출 (PRECEDENT_RECENT_REFRESH_HOURS <= 0 이면 비활성화)"""
+    global _scheduler
+    if _scheduler is not None or PRECEDENT_RECENT_REFRESH_HOURS <= 0:
+        return
+
+    _scheduler = BackgroundScheduler()
+    _scheduler.add_job(
+        refresh_precedent_recent,
+        IntervalTrigger(hours=PRECEDENT_RECENT_REFRESH_HOURS),
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.start()
+    atexit.register(lambda: _scheduler.shutdown(wait=False))
+
+
+if __name__ == "__main__":
+    # python -m app.services.precedent_search  → 수동 갱신
+    refresh_precedent_recent()
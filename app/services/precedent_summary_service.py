@@ -0,0 +1,225 @@
+"""
+판례 요약 로컬 저장소 (precSeq 기준, zlib 압축).
+
+    python -m app.services.precedent_summary_service --limit 1000 --concurrency 4
+    python -m app.services.precedent_summary_service --refresh-tavily   # Tavily 요약을 원문 요지로 교체
+
+에이전트는 이 저장소를 먼저 조회하고, 없을 때만 Tavily 를 호출한 뒤 백그라운드로
+fetch_external_precedent_detail 결과(판결요지 / 판시사항)를 적재한다.
+테이블은 migrations/004_precedent_summary.sql 로 생성한다.
+"""
+import re
+import os
+import zlib
+import time
+import asyncio
+import argparse
+from typing import Optional
+from fastapi import HTTPException
+from app.core.database import execute_sql_async, execute_write_async
+from app.services.precedent_detail_service import fetch_external_precedent_detail
+
+PRECEDENT_SUMMARY_MAX_CHARS = int(os.getenv("PRECEDENT_SUMMARY_MAX_CHARS", "800"))
+PRECEDENT_SUMMARY_ZLIB_LEVEL = int(os.getenv("PRECEDENT_SUMMARY_ZLIB_LEVEL", "6"))
+
+SOURCE_LAW_GO_KR = "law.go.kr"  # 상세 API 원문 요지
+SOURCE_TAVILY = "tavily"  # 상세 API 에 요지가 없을 때 Tavily 검색 요약
+
+# 상세 API(PrecService) 에서 요약으로 쓸 필드 (앞쪽 우선)
+_DETAIL_SUMMARY_FIELDS = ("판결요지", "판시사항")
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def casenote_url_for(prec_seq) -> str:
+    return f"https://law.go.kr/LSW/precInfoP.do?precSeq={prec_seq}"
+
+
+def compress_summary(summary: str) -> bytes:
+    return zlib.compress(summary.encode("utf-8"), PRECEDENT_SUMMARY_ZLIB_LEVEL)
+
+
+def decompress_summary(data: bytes) -> str:
+    return zlib.decompress(bytes(data)).decode("utf-8")
+
+
+def summary_from_detail(detail) -> Optional[str]:
+    """PrecService JSON 에서 판결요지 → 판시사항 순으로 요약 추출 (HTML 응답 등은 None)"""
+    if not isinstance(detail, dict):
+        return None
+    for field in _DETAIL_SUMMARY_FIELDS:
+        value = detail.get(field)
+        if not isinstance(value, str):
+            continue
+        cleaned = _SPACE_RE.sub(" ", _TAG_RE.sub(" ", value)).strip()
+        if cleaned:
+            return cleaned[:PRECEDENT_SUMMARY_MAX_CHARS]
+    return None
+
+
+async def get_precedent_summary(prec_seq) -> Optional[dict]:
+    """저장된 요약 {summary, casenote_url, source}. 없거나 조회 실패 시 None"""
+    try:
+        prec_seq = int(prec_seq)
+    except (TypeError, ValueError):
+        return None
+
+    row = await execute_sql_async(
+        """
+        SELECT summary_z, casenote_url, source
+        FROM precedent_summary
+        WHERE prec_seq = :prec_seq
+        """,
+        {"prec_seq": prec_seq},
+        fetch_one=True,
+    )
+    if not row:
+        return None
+    try:
+        summary = decompress_summary(row["summary_z"])
+    except (zlib.error, UnicodeDecodeError) as e:
+        print(f"⚠️ 판례 요약 복원 실패 (precSeq={prec_seq}): {e}")
+        return None
+    return {
+        "summary": summary,
+        "casenote_url": row["casenote_url"] or casenote_url_for(prec_seq),
+        "source": row["source"],
+    }
+
+
+async def save_precedent_summary(
+    prec_seq, summary: str, casenote_url: str = "", source: str = SOURCE_LAW_GO_KR
+) -> bool:
+    """
+    요약 저장 (upsert). 이미 원문 요지(law.go.kr)가 있으면 Tavily 요약으로 덮어쓰지 않는다.
+    """
+    if not summary:
+        return False
+    rowcount = await execute_write_async(
+        """
+        INSERT INTO precedent_summary (prec_seq, summary_z, casenote_url, source, updated_at)
+        VALUES (:prec_seq, :summary_z, :casenote_url, :source, now())
+        ON CONFLICT (prec_seq) DO UPDATE
+        SET summary_z = EXCLUDED.summary_z,
+            casenote_url = EXCLUDED.casenote_url,
+            source = EXCLUDED.source,
+            updated_at = now()
+        WHERE precedent_summary.source <> :law_go_kr OR EXCLUDED.source = :law_go_kr
+        """,
+        {
+            "prec_seq": int(prec_seq),
+            "summary_z": compress_summary(summary),
+            "casenote_url": casenote_url or casenote_url_for(prec_seq),
+            "source": source,
+            "law_go_kr": SOURCE_LAW_GO_KR,
+        },
+    )
+    return rowcount > 0
+
+
+async def populate_precedent_summary(
+    prec_seq, fallback_summary: Optional[str] = None, fallback_url: str = ""
+) -> Optional[str]:
+    """
+    상세 API 결과로 요약을 적재한다. 요지가 없으면 fallback_summary(Tavily 요약)를 대신 저장.
+    저장한 출처(law.go.kr / tavily)를 반환하며, 아무것도 저장하지 못하면 None.
+    """
+    try:
+        detail = await fetch_external_precedent_detail(int(prec_seq))
+    except HTTPException as e:
+        print(f"⚠️ 판례 상세 조회 실패 (precSeq={prec_seq}): {e.detail}")
+        detail = None
+
+    summary = summary_from_detail(detail)
+    if summary:
+        if await save_precedent_summary(prec_seq, summary, casenote_url_for(prec_seq)):
+            return SOURCE_LAW_GO_KR
+        return None
+
+    if fallback_summary and not fallback_summary.startswith("❌"):
+        if await save_precedent_summary(
+            prec_seq, fallback_summary, fallback_url, source=SOURCE_TAVILY
+        ):
+            return SOURCE_TAVILY
+    return None
+
+
+async def _select_targets(limit: int, refresh_tavily: bool) -> list[int]:
+    """아직 요약이 없는 (또는 Tavily 요약만 있는) 판례의 precSeq, 최근 선고일 순"""
+    if refresh_tavily:
+        query = """
+        SELECT prec_seq
+        FROM precedent_summary
+        WHERE source = :tavily
+        ORDER BY updated_at
+        LIMIT :limit
+        """
+    else:
+        query = """
+        SELECT p.pre_number::bigint AS prec_seq
+        FROM precedent p
+        LEFT JOIN precedent_summary s ON s.prec_seq = p.pre_number::bigint
+        WHERE p.pre_number IS NOT NULL AND s.prec_seq IS NULL
+        GROUP BY p.pre_number
+        ORDER BY max(p.j_date) DESC NULLS LAST
+        LIMIT :limit
+        """
+    rows = await execute_sql_async(query, {"limit": limit, "tavily": SOURCE_TAVILY})
+    return [int(row["prec_seq"]) for row in rows]
+
+
+async def populate_batch(
+    limit: int = 1000, concurrency: int = 4, refresh_tavily: bool = False
+) -> dict:
+    """오프라인 일괄 적재 (law.go.kr 상세 API 동시 호출 수 = concurrency)"""
+    targets = await _select_targets(limit, refresh_tavily)
+    semaphore = asyncio.Semaphore(concurrency)
+    counts = {"targets": len(targets), "stored": 0, "skipped": 0}
+
+    async def work(prec_seq: int):
+        async with semaphore:
+            try:
+                detail = await fetch_external_precedent_detail(prec_seq)
+            except HTTPException as e:
+                print(f"⚠️ precSeq={prec_seq} 상세 조회 실패: {e.detail}")
+                detail = None
+        summary = summary_from_detail(detail)
+        if summary and await save_precedent_summary(
+            prec_seq, summary, casenote_url_for(prec_seq)
+        ):
+            counts["stored"] += 1
+        else:
+            counts["skipped"] += 1
+
+        done = counts["stored"] + counts["skipped"]
+        if done % 100 == 0:
+            print(f"   {done}/{len(targets)} 처리")
+
+    await asyncio.gather(*(work(prec_seq) for prec_seq in targets))
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="판례 요약 로컬 저장소 일괄 적재")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--refresh-tavily",
+        action="store_true",
+        help="Tavily 요약으로 저장된 판례를 상세 API 요지로 다시 시도",
+    )
+    args = parser.parse_args()
+
+    print(f"📦 판례 요약 적재 시작 (limit={args.limit}, concurrency={args.concurrency})")
+    started = time.perf_counter()
+    counts = asyncio.run(
+        populate_batch(args.limit, args.concurrency, args.refresh_tavily)
+    )
+    print(
+        f"✅ 완료: 대상 {counts['targets']}건 / 저장 {counts['stored']}건 / "
+        f"건너뜀 {counts['skipped']}건 ({time.perf_counter() - started:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
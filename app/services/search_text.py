@@ -0,0 +1,22 @@
+import re
+
+# ✅ 띄어쓰기 무시 검색용 정규화
+# migrations/003_normalized_search_columns.sql 의 *_normalized 생성 컬럼과 같은 규칙을 사용해야 함
+#   lower(regexp_replace(col, '\s', '', 'g'))
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_search_text(value: str) -> str:
+    """공백 문자 제거 + 소문자"""
+    return _WHITESPACE.sub("", value or "").lower()
+
+
+def escape_like(value: str) -> str:
+    """LIKE 패턴의 와일드카드(%, _)와 이스케이프 문자를 그대로 검색되도록 처리"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains_pattern(value: str) -> str:
+    """정규화 컬럼에 대한 부분 일치 LIKE 패턴"""
+    return f"%{escape_like(normalize_search_text(value))}%"
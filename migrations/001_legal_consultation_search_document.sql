@@ -0,0 +1,21 @@
+-- ✅ 상담 정밀 검색(async_search_consultation)용 검색 문서 컬럼 + trigram GIN 인덱스
+--    후보 선별: search_document %> :keyword  (GIN 인덱스 사용)
+--    순위 계산: 후보 행에 대해서만 word_similarity 가중합
+--    (%> 연산자 임계값은 pg_trgm.word_similarity_threshold, 기본 0.6)
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 가중치 순서(title > sub_category > question > answer)로 이어 붙인 검색 문서
+ALTER TABLE legal_consultation
+    ADD COLUMN IF NOT EXISTS search_document text
+    GENERATED ALWAYS AS (
+        coalesce(title, '') || ' ' ||
+        coalesce(sub_category, '') || ' ' ||
+        coalesce(question, '') || ' ' ||
+        coalesce(answer, '')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_legal_consultation_search_document_trgm
+    ON legal_consultation USING gin (search_document gin_trgm_ops);
+
+ANALYZE legal_consultation;
@@ -0,0 +1,29 @@
+-- ✅ 판례 정밀 검색(async_search_precedent)용 최근 판례 슬라이스
+--    precedent_recent: 최근 10년 판례만 담은 materialized view (주기적으로 REFRESH)
+--    app/services/precedent_search.py 의 PRECEDENT_RECENT_VIEW_YEARS 와 기간을 맞출 것
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS precedent_recent AS
+SELECT id, c_number, c_type, j_date, court, c_name, d_link, pre_number
+FROM precedent
+WHERE j_date >= (CURRENT_DATE - INTERVAL '10 years');
+
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY 에 필요한 유니크 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS idx_precedent_recent_id
+    ON precedent_recent (id);
+
+CREATE INDEX IF NOT EXISTS idx_precedent_recent_c_name_trgm
+    ON precedent_recent USING gin (c_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_precedent_recent_j_date
+    ON precedent_recent (j_date DESC);
+
+-- 뷰 기간을 벗어나는 검색(전체 기간)은 원본 테이블의 인덱스를 사용
+CREATE INDEX IF NOT EXISTS idx_precedent_c_name_trgm
+    ON precedent USING gin (c_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_precedent_j_date
+    ON precedent (j_date DESC);
+
+ANALYZE precedent_recent;
@@ -0,0 +1,39 @@
+-- ✅ /api/search 띄어쓰기 무시 검색용 정규화 컬럼 + trigram GIN 인덱스
+--    기존: REPLACE(col, ' ', '') ILIKE :keyword  → 행마다 문자열 변환, 인덱스 사용 불가
+--    변경: col_normalized LIKE :normalized_keyword  → GIN 인덱스 사용
+--    정규화 규칙(공백 문자 제거 + 소문자)은 app/services/search_text.py 의 normalize_search_text 와 같아야 함
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 판례
+ALTER TABLE precedent
+    ADD COLUMN IF NOT EXISTS c_name_normalized text
+    GENERATED ALWAYS AS (lower(regexp_replace(coalesce(c_name, ''), '\s', '', 'g'))) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_precedent_c_name_normalized_trgm
+    ON precedent USING gin (c_name_normalized gin_trgm_ops);
+
+-- 키워드 검색의 나머지 OR 조건(court / c_number ILIKE)도 인덱스로 처리되도록
+CREATE INDEX IF NOT EXISTS idx_precedent_court_trgm
+    ON precedent USING gin (court gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_precedent_c_number_trgm
+    ON precedent USING gin (c_number gin_trgm_ops);
+
+-- 상담
+ALTER TABLE legal_consultation
+    ADD COLUMN IF NOT EXISTS title_normalized text
+    GENERATED ALWAYS AS (lower(regexp_replace(coalesce(title, ''), '\s', '', 'g'))) STORED;
+
+ALTER TABLE legal_consultation
+    ADD COLUMN IF NOT EXISTS question_normalized text
+    GENERATED ALWAYS AS (lower(regexp_replace(coalesce(question, ''), '\s', '', 'g'))) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_legal_consultation_title_normalized_trgm
+    ON legal_consultation USING gin (title_normalized gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_legal_consultation_question_normalized_trgm
+    ON legal_consultation USING gin (question_normalized gin_trgm_ops);
+
+ANALYZE precedent;
+ANALYZE legal_consultation;
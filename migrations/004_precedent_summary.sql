@@ -0,0 +1,20 @@
+-- ✅ 판례 요약 로컬 저장소 (precSeq = law.go.kr 판례 일련번호 = precedent.pre_number)
+--    app/services/precedent_summary_service.py 가 조회 / 적재한다.
+--    - 에이전트가 Tavily 대신 먼저 조회 (미스일 때만 Tavily → 백그라운드로 상세 API 결과 적재)
+--    - 오프라인 일괄 적재: python -m app.services.precedent_summary_service --limit 1000
+--    summary_z: zlib 압축된 UTF-8 요약 텍스트
+
+CREATE TABLE IF NOT EXISTS precedent_summary (
+    prec_seq     BIGINT PRIMARY KEY,
+    summary_z    BYTEA NOT NULL,
+    casenote_url TEXT NOT NULL DEFAULT '',
+    source       TEXT NOT NULL,
+    updated_at   TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- 이미 압축된 값이므로 TOAST 재압축은 생략 (행 밖 저장만 허용)
+ALTER TABLE precedent_summary ALTER COLUMN summary_z SET STORAGE EXTERNAL;
+
+-- 일괄 적재 시 Tavily 로 채워진 항목만 다시 고를 때 사용
+CREATE INDEX IF NOT EXISTS idx_precedent_summary_source
+    ON precedent_summary (source);
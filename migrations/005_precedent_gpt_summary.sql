@@ -0,0 +1,18 @@
+-- ✅ /api/detail/precedent/summary/{pre_number} 의 GPT 요약 캐시
+--    app/services/precedent_gpt_summary_service.py 가 조회 / 저장한다.
+--    - 미스일 때만 생성 (같은 판례 동시 요청은 한 번만 생성)
+--    - 열람 기록 상위 판례 선 요약: python -m app.services.precedent_gpt_summary_service --limit 200
+--    prompt_version 이 현재 값과 다르면 미스로 보고 다시 생성한다.
+
+CREATE TABLE IF NOT EXISTS precedent_gpt_summary (
+    pre_number     BIGINT PRIMARY KEY,
+    summary        TEXT NOT NULL,
+    model          TEXT NOT NULL,
+    prompt_version INTEGER NOT NULL,
+    created_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- 선 요약 대상 선정 (열람 수 집계)
+CREATE INDEX IF NOT EXISTS idx_history_precedent_id
+    ON history (precedent_id)
+    WHERE precedent_id IS NOT NULL;
@@ -0,0 +1,83 @@
+import asyncio
+from types import SimpleNamespace
+from app.chatbot import routes
+from app.chatbot.memory.session_store import InMemorySessionStore, set_session_store
+
+PREPARED = {
+    "template": {"summary": "요약"},
+    "strategy": {"final_strategy_summary": "전략"},
+    "precedent": {"summary": "판례"},
+    "status": "build_only",
+}
+
+
+class FakeRequest:
+    def __init__(self, disconnect_after: int = None):
+        self.checks = 0
+        self.disconnect_after = disconnect_after
+
+    async def is_disconnected(self):
+        self.checks += 1
+        return self.disconnect_after is not None and self.checks > self.disconnect_after
+
+
+def _install_stubs(monkeypatch, tokens):
+    seen = {}
+
+    async def fake_build(**kwargs):
+        seen["stop_event"] = kwargs["stop_event"]
+        await kwargs["on_event"]("template_done", {"summary": "요약"})
+        await kwargs["on_event"]("precedent_found", {"status": "ok"})
+        return dict(PREPARED)
+
+    async def fake_stream(**kwargs):
+        for token in tokens:
+            await asyncio.sleep(0)
+            yield token
+
+    monkeypatch.setattr(routes, "run_full_consultation", fake_build)
+    monkeypatch.setattr(routes, "astream_final_answer", fake_stream)
+    set_session_store(InMemorySessionStore())
+    return seen
+
+
+def _event_names(chunks):
+    return [chunk.split(b"\n", 1)[0].removeprefix(b"event: ").decode() for chunk in chunks]
+
+
+async def _collect(request):
+    analysis = SimpleNamespace(adjusted_keywords=["보증금"])
+    return [
+        chunk
+        async for chunk in routes._advanced_event_stream(request, "질문", analysis, "sse")
+    ]
+
+
+def test_advanced_stream_event_order(monkeypatch):
+    seen = _install_stubs(monkeypatch, ["안녕", "하세요"])
+
+    chunks = asyncio.run(_collect(FakeRequest()))
+
+    assert _event_names(chunks) == [
+        "template_done",
+        "precedent_found",
+        "prepared",
+        "token",
+        "token",
+        "done",
+    ]
+    assert b'"content":"\xec\x95\x88\xeb\x85\x95"' in chunks[3]
+    assert seen["stop_event"].is_set()  # 정상 종료 후에도 정리
+
+
+def test_advanced_stream_disconnect_sets_stop_event(monkeypatch):
+    seen = _install_stubs(monkeypatch, ["하나", "둘", "셋", "넷"])
+    # 빌드 이벤트 전달 중 확인 + 첫 토큰 뒤에 연결 끊김
+    request = FakeRequest(disconnect_after=4)
+
+    chunks = asyncio.run(_collect(request))
+    names = _event_names(chunks)
+
+    assert "done" not in names
+    assert names.count("token") < 4
+    assert seen["stop_event"].is_set()
@@ -0,0 +1,51 @@
+import asyncio
+import pytest
+from app.core.cache import AsyncTTLCache
+
+
+def test_cancelled_starter_does_not_cancel_waiters():
+    """먼저 조회를 시작한 요청이 취소되어도 같은 키를 기다리던 요청은 결과를 받는다"""
+    cache = AsyncTTLCache("test")
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def scenario():
+        starter = asyncio.create_task(cache.get_or_set("key", factory))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_set("key", factory))
+        await asyncio.sleep(0)
+
+        starter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await starter
+        return await waiter
+
+    assert asyncio.run(scenario()) == "value"
+    assert calls == 1
+    assert cache.get("key") == "value"
+    assert cache.stats()["coalesced"] == 1
+
+
+def test_factory_error_is_shared_and_not_cached():
+    cache = AsyncTTLCache("test")
+
+    async def factory():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def scenario():
+        return await asyncio.gather(
+            cache.get_or_set("key", factory),
+            cache.get_or_set("key", factory),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert cache.get("key") is None
+    assert cache.stats()["inflight"] == 0
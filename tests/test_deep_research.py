@@ -0,0 +1,108 @@
+import time
+import asyncio
+import threading
+from app.deepresearch.research import deep_research as dr
+from app.deepresearch.research.research_models import SerpQuery
+
+
+class FakeCrawler:
+    """Firecrawl 대신 쿼리별 URL 목록을 돌려주는 동기 클라이언트 (동시 검색 수 기록)"""
+
+    def __init__(self, urls_by_query=None, latency: float = 0.0):
+        self.urls_by_query = urls_by_query or {}
+        self.latency = latency
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def search(self, query):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency)
+            return self.urls_by_query.get(query, [f"https://law.go.kr/{query}"])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def process_results(self, urls):
+        return [{"url": url, "title": url, "markdown": f"본문 {url}"} for url in urls]
+
+
+def _install(monkeypatch, crawler, process=None):
+    calls = {"serp": [], "processed": []}
+
+    async def fake_generate(query, client, model, num_queries, learnings=None, on_usage=None):
+        calls["serp"].append((num_queries, list(learnings or [])))
+        prefix = f"d{len(calls['serp'])}"
+        return [SerpQuery(query=f"{prefix}-q{i}", research_goal="목표") for i in range(num_queries)]
+
+    async def fake_process(query, search_result, client, model, on_usage=None):
+        calls["processed"].append((query, [item.url for item in search_result]))
+        if process is not None:
+            return await process(query)
+        return {"learnings": [f"학습 {query}"], "followUpQuestions": [f"후속 {query}"]}
+
+    monkeypatch.setattr(dr, "FirecrawlClient", lambda search_type: crawler)
+    monkeypatch.setattr(dr, "generate_serp_queries", fake_generate)
+    monkeypatch.setattr(dr, "process_serp_result", fake_process)
+    return calls
+
+
+def test_depth_recursion_halves_breadth(monkeypatch):
+    calls = _install(monkeypatch, FakeCrawler())
+
+    result = asyncio.run(dr.deep_research("전세 보증금", breadth=4, depth=2, concurrency=4))
+
+    # 1단계: 4개 쿼리 → 각 분기의 후속 질문으로 2단계: breadth 4 // 2 = 2개씩
+    assert calls["serp"][0] == (4, [])
+    follow_ups = calls["serp"][1:]
+    assert len(follow_ups) == 4
+    assert all(num_queries == 2 for num_queries, _ in follow_ups)
+    # 후속 단계에는 부모 분기의 학습 내용이 전달됨
+    assert all(len(learnings) == 1 for _, learnings in follow_ups)
+    assert len(result.learnings) == 4 + 4 * 2
+
+
+def test_urls_seen_in_one_branch_are_skipped_in_another(monkeypatch):
+    shared = "https://law.go.kr/shared"
+    crawler = FakeCrawler(
+        {
+            "d1-q0": [shared, "https://law.go.kr/a"],
+            "d1-q1": [shared, "https://law.go.kr/b"],
+        }
+    )
+    calls = _install(monkeypatch, crawler)
+
+    result = asyncio.run(dr.deep_research("질문", breadth=2, depth=1, concurrency=1))
+
+    processed_urls = [url for _, urls in calls["processed"] for url in urls]
+    assert processed_urls.count(shared) == 1
+    assert sorted(result.visited_urls) == sorted({shared, "https://law.go.kr/a", "https://law.go.kr/b"})
+
+
+def test_concurrent_searches_are_capped(monkeypatch):
+    crawler = FakeCrawler(latency=0.05)
+    _install(monkeypatch, crawler)
+
+    asyncio.run(dr.deep_research("질문", breadth=6, depth=1, concurrency=2))
+
+    assert crawler.max_active == 2
+
+
+def test_time_budget_returns_learnings_gathered_so_far(monkeypatch):
+    async def process(query):
+        if query == "d1-q1":
+            await asyncio.sleep(10)  # 예산 안에 끝나지 않는 분기
+        return {"learnings": [f"학습 {query}"], "followUpQuestions": []}
+
+    _install(monkeypatch, FakeCrawler(), process=process)
+
+    started = time.perf_counter()
+    result = asyncio.run(
+        dr.deep_research("질문", breadth=2, depth=1, concurrency=2, time_budget=0.2)
+    )
+
+    assert time.perf_counter() - started < 2
+    assert result.learnings == ["학습 d1-q0"]
@@ -0,0 +1,39 @@
+import asyncio
+from langchain_core.messages import AIMessage
+from app.chatbot.memory import history
+from app.chatbot.memory.session_store import InMemorySessionStore, set_session_store
+
+
+def test_summary_keeps_turns_added_during_summarization(monkeypatch):
+    """요약 중 히스토리 상한으로 앞쪽 턴이 밀려나도 요약하지 않은 새 턴은 지우지 않는다"""
+    store = InMemorySessionStore(history_limit=4)
+    set_session_store(store)
+
+    async def fake_ainvoke(llm, prompt):
+        # 요약하는 동안 새 턴 2개가 들어와 t0, t1 이 상한으로 밀려남
+        await store.append_history("s", "q4", "a4")
+        await store.append_history("s", "q5", "a5")
+        return AIMessage(content="요약")
+
+    monkeypatch.setattr(history, "get_chat_model", lambda *args, **kwargs: None)
+    monkeypatch.setattr(history, "ainvoke_with_timeout", fake_ainvoke)
+
+    async def scenario():
+        for i in range(4):
+            await store.append_history("s", f"q{i}", f"a{i}")
+        # window 예산 0 → 저장된 4턴 전체가 요약 대상
+        summary = await history.summarize_overflow("s", budget=history.HISTORY_SUMMARY_MAX_TOKENS)
+        return summary, await store.get_history("s"), await store.get_summary("s")
+
+    summary, turns, stored_summary = asyncio.run(scenario())
+
+    assert summary == stored_summary == "요약"
+    assert [turn["user"] for turn in turns] == ["q4", "q5"]
+
+
+def test_remaining_summarized_without_eviction():
+    snapshot = [{"user": "q0"}, {"user": "q1"}, {"user": "q2"}]
+    current = snapshot + [{"user": "q3"}]
+
+    assert history._remaining_summarized(snapshot, current, 2) == 2
+    assert history._remaining_summarized(snapshot, [], 2) == 0
@@ -0,0 +1,89 @@
+import asyncio
+from app.chatbot.initial_agents import controller
+from app.chatbot.memory.session_store import InMemorySessionStore, set_session_store
+
+CACHED_ANSWER = {
+    "initial_response": "다른 세션의 대화가 반영된 응답 ###yes",
+    "is_no": False,
+    "query_type": "legal",
+    "mcq_question": "후속 질문",
+    "is_mcq": True,
+    "template": {},
+}
+
+
+class FakeSemanticCache:
+    def __init__(self):
+        self.lookups = []
+        self.stores = []
+
+    async def lookup(self, query):
+        self.lookups.append(query)
+        return dict(CACHED_ANSWER), 0.99
+
+    async def store(self, query, value):
+        self.stores.append(query)
+
+
+class FakeChatbot:
+    def __init__(self, faiss_db):
+        pass
+
+    async def generate(self, user_query, current_yes_count, session_id, **kwargs):
+        return {
+            "initial_response": "이 세션에서 새로 만든 응답",
+            "is_no": False,
+            "query_type": "legal",
+            "yes_count": current_yes_count,
+        }
+
+
+class FakeAskHumanAgent:
+    async def ask_human(self, user_query, current_yes_count, **kwargs):
+        return {
+            "yes_count": current_yes_count,
+            "mcq_question": "새 후속 질문",
+            "is_mcq": True,
+            "load_template_signal": False,
+            "template": {},
+        }
+
+
+def _setup(monkeypatch):
+    cache = FakeSemanticCache()
+    monkeypatch.setattr(controller, "initial_answer_cache", cache)
+    monkeypatch.setattr(controller, "LegalChatbot", FakeChatbot)
+    monkeypatch.setattr(controller, "AskHumanAgent", FakeAskHumanAgent)
+    set_session_store(InMemorySessionStore())
+    return cache
+
+
+def test_session_with_history_skips_semantic_cache(monkeypatch):
+    """대화 히스토리가 있는 세션은 다른 세션의 캐시 응답을 받지도, 자기 응답을 저장하지도 않는다"""
+    cache = _setup(monkeypatch)
+    asyncio.run(
+        controller.save_chat_turn("이전 질문 (개인 사건 내용)", "이전 답변", "with-history")
+    )
+
+    result = asyncio.run(
+        controller.run_initial_controller(
+            "전세보증금을 돌려받지 못했어요", faiss_db=None, session_id="with-history"
+        )
+    )
+
+    assert cache.lookups == []
+    assert cache.stores == []
+    assert result["initial_response"] == "이 세션에서 새로 만든 응답"
+
+
+def test_fresh_session_uses_semantic_cache(monkeypatch):
+    cache = _setup(monkeypatch)
+
+    result = asyncio.run(
+        controller.run_initial_controller(
+            "전세보증금을 돌려받지 못했어요", faiss_db=None, session_id="fresh"
+        )
+    )
+
+    assert cache.lookups == ["전세보증금을 돌려받지 못했어요"]
+    assert result["initial_response"] == CACHED_ANSWER["initial_response"]
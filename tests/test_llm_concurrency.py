@@ -0,0 +1,41 @@
+import asyncio
+from app.core import llm as llm_module
+
+
+class FakeLLM:
+    model_name = "test-queue-model"
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.active = 0
+        self.max_active = 0
+
+    async def ainvoke(self, messages):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            return messages
+        finally:
+            self.active -= 1
+
+
+def test_queue_wait_does_not_count_against_timeout(monkeypatch):
+    """슬롯을 기다린 시간은 타임아웃에 포함되지 않는다 (각 호출은 타임아웃 안에 끝남)"""
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY_TEST_QUEUE_MODEL", "1")
+    monkeypatch.setattr(llm_module, "_semaphores", {})
+    monkeypatch.setattr(llm_module, "_limits", {})
+    monkeypatch.setattr(llm_module, "_in_use", {})
+    llm = FakeLLM(latency=0.05)
+
+    async def scenario():
+        calls = [llm_module.ainvoke_with_timeout(llm, i, timeout=0.08) for i in range(4)]
+        return await asyncio.gather(*calls)
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3]
+    assert llm.max_active == 1
+    assert llm_module.llm_pool_stats()["semaphores"]["test-queue-model"] == {
+        "limit": 1,
+        "in_use": 0,
+        "available": 1,
+    }
@@ -0,0 +1,108 @@
+import time
+import asyncio
+from langchain_core.messages import AIMessage
+from langchain_openai import ChatOpenAI
+from app.core import llm as llm_module
+from app.chatbot.tool_agents import controller, planner, precedent
+from app.chatbot.memory.semantic_cache import SemanticCache
+from app.chatbot.memory.session_store import InMemorySessionStore, set_session_store
+
+LLM_LATENCY = 0.05  # 스텁 GPT 호출 한 번의 지연 (초)
+TICK_INTERVAL = 0.01
+MAX_LOOP_LAG = 0.1  # 블로킹 호출(invoke 스텁은 0.3초)이 끼면 넘어서는 값
+
+CONSULTATION = {
+    "id": 1,
+    "category": "민사",
+    "sub_category": "임대차",
+    "title": "전세보증금 반환",
+    "question": "계약이 끝났는데 보증금을 돌려받지 못했습니다.",
+    "answer": "지급명령 또는 보증금 반환 소송을 고려할 수 있습니다.",
+}
+
+
+def _stub_response(messages) -> str:
+    system = messages[0]["content"] if isinstance(messages, list) and messages else ""
+    if "관련성" in system:
+        return "relevant"
+    if "정제" in system:
+        return "[1]"
+    return "{}"
+
+
+def _install_stubs(monkeypatch):
+    calls = {"ainvoke": 0}
+
+    async def fake_ainvoke(self, messages, *args, **kwargs):
+        calls["ainvoke"] += 1
+        await asyncio.sleep(LLM_LATENCY)
+        return AIMessage(content=_stub_response(messages))
+
+    def blocking_invoke(self, messages, *args, **kwargs):
+        # 빌드 경로가 동기 invoke 로 돌아가면 루프가 멈춰 테스트가 실패하도록
+        time.sleep(0.3)
+        return AIMessage(content=_stub_response(messages))
+
+    async def fake_search_consultation(keywords):
+        await asyncio.sleep(0.01)
+        return [CONSULTATION], [CONSULTATION["category"]], [CONSULTATION["title"]]
+
+    async def fake_tavily(user_query, max_results=3):
+        await asyncio.sleep(LLM_LATENCY)
+        return []
+
+    async def fake_es_search(queries):
+        await asyncio.sleep(0.01)
+        return []
+
+    async def fake_search_precedent(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return []
+
+    monkeypatch.setattr(ChatOpenAI, "ainvoke", fake_ainvoke)
+    monkeypatch.setattr(ChatOpenAI, "invoke", blocking_invoke)
+    monkeypatch.setattr(llm_module, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(controller, "async_search_consultation", fake_search_consultation)
+    monkeypatch.setattr(controller, "fetch_tavily_results", fake_tavily)
+    monkeypatch.setattr(planner, "async_ES_search", fake_es_search)
+    monkeypatch.setattr(precedent, "async_search_precedent", fake_search_precedent)
+    monkeypatch.setattr(controller, "consultation_cache", SemanticCache("test", enabled=False))
+    set_session_store(InMemorySessionStore())
+    # lifespan 과 동일하게 모델을 미리 생성 (첫 ChatOpenAI 생성은 openai 지연 import 로 루프를 막음)
+    monkeypatch.setattr(llm_module, "_models", {})
+    controller.warm_llm2_models()
+    return calls
+
+
+async def _max_loop_lag(stop: asyncio.Event) -> float:
+    loop = asyncio.get_running_loop()
+    max_lag = 0.0
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(TICK_INTERVAL)
+        max_lag = max(max_lag, loop.time() - started - TICK_INTERVAL)
+    return max_lag
+
+
+def test_llm2_build_keeps_event_loop_responsive(monkeypatch):
+    calls = _install_stubs(monkeypatch)
+
+    async def scenario():
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_max_loop_lag(stop))
+        try:
+            result = await controller.run_full_consultation(
+                "전세보증금을 돌려받지 못했어요",
+                search_keywords=["전세보증금", "반환"],
+                build_only=True,
+                session_id="loop-lag",
+            )
+        finally:
+            stop.set()
+        return result, await ticker
+
+    result, max_lag = asyncio.run(scenario())
+
+    assert result["status"] == "build_only"
+    assert calls["ainvoke"] >= 4  # qualifier 2회 + 템플릿 + 전략 (+ 평가)
+    assert max_lag < MAX_LOOP_LAG, f"event loop lag {max_lag:.3f}s"
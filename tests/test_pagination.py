@@ -0,0 +1,64 @@
+import base64
+import datetime
+import pytest
+from app.services.pagination import (
+    InvalidCursorError,
+    build_page,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(datetime.date(2024, 3, 1), 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 2) == ["2024-03-01", 42]
+    assert decode_cursor(encode_cursor("전세 보증금", 7), 2) == ["전세 보증금", 7]
+    assert decode_cursor(encode_cursor(None, 3), 2) == [None, 3]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "!!!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b'{"id": 1}').decode(),
+        encode_cursor(1, 2, 3),  # 값 개수가 다름
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 2)
+
+
+def test_keyset_condition_after_null_value():
+    """NULLS LAST: 마지막 행의 정렬 값이 NULL 이면 NULL 행 중 id 순서로만 이어감"""
+    params = {}
+    condition = keyset_condition("j_date", None, 10, params, descending=True)
+
+    assert condition == "(j_date IS NULL AND id < :after_id)"
+    assert params == {"after_id": 10}
+
+
+def test_keyset_condition_after_value_includes_null_rows():
+    params = {}
+    condition = keyset_condition("title", "가", 10, params)
+
+    assert condition == (
+        "(title > :after_value OR (title = :after_value AND id > :after_id)"
+        " OR title IS NULL)"
+    )
+    assert params == {"after_id": 10, "after_value": "가"}
+
+
+def test_build_page_next_cursor():
+    rows = [{"id": i, "title": f"t{i}"} for i in range(3)]
+
+    page = build_page(rows, 2, lambda row: encode_cursor(row["title"], row["id"]), 30)
+
+    assert page["items"] == rows[:2]
+    assert decode_cursor(page["next_cursor"], 2) == ["t1", 1]
+    assert page["approx_total"] == 30
+    assert build_page(rows[:2], 2, lambda row: "x", 2)["next_cursor"] is None
@@ -0,0 +1,30 @@
+import re
+from app.services.precedent_search import build_precedent_search_query
+
+
+def _candidates_cte(query: str) -> str:
+    return re.search(r"WITH candidates AS \((.*?)\n    \)", query, re.S).group(1)
+
+
+def test_candidates_are_ranked_before_truncation():
+    """후보 CTE 는 최신순이 아니라 c_name 관련도 순으로 정렬한 뒤 candidate_limit 으로 자른다"""
+    query, params = build_precedent_search_query(
+        ["보증금", "반환"], ["보증금", "반환", "임대차"], recent_years=10
+    )
+    cte = _candidates_cte(query)
+
+    order_by = cte.index("ORDER BY GREATEST(")
+    assert order_by < cte.index("LIMIT :candidate_limit")
+    for i in range(3):
+        assert f"similarity(c_name, :term{i})" in cte[order_by:]
+    assert "j_date DESC" not in cte
+    # 기간은 정렬이 아니라 WHERE 조건으로만 적용
+    assert "j_date >= CURRENT_DATE - make_interval(years => :recent_years)" in cte
+    assert params["recent_years"] == 10
+
+
+def test_final_order_is_stable():
+    query, _ = build_precedent_search_query(["보증금"], ["보증금"], recent_years=None)
+
+    assert "ORDER BY final_weighted_score DESC, c.id" in query
+    assert "recent_years" not in query
@@ -0,0 +1,33 @@
+import asyncio
+from app.core.cache import AsyncTTLCache
+from app.chatbot.tool_agents import tavily, tools
+
+PRECEDENT = {"d_link": "https://www.law.go.kr/DRF/lawService.do?target=prec&ID=123&type=HTML"}
+FOUND = {
+    "url": "https://law.go.kr/LSW/precInfoP.do?precSeq=123",
+    "content": "판례 요약",
+}
+
+
+def test_precedent_miss_is_not_cached(monkeypatch):
+    """Tavily 에서 요약을 못 찾은 결과는 캐시하지 않고 다음 요청에서 다시 검색"""
+    responses = [[], [FOUND], []]
+    calls = []
+
+    async def fake_search(query, max_results=5):
+        calls.append(query)
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(tavily, "TAVILY_CACHE_PATH", "")
+    monkeypatch.setattr(tavily, "tavily_memory_cache", AsyncTTLCache("test", ttl=60, maxsize=8))
+    monkeypatch.setattr(tools, "tavily_search", fake_search)
+
+    async def scenario():
+        return [await tools.search_tavily_for_precedents(dict(PRECEDENT)) for _ in range(3)]
+
+    missed, found, cached = asyncio.run(scenario())
+
+    assert missed == ("❌ Tavily 요약 정보를 찾을 수 없습니다.", "https://law.go.kr/LSW/precInfoP.do?precSeq=123")
+    assert found == ("판례 요약", FOUND["url"])
+    assert cached == found  # 찾은 결과는 캐시에서 반환
+    assert len(calls) == 2